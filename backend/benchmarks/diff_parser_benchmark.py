@@ -0,0 +1,111 @@
+"""
+Compare the streaming diff parser with the previous line-list implementation.
+
+Run from `backend/` with the usual `.env` in place:
+
+    PYTHONPATH=src python benchmarks/diff_parser_benchmark.py --files 2000 --lines 1000
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import gc
+import random
+import string
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from service.api_service.diff_parser import (
+    _extract_path_from_diff_header,
+    _normalize_path_fragment,
+    decode_diff_bytes,
+    parse_diff,
+)
+
+
+def legacy_parse_diff(diff_text: str) -> tuple[list[tuple[str, int, int, str]], int, int]:
+    """Line-list parser used before the streaming rewrite, kept as the baseline."""
+    files: list[tuple[str, int, int, str]] = []
+    current: dict | None = None
+
+    def flush() -> None:
+        if current is None or not current["lines"]:
+            return
+        path = current["path"] or _extract_path_from_diff_header(current["lines"][0]) or "unknown"
+        files.append((path, current["added"], current["deleted"], "\n".join(current["lines"]).strip()))
+
+    for line in diff_text.splitlines():
+        if line.startswith("diff --git "):
+            flush()
+            current = {"path": _extract_path_from_diff_header(line) or "", "added": 0, "deleted": 0, "lines": [line]}
+            continue
+        if current is None:
+            continue
+        current["lines"].append(line)
+        if line.startswith("+++ "):
+            new_path = _normalize_path_fragment(line[4:].strip())
+            if new_path:
+                current["path"] = new_path
+        if line.startswith("+") and not line.startswith("+++"):
+            current["added"] += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            current["deleted"] += 1
+    flush()
+
+    return files, sum(f[1] for f in files), sum(f[2] for f in files)
+
+
+def synthetic_diff(files: int, lines: int, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "    (){}[];=."
+    chunks: list[str] = []
+    for index in range(files):
+        path = f"vendor/pkg{index // 100}/module_{index}.py"
+        chunks.append(f"diff --git a/{path} b/{path}\n")
+        chunks.append("index 3b18e51..a9c3f02 100644\n")
+        chunks.append(f"--- a/{path}\n+++ b/{path}\n")
+        chunks.append(f"@@ -1,{lines} +1,{lines} @@\n")
+        for _ in range(lines):
+            prefix = rng.choice("+- ")
+            chunks.append(prefix + "".join(rng.choices(alphabet, k=60)) + "\n")
+    return "".join(chunks)
+
+
+def measure(label: str, run: Callable[[], tuple[int, int]]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    added, deleted = run()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed:8.2f}s  peak {peak / 2**20:9.1f} MiB  +{added} -{deleted}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000, help="files per synthetic commit")
+    parser.add_argument("--lines", type=int, default=1000, help="changed lines per file")
+    args = parser.parse_args()
+
+    payload = base64.b64encode(synthetic_diff(args.files, args.lines).encode()).decode()
+    print(f"base64 payload: {len(payload) / 2**20:.1f} MiB")
+
+    def legacy() -> tuple[int, int]:
+        _, added, deleted = legacy_parse_diff(decode_diff_bytes(payload).decode("utf-8", errors="replace"))
+        return added, deleted
+
+    def streaming() -> tuple[int, int]:
+        added = deleted = 0
+        for payload_file in parse_diff(decode_diff_bytes(payload))[0]:
+            added += payload_file.added_lines
+            deleted += payload_file.deleted_lines
+        return added, deleted
+
+    measure("legacy", legacy)
+    measure("streaming", streaming)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compare validating a commit page from a decoded dict with validating its raw bytes.
+
+The baseline is what the sync did before: `response.json()` followed by
+`APIListResponse[CommitModel].model_validate`. The current path feeds the
+response bytes to the module-level `TypeAdapter` used by the sync service.
+
+Run from `backend/` with the usual `.env` in place:
+
+    PYTHONPATH=src python benchmarks/json_page_validation.py --commits 500 --rounds 200
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import string
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from domain.parsing.schemas import APIListResponse, CommitModel
+from service.api_service.sync import _COMMIT_PAGE
+
+
+def synthetic_page(commits: int, seed: int = 42) -> bytes:
+    rng = random.Random(seed)
+    started = datetime(2024, 1, 1, tzinfo=UTC)
+    data = []
+    for index in range(commits):
+        name = "".join(rng.choices(string.ascii_lowercase, k=8))
+        user = {"name": name.title(), "email": f"{name}@example.com"}
+        data.append({
+            "hash": "".join(rng.choices("0123456789abcdef", k=40)),
+            "author": user,
+            "committer": user,
+            "created_at": (started + timedelta(minutes=index)).isoformat(),
+            "message": " ".join(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+                for _ in range(rng.randint(3, 30))
+            ),
+            "issues": {},
+            "parents": ["".join(rng.choices("0123456789abcdef", k=40))],
+            "branch_names": ["main"],
+            "tag_names": [],
+            "Tags": [],
+        })
+    page = {"data": data, "status": "ok", "request_id": "bench", "page": {"next_cursor": "next"}}
+    return json.dumps(page).encode()
+
+
+def measure(label: str, rounds: int, run: Callable[[], int]) -> None:
+    # Warm-up also builds anything lazily created on first use
+    run()
+    gc.collect()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        run()
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    commits = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} {elapsed / rounds * 1000:8.2f} ms/page  peak {peak / 2**20:7.2f} MiB  {commits} commits")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commits", type=int, default=500, help="commits per page")
+    parser.add_argument("--rounds", type=int, default=200, help="pages validated per measurement")
+    args = parser.parse_args()
+
+    content = synthetic_page(args.commits)
+    print(f"page: {len(content) / 2**10:.0f} KiB")
+
+    def dict_then_model() -> int:
+        payload = json.loads(content)
+        return len(APIListResponse[CommitModel].model_validate(payload).data)
+
+    def raw_bytes() -> int:
+        return len(_COMMIT_PAGE.validate_json(content).data)
+
+    measure("dict+model", args.rounds, dict_then_model)
+    measure("validate_json", args.rounds, raw_bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Simulate replicas competing for repository sync leases on a real Redis.
+
+Each simulated replica claims due repositories from the shared queue, holds
+the lease for a fake sync while renewing it, and re-queues the repository.
+Any repository held by two replicas at once is reported as a duplicate.
+
+Run from `backend/` against a local Redis (the keys used are deleted first):
+
+    PYTHONPATH=src python benchmarks/sync_lease_contention.py --redis redis://localhost:6379/15
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+
+from database.redis.sync_leases import SyncLeaseRepo
+
+
+async def replica(
+    leases: SyncLeaseRepo,
+    slots: int,
+    ttl_ms: int,
+    deadline: float,
+    holders: Counter[UUID],
+    duplicates: list[UUID],
+    runs: Counter[str],
+) -> None:
+    running: set[asyncio.Task[None]] = set()
+
+    async def sync(repo_id: UUID) -> None:
+        holders[repo_id] += 1
+        if holders[repo_id] > 1:
+            duplicates.append(repo_id)
+        try:
+            await asyncio.sleep(random.uniform(0.01, 0.05))
+            await leases.renew(str(repo_id), ttl_ms)
+            await asyncio.sleep(random.uniform(0.01, 0.05))
+            runs[leases.owner] += 1
+        finally:
+            holders[repo_id] -= 1
+            await leases.release(str(repo_id))
+            await leases.enqueue([(repo_id, datetime.now(UTC) + timedelta(milliseconds=20))])
+
+    while time.monotonic() < deadline:
+        for repo_id in await leases.claim(datetime.now(UTC), slots - len(running), ttl_ms):
+            task = asyncio.create_task(sync(repo_id))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        await asyncio.sleep(0.005)
+    await asyncio.gather(*running)
+
+
+async def run(args: argparse.Namespace) -> None:
+    redis = Redis.from_url(args.redis, decode_responses=True)
+    try:
+        await redis.delete(SyncLeaseRepo.QUEUE_KEY)
+        replicas = [SyncLeaseRepo(redis, f"replica-{index}") for index in range(args.replicas)]
+        now = datetime.now(UTC)
+        await replicas[0].enqueue((uuid4(), now) for _ in range(args.repos))
+
+        holders: Counter[UUID] = Counter()
+        duplicates: list[UUID] = []
+        runs: Counter[str] = Counter()
+        deadline = time.monotonic() + args.seconds
+        await asyncio.gather(*(
+            replica(leases, args.slots, args.ttl_ms, deadline, holders, duplicates, runs)
+            for leases in replicas
+        ))
+
+        total = sum(runs.values())
+        print(f"{total} syncs in {args.seconds:.0f}s ({total / args.seconds:.0f}/s), duplicates: {len(duplicates)}")
+        for owner, count in sorted(runs.items()):
+            print(f"  {owner:<12} {count}")
+    finally:
+        await redis.delete(SyncLeaseRepo.QUEUE_KEY)
+        await redis.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis", default="redis://localhost:6379/15", help="Redis URL, a scratch database")
+    parser.add_argument("--replicas", type=int, default=4)
+    parser.add_argument("--slots", type=int, default=4, help="concurrent syncs per replica")
+    parser.add_argument("--repos", type=int, default=50)
+    parser.add_argument("--ttl-ms", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
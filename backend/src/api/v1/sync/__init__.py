@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+
+def get_sync_router() -> APIRouter:
+    from .reports import router as reports_router
+    from .schedule import router as schedule_router
+
+    router = APIRouter(prefix="/sync", tags=["Sync"])
+
+    router.include_router(schedule_router)
+    router.include_router(reports_router)
+
+    return router
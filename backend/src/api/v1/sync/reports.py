@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Path
+
+from core.security import require_permissions
+from database.relational_db import User
+from domain.auth.enums import SystemPermission
+from domain.sync import RepositorySyncReport, SyncRunReport
+from service.sync_status import SyncStatusService, get_sync_status_service
+
+router = APIRouter(prefix="/reports")
+
+
+@router.get(
+    "/latest",
+    response_model=SyncRunReport,
+    summary="Report of the latest sync run",
+)
+async def get_latest_sync_report(
+    _: Annotated[User, Depends(require_permissions(SystemPermission.SYNC_READ))],
+    svc: Annotated[SyncStatusService, Depends(get_sync_status_service)],
+) -> SyncRunReport:
+    report = await svc.latest_run_report()
+    if report is None:
+        raise HTTPException(status_code=404, detail="No sync run reported yet")
+    return report
+
+
+@router.get(
+    "/repositories/{repo_id}",
+    response_model=RepositorySyncReport,
+    summary="Report of the latest sync of a repository",
+)
+async def get_repository_sync_report(
+    repo_id: Annotated[UUID, Path(...)],
+    _: Annotated[User, Depends(require_permissions(SystemPermission.SYNC_READ))],
+    svc: Annotated[SyncStatusService, Depends(get_sync_status_service)],
+) -> RepositorySyncReport:
+    report = await svc.repository_report(repo_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Repository has no sync report yet")
+    return report
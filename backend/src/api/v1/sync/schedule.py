@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from core.security import require_permissions
+from database.relational_db import User
+from domain.auth.enums import SystemPermission
+from domain.sync import RepositorySyncSchedule
+from service.sync_status import SyncStatusService, get_sync_status_service
+
+router = APIRouter()
+
+
+@router.get(
+    "/schedule",
+    response_model=list[RepositorySyncSchedule],
+    summary="Next incremental sync run of each repository",
+)
+async def get_sync_schedule(
+    _: Annotated[User, Depends(require_permissions(SystemPermission.SYNC_READ))],
+    svc: Annotated[SyncStatusService, Depends(get_sync_status_service)],
+    due_before: datetime | None = Query(None, description="Only repositories due before this moment"),
+    limit: int = Query(100, ge=1, le=1000),
+) -> list[RepositorySyncSchedule]:
+    return await svc.list_schedule(due_before=due_before, limit=limit)
@@ -28,6 +28,49 @@ class Settings(BaseSettings):
     API_URL: str
     API_USERNAME: str
     API_PASSWORD: SecretStr
+    API_POOL_MAX_CONNECTIONS: int = 20
+    API_POOL_MAX_KEEPALIVE: int = 10
+    API_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    API_HTTP2: bool = False
+    API_TOKEN_REFRESH_MARGIN: int = 60
+    API_RETRY_MAX_ATTEMPTS: int = 5
+    API_RETRY_BASE_DELAY: float = 0.5
+    API_RETRY_MAX_DELAY: float = 30.0
+    API_RATE_LIMIT: float = 20.0
+    API_RATE_LIMIT_MIN: float = 1.0
+    API_RATE_LIMIT_MAX: float = 100.0
+    API_VALIDATOR_CACHE_SIZE: int = 10000
+
+    # Sync settings
+    SYNC_DIFF_CONCURRENCY: int = 8
+    SYNC_PIPELINE_DEPTH: int = 2
+    SYNC_CHECKPOINT_PAGES: int = 10
+    SYNC_AGGREGATE_FLUSH_KEYS: int = 5000
+    SYNC_REPO_CONCURRENCY: int = 4
+    SYNC_PROJECT_REPO_CONCURRENCY: int = 2
+
+    # Incremental sync scheduling
+    SYNC_DISPATCH_INTERVAL_SECONDS: int = 30
+    SYNC_MIN_INTERVAL_SECONDS: int = 300
+    SYNC_MAX_INTERVAL_SECONDS: int = 86400
+    SYNC_ACTIVITY_WINDOW_DAYS: int = 14
+    SYNC_INTERVAL_JITTER: float = 0.1
+    SYNC_DISCOVERY_INTERVAL_HOURS: int = 24
+    SYNC_PUSH_DEBOUNCE_SECONDS: int = 15
+    SYNC_LEASE_TTL_SECONDS: int = 60
+    SYNC_QUEUE_FEED_BATCH: int = 500
+
+    # Aggregated metrics reads: "fused" serves the dashboard from its combined
+    # query, "parallel" runs independent reads on separate read-only sessions
+    METRICS_QUERY_MODE: Literal["fused", "parallel", "sequential"] = "fused"
+    METRICS_READ_CONCURRENCY: int = 4
+
+    # Webhook settings; push events are rejected while no secret is configured
+    WEBHOOK_SECRET: str | None = None
+
+    # Patch storage settings
+    PATCH_CODEC: Literal["zlib", "zstd", "none"] = "zlib"
+    PATCH_COMPRESSION_LEVEL: int = 6
     
     # Media settings
     MEDIA_DIR: str = 'media'
@@ -1,2 +1,4 @@
 from .redis_client import get_redis
 from .cache_interface import CacheRepo
+from .sync_leases import SyncLeaseRepo
+from .sync_reports import SyncReportRepo
@@ -0,0 +1,117 @@
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+
+# KEYS[1] queue; ARGV: now_ms, limit, ttl_ms, owner, lease_prefix, scan
+_CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[6]))
+local limit = tonumber(ARGV[2])
+local claimed = {}
+for _, member in ipairs(due) do
+    if #claimed >= limit then
+        break
+    end
+    if redis.call('SET', ARGV[5] .. member, ARGV[4], 'NX', 'PX', ARGV[3]) then
+        redis.call('ZREM', KEYS[1], member)
+        table.insert(claimed, member)
+    end
+end
+return claimed
+"""
+
+# KEYS[1] queue; ARGV: lease_prefix, then due_ms/member pairs
+_ENQUEUE_SCRIPT = """
+local added = 0
+for i = 2, #ARGV, 2 do
+    local member = ARGV[i + 1]
+    if redis.call('EXISTS', ARGV[1] .. member) == 0 then
+        added = added + redis.call('ZADD', KEYS[1], 'LT', 'CH', ARGV[i], member)
+    end
+end
+return added
+"""
+
+# KEYS[1] lease; ARGV: owner, ttl_ms
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1] lease; ARGV: owner
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SyncLeaseRepo():
+    """
+    Sync leases and the queue of due repositories shared by every replica.
+
+    Due repositories sit in a sorted set scored by due time. `claim` takes a
+    TTL lease on each due entry and removes it from the queue in one script,
+    so two replicas never claim the same repository; entries whose lease is
+    still held stay queued. The holder keeps a lease alive with `renew` and
+    drops it with `release`; if the holder dies the lease expires and the
+    repository goes to whichever replica queues and claims it next.
+
+    Lease keys are derived inside the scripts, so this needs a single Redis
+    node rather than a cluster.
+    """
+
+    QUEUE_KEY = "sync:queue"
+    LEASE_PREFIX = "sync:lease:"
+    # Queue entries inspected per claim, so leased ones cannot starve the rest
+    CLAIM_SCAN = 100
+
+    def __init__(self, redis: Redis, owner: str):
+        self.redis = redis
+        self.owner = owner
+        self._claim = redis.register_script(_CLAIM_SCRIPT)
+        self._enqueue = redis.register_script(_ENQUEUE_SCRIPT)
+        self._renew = redis.register_script(_RENEW_SCRIPT)
+        self._release = redis.register_script(_RELEASE_SCRIPT)
+
+    async def enqueue(self, due: Iterable[tuple[UUID, datetime]]) -> int:
+        """Queue repositories by due time; an earlier due time wins, leased ones are skipped."""
+        args: list[str | int] = [self.LEASE_PREFIX]
+        for repo_id, due_at in due:
+            args.extend((int(due_at.timestamp() * 1000), str(repo_id)))
+        if len(args) == 1:
+            return 0
+        return int(await self._enqueue(keys=[self.QUEUE_KEY], args=args))
+
+    async def claim(self, now: datetime, limit: int, ttl_ms: int) -> list[UUID]:
+        if limit <= 0:
+            return []
+        claimed = await self._claim(
+            keys=[self.QUEUE_KEY],
+            args=[
+                int(now.timestamp() * 1000),
+                limit,
+                ttl_ms,
+                self.owner,
+                self.LEASE_PREFIX,
+                max(self.CLAIM_SCAN, limit),
+            ],
+        )
+        return [UUID(member) for member in claimed]
+
+    async def acquire(self, name: str, ttl_ms: int) -> bool:
+        return bool(await self.redis.set(self.LEASE_PREFIX + name, self.owner, nx=True, px=ttl_ms))
+
+    async def renew(self, name: str, ttl_ms: int) -> bool:
+        return bool(await self._renew(keys=[self.LEASE_PREFIX + name], args=[self.owner, ttl_ms]))
+
+    async def release(self, name: str) -> bool:
+        return bool(await self._release(keys=[self.LEASE_PREFIX + name], args=[self.owner]))
+
+    async def queued(self) -> int:
+        return int(await self.redis.zcard(self.QUEUE_KEY))
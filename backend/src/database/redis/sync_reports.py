@@ -0,0 +1,30 @@
+from collections.abc import Mapping
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+
+class SyncReportRepo():
+    """Latest sync run report and the latest report of each repository, as JSON."""
+
+    LATEST_RUN_KEY = "sync:report:latest"
+    REPOSITORIES_KEY = "sync:report:repositories"
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    async def save(self, run: str, repositories: Mapping[UUID, str]) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self.LATEST_RUN_KEY, run)
+            if repositories:
+                pipe.hset(
+                    self.REPOSITORIES_KEY,
+                    mapping={str(repo_id): report for repo_id, report in repositories.items()},
+                )
+            await pipe.execute()
+
+    async def latest_run(self) -> str | None:
+        return await self.redis.get(self.LATEST_RUN_KEY)
+
+    async def repository(self, repo_id: UUID) -> str | None:
+        return await self.redis.hget(self.REPOSITORIES_KEY, str(repo_id))
@@ -4,9 +4,11 @@ from .languages import *
 from .roles import *
 from .authors import *
 from .branches import *
+from .patch_blobs import *
 from .commitfiles import *
 from .commits import *
 from .projects import *
 from .repositories import *
 from .aggr_commits import *
 from .aggr_files import *
+from .sync_state import *
@@ -1,19 +1,35 @@
 from .daily_commits import AggAuthorRepoDay, AggHourRepoDay
 from .commit_size import AggSizeBucketRepoDay, SizeBucket
+from .project_daily import (
+    AggAuthorProjectDay,
+    AggFileProjectDay,
+    AggHourProjectDay,
+    AggSizeBucketProjectDay,
+)
+from .rollups import (
+    AggAuthorRepoPeriod,
+    AggFileRepoPeriod,
+    AggHourRepoPeriod,
+    AggSizeBucketRepoPeriod,
+    RollupGrain,
+)
 from .interfaces import (
     AggregateMetricsInterface,
     AggregationFilter,
     AuthorRepoDayDelta,
     DailyCommitsPoint,
+    DashboardAggregates,
     FileRepoDayDelta,
     HourHeatmapPoint,
     HourRepoDayDelta,
     HotFileRow,
     KPIResult,
     MessageQualityStats,
+    RangePlan,
     SizeBucketDelta,
     SizeHistogramBin,
     SizeHistogramStats,
     TopAuthorRow,
     WeekdayHeatmapPoint,
 )
+from .accumulator import AggregateAccumulator
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from datetime import date
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+from uuid import UUID
+
+from .commit_size import SizeBucket
+from .interfaces import (
+    AggregateMetricsInterface,
+    AuthorRepoDayDelta,
+    FileRepoDayDelta,
+    HourRepoDayDelta,
+    SizeBucketDelta,
+)
+
+
+T = TypeVar("T")
+
+
+def _chunks(rows: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class AggregateAccumulator:
+    """
+    Merges aggregate deltas into keyed counters as commits are ingested.
+
+    Each key (day, project, repo, dimension) maps to a small list of ints, so
+    memory is bounded by the number of distinct keys since the last flush rather
+    than by the number of commits or touched files. `flush` writes everything in
+    key order and resets the counters.
+    """
+
+    # Rows per upsert statement, keeps every statement well under the
+    # 32767 bind parameter limit of PostgreSQL
+    FLUSH_CHUNK_SIZE = 1000
+
+    def __init__(self, max_keys: int = 5000) -> None:
+        self._max_keys = max(max_keys, 1)
+        # [commits, lines_added, lines_deleted, files_changed, msg_total_len, msg_short_count]
+        self._authors: dict[tuple[date, int, UUID, UUID], list[int]] = {}
+        # [commits, lines_added, lines_deleted]
+        self._hours: dict[tuple[date, int, UUID, int], list[int]] = {}
+        # [cnt]
+        self._sizes: dict[tuple[date, int, UUID, SizeBucket], list[int]] = {}
+        # [commits_touch, lines_added, lines_deleted]
+        self._files: dict[tuple[date, int, UUID, str], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._authors) + len(self._hours) + len(self._sizes) + len(self._files)
+
+    @property
+    def should_flush(self) -> bool:
+        return len(self) >= self._max_keys
+
+    def add_author(
+        self,
+        day: date,
+        project_id: int,
+        repo_id: UUID,
+        author_id: UUID,
+        *,
+        lines_added: int,
+        lines_deleted: int,
+        files_changed: int,
+        msg_total_len: int,
+        msg_short_count: int,
+    ) -> None:
+        counters = self._authors.get((day, project_id, repo_id, author_id))
+        if counters is None:
+            self._authors[(day, project_id, repo_id, author_id)] = [
+                1, lines_added, lines_deleted, files_changed, msg_total_len, msg_short_count,
+            ]
+            return
+        counters[0] += 1
+        counters[1] += lines_added
+        counters[2] += lines_deleted
+        counters[3] += files_changed
+        counters[4] += msg_total_len
+        counters[5] += msg_short_count
+
+    def add_hour(
+        self,
+        day: date,
+        project_id: int,
+        repo_id: UUID,
+        hour: int,
+        *,
+        lines_added: int,
+        lines_deleted: int,
+    ) -> None:
+        counters = self._hours.get((day, project_id, repo_id, hour))
+        if counters is None:
+            self._hours[(day, project_id, repo_id, hour)] = [1, lines_added, lines_deleted]
+            return
+        counters[0] += 1
+        counters[1] += lines_added
+        counters[2] += lines_deleted
+
+    def add_size(self, day: date, project_id: int, repo_id: UUID, bucket: SizeBucket) -> None:
+        counters = self._sizes.get((day, project_id, repo_id, bucket))
+        if counters is None:
+            self._sizes[(day, project_id, repo_id, bucket)] = [1]
+            return
+        counters[0] += 1
+
+    def add_file(
+        self,
+        day: date,
+        project_id: int,
+        repo_id: UUID,
+        path: str,
+        *,
+        lines_added: int,
+        lines_deleted: int,
+    ) -> None:
+        counters = self._files.get((day, project_id, repo_id, path))
+        if counters is None:
+            self._files[(day, project_id, repo_id, path)] = [1, lines_added, lines_deleted]
+            return
+        counters[0] += 1
+        counters[1] += lines_added
+        counters[2] += lines_deleted
+
+    async def flush(self, aggregates: AggregateMetricsInterface) -> None:
+        authors = (
+            AuthorRepoDayDelta(day, project_id, repo_id, author_id, *counters)
+            for (day, project_id, repo_id, author_id), counters in sorted(self._authors.items(), key=_row_key)
+        )
+        for chunk in _chunks(authors, self.FLUSH_CHUNK_SIZE):
+            await aggregates.upsert_author_repo_day(chunk)
+
+        hours = (
+            HourRepoDayDelta(day, project_id, repo_id, hour, *counters)
+            for (day, project_id, repo_id, hour), counters in sorted(self._hours.items(), key=_row_key)
+        )
+        for chunk in _chunks(hours, self.FLUSH_CHUNK_SIZE):
+            await aggregates.upsert_hour_repo_day(chunk)
+
+        sizes = (
+            SizeBucketDelta(day, project_id, repo_id, bucket, counters[0])
+            for (day, project_id, repo_id, bucket), counters in sorted(self._sizes.items(), key=_row_key)
+        )
+        for chunk in _chunks(sizes, self.FLUSH_CHUNK_SIZE):
+            await aggregates.upsert_size_buckets(chunk)
+
+        files = (
+            FileRepoDayDelta(
+                day, project_id, repo_id, path,
+                commits_touch=touched,
+                lines_added=added,
+                lines_deleted=deleted,
+                churn=added + deleted,
+            )
+            for (day, project_id, repo_id, path), (touched, added, deleted) in sorted(
+                self._files.items(), key=_row_key
+            )
+        )
+        for chunk in _chunks(files, self.FLUSH_CHUNK_SIZE):
+            await aggregates.upsert_hot_files(chunk)
+
+        self.clear()
+
+    def clear(self) -> None:
+        self._authors.clear()
+        self._hours.clear()
+        self._sizes.clear()
+        self._files.clear()
+
+
+def _row_key(item: tuple[tuple, list[int]]) -> tuple:
+    # Same (day, repo, dimension) order for every writer, so concurrent flushes
+    # take row locks in one sequence instead of deadlocking
+    day, _, repo_id, dimension = item[0]
+    return day, str(repo_id), str(dimension)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 from typing import Any, Iterable, Sequence
 from uuid import UUID
 
@@ -14,6 +14,19 @@ from ..authors.authors_table import Author
 from ..aggr_files.hot_files_daily import AggFileRepoDay
 from .commit_size import AggSizeBucketRepoDay, SizeBucket
 from .daily_commits import AggAuthorRepoDay, AggHourRepoDay
+from .project_daily import (
+    AggAuthorProjectDay,
+    AggFileProjectDay,
+    AggHourProjectDay,
+    AggSizeBucketProjectDay,
+)
+from .rollups import (
+    AggAuthorRepoPeriod,
+    AggFileRepoPeriod,
+    AggHourRepoPeriod,
+    AggSizeBucketRepoPeriod,
+    RollupGrain,
+)
 
 
 @dataclass(slots=True)
@@ -90,6 +103,32 @@ class HotFileRow:
     churn: int
 
 
+@dataclass(slots=True)
+class RangePlan:
+    """
+    Inclusive day ranges covering `since..until`, split by the table that serves them.
+
+    Whole months come from the month rollups, whole weeks left at the edges
+    from the week rollups and the remaining days from the daily tables.
+    """
+
+    days: list[tuple[date, date]] = field(default_factory=list)
+    weeks: list[tuple[date, date]] = field(default_factory=list)
+    months: list[tuple[date, date]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DashboardAggregates:
+    kpi: KPIResult
+    message_quality: MessageQualityStats
+    size_stats: SizeHistogramStats
+    daily: list[DailyCommitsPoint]
+    hourly: list[HourHeatmapPoint]
+    weekday: list[WeekdayHeatmapPoint]
+    top_authors: list[TopAuthorRow]
+    hot_files: list[HotFileRow]
+
+
 @dataclass(slots=True)
 class AuthorRepoDayDelta:
     day: date
@@ -144,8 +183,26 @@ class AggregateMetricsInterface:
         SizeBucket.HUNDRED_PLUS: 125.0,
     }
 
+    # GROUPING(author_id) of the dashboard author query; the daily series is appended as 2
+    _GROUPED_TOTAL = 1
+    _GROUPED_BY_AUTHOR = 0
+    _GROUPED_BY_DAY = 2
+
+    # Per-repository daily tables and their project-wide sums, read instead
+    # when the filter is narrowed to a project and nothing else
+    _PROJECT_TABLES: dict[Any, Any] = {
+        AggAuthorRepoDay: AggAuthorProjectDay,
+        AggHourRepoDay: AggHourProjectDay,
+        AggSizeBucketRepoDay: AggSizeBucketProjectDay,
+        AggFileRepoDay: AggFileProjectDay,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
+        # Project-day deltas merged until `flush_project_days`, keyed by table
+        # and then by (project_id, day, *keys)
+        self._project_days: dict[Any, dict[tuple, dict[str, Any]]] = {}
+        self._project_day_columns: dict[Any, tuple[Sequence[str], Sequence[str]]] = {}
 
     async def upsert_author_repo_day(self, rows: Iterable[AuthorRepoDayDelta]) -> None:
         merged_rows = self._merge_author_rows(rows)
@@ -181,6 +238,18 @@ class AggregateMetricsInterface:
             },
         )
         await self.session.execute(stmt)
+        await self._upsert_rollups(
+            AggAuthorRepoPeriod,
+            payload,
+            keys=("repo_id", "author_id"),
+            sums=("commits", "lines_added", "lines_deleted", "files_changed", "msg_total_len", "msg_short_count"),
+        )
+        self._stage_project_days(
+            AggAuthorProjectDay,
+            payload,
+            keys=("author_id",),
+            sums=("commits", "lines_added", "lines_deleted", "files_changed", "msg_total_len", "msg_short_count"),
+        )
 
     async def upsert_hour_repo_day(self, rows: Iterable[HourRepoDayDelta]) -> None:
         merged_rows = self._merge_hour_rows(rows)
@@ -210,6 +279,18 @@ class AggregateMetricsInterface:
             },
         )
         await self.session.execute(stmt)
+        await self._upsert_rollups(
+            AggHourRepoPeriod,
+            payload,
+            keys=("repo_id", "hour"),
+            sums=("commits", "lines_added", "lines_deleted"),
+        )
+        self._stage_project_days(
+            AggHourProjectDay,
+            payload,
+            keys=("hour",),
+            sums=("commits", "lines_added", "lines_deleted"),
+        )
 
     async def upsert_size_buckets(self, rows: Iterable[SizeBucketDelta]) -> None:
         merged_rows = self._merge_size_rows(rows)
@@ -235,6 +316,18 @@ class AggregateMetricsInterface:
             },
         )
         await self.session.execute(stmt)
+        await self._upsert_rollups(
+            AggSizeBucketRepoPeriod,
+            payload,
+            keys=("repo_id", "bucket"),
+            sums=("cnt",),
+        )
+        self._stage_project_days(
+            AggSizeBucketProjectDay,
+            payload,
+            keys=("bucket",),
+            sums=("cnt",),
+        )
 
     async def upsert_hot_files(self, rows: Iterable[FileRepoDayDelta]) -> None:
         merged_rows = self._merge_file_rows(rows)
@@ -266,6 +359,107 @@ class AggregateMetricsInterface:
             },
         )
         await self.session.execute(stmt)
+        await self._upsert_rollups(
+            AggFileRepoPeriod,
+            payload,
+            keys=("repo_id", "path"),
+            sums=("commits_touch", "lines_added", "lines_deleted", "churn"),
+        )
+        self._stage_project_days(
+            AggFileProjectDay,
+            payload,
+            keys=("path",),
+            sums=("commits_touch", "lines_added", "lines_deleted", "churn"),
+        )
+
+    async def _upsert_rollups(
+        self,
+        model: Any,
+        payload: list[dict[str, Any]],
+        *,
+        keys: Sequence[str],
+        sums: Sequence[str],
+    ) -> None:
+        """Add daily deltas to the week and month rows holding their days."""
+        merged: dict[tuple, dict[str, Any]] = {}
+        for row in payload:
+            for grain in RollupGrain:
+                period_start = grain.period_start(row["day"])
+                key = (grain, period_start, *(row[name] for name in keys))
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = {
+                        "grain": grain,
+                        "period_start": period_start,
+                        "project_id": row["project_id"],
+                        **{name: row[name] for name in keys},
+                        **{name: row[name] for name in sums},
+                    }
+                else:
+                    for name in sums:
+                        existing[name] += row[name]
+
+        # Sorted like the daily rows, so concurrent flushes lock rollup rows in one order
+        rows = [merged[key] for key in sorted(merged, key=lambda key: tuple(map(str, key)))]
+        stmt = insert(model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.grain, model.period_start, *(getattr(model, name) for name in keys)],
+            set_={name: getattr(model, name) + stmt.excluded[name] for name in sums},
+        )
+        await self.session.execute(stmt)
+
+    def _stage_project_days(
+        self,
+        model: Any,
+        payload: list[dict[str, Any]],
+        *,
+        keys: Sequence[str],
+        sums: Sequence[str],
+    ) -> None:
+        """Merge daily deltas into the pending project-wide rows, summing the repositories of a project."""
+        merged = self._project_days.setdefault(model, {})
+        self._project_day_columns[model] = (keys, sums)
+        for row in payload:
+            key = (row["project_id"], row["day"], *(row[name] for name in keys))
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = {
+                    "project_id": row["project_id"],
+                    "day": row["day"],
+                    **{name: row[name] for name in keys},
+                    **{name: row[name] for name in sums},
+                }
+            else:
+                for name in sums:
+                    existing[name] += row[name]
+
+    async def flush_project_days(self, chunk_size: int = 1000) -> None:
+        """
+        Write the pending project-day deltas; call right before the commit.
+
+        Every repository of a project adds to the same project rows. Written
+        once per transaction, table by table in key order, concurrent syncs
+        lock them in one sequence and hold the locks only until the commit
+        that follows, so they cannot deadlock on each other.
+        """
+        for model in self._PROJECT_TABLES.values():
+            merged = self._project_days.pop(model, None)
+            if not merged:
+                continue
+            keys, sums = self._project_day_columns[model]
+            rows = [merged[key] for key in sorted(merged, key=lambda key: tuple(map(str, key)))]
+            # Chunked like the daily rows to stay under the bind parameter limit
+            for start in range(0, len(rows), chunk_size):
+                stmt = insert(model).values(rows[start:start + chunk_size])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[model.project_id, model.day, *(getattr(model, name) for name in keys)],
+                    set_={name: getattr(model, name) + stmt.excluded[name] for name in sums},
+                )
+                await self.session.execute(stmt)
+
+    def discard_project_days(self) -> None:
+        """Drop the pending project-day deltas of a rolled back transaction."""
+        self._project_days.clear()
 
     @staticmethod
     def _merge_author_rows(rows: Iterable[AuthorRepoDayDelta]) -> list[AuthorRepoDayDelta]:
@@ -360,16 +554,26 @@ class AggregateMetricsInterface:
         return list(merged.values())
 
 
+    async def count_repo_commits_since(self, repo_id: UUID, since: date) -> int:
+        """Commits of one repository over the days from `since` on, read from the hourly rollup."""
+        stmt = sa.select(sa.func.coalesce(sa.func.sum(AggHourRepoDay.commits), 0)).where(
+            AggHourRepoDay.day >= since,
+            AggHourRepoDay.repo_id == repo_id,
+        )
+        return int(await self.session.scalar(stmt) or 0)
+
     async def get_kpis(self, filters: AggregationFilter) -> KPIResult:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return KPIResult(commits=0, active_devs=0, active_repos=0)
 
+        rows = self._ranged_rows(
+            AggAuthorRepoDay, AggAuthorRepoPeriod, ("author_id", *self._repo_column(filters), "commits"), filters,
+        )
         stmt = sa.select(
-            sa.func.coalesce(sa.func.sum(AggAuthorRepoDay.commits), 0),
-            sa.func.count(sa.distinct(AggAuthorRepoDay.author_id)),
-            sa.func.count(sa.distinct(AggAuthorRepoDay.repo_id)),
+            sa.func.coalesce(sa.func.sum(rows.c.commits), 0),
+            sa.func.count(sa.distinct(rows.c.author_id)),
+            self._active_repos(rows, filters),
         )
-        stmt = self._apply_author_filters(stmt, filters)
         result = await self.session.execute(stmt)
         commits, active_devs, active_repos = result.one()
         return KPIResult(
@@ -382,12 +586,13 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return []
 
+        table = self._day_table(AggAuthorRepoDay, filters)
         stmt = sa.select(
-            AggAuthorRepoDay.day,
-            sa.func.sum(AggAuthorRepoDay.commits).label("commits"),
+            table.day,
+            sa.func.sum(table.commits).label("commits"),
         )
-        stmt = self._apply_author_filters(stmt, filters)
-        stmt = stmt.group_by(AggAuthorRepoDay.day).order_by(AggAuthorRepoDay.day)
+        stmt = self._apply_author_filters(stmt, filters, table)
+        stmt = stmt.group_by(table.day).order_by(table.day)
         result = await self.session.execute(stmt)
         return [
             DailyCommitsPoint(day=row.day, commits=int(row.commits or 0))
@@ -398,14 +603,16 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return []
 
+        rows = self._ranged_rows(
+            AggHourRepoDay, AggHourRepoPeriod, ("hour", "commits", "lines_added", "lines_deleted"), filters,
+        )
         stmt = sa.select(
-            AggHourRepoDay.hour,
-            sa.func.sum(AggHourRepoDay.commits).label("commits"),
-            sa.func.sum(AggHourRepoDay.lines_added).label("lines_added"),
-            sa.func.sum(AggHourRepoDay.lines_deleted).label("lines_deleted"),
+            rows.c.hour,
+            sa.func.sum(rows.c.commits).label("commits"),
+            sa.func.sum(rows.c.lines_added).label("lines_added"),
+            sa.func.sum(rows.c.lines_deleted).label("lines_deleted"),
         )
-        stmt = self._apply_common_filters(stmt, AggHourRepoDay, filters)
-        stmt = stmt.group_by(AggHourRepoDay.hour).order_by(AggHourRepoDay.hour)
+        stmt = stmt.group_by(rows.c.hour).order_by(rows.c.hour)
         result = await self.session.execute(stmt)
         return [
             HourHeatmapPoint(
@@ -421,12 +628,13 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return []
 
-        weekday_expr = sa.cast(sa.func.extract("dow", AggHourRepoDay.day), sa.Integer)
+        table = self._day_table(AggHourRepoDay, filters)
+        weekday_expr = sa.cast(sa.func.extract("dow", table.day), sa.Integer)
         stmt = sa.select(
             weekday_expr.label("weekday"),
-            sa.func.sum(AggHourRepoDay.commits).label("commits"),
+            sa.func.sum(table.commits).label("commits"),
         )
-        stmt = self._apply_common_filters(stmt, AggHourRepoDay, filters)
+        stmt = self._apply_common_filters(stmt, table, filters)
         stmt = stmt.group_by(weekday_expr).order_by(weekday_expr)
         result = await self.session.execute(stmt)
         return [
@@ -446,17 +654,22 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return []
 
-        lines_expr = AggAuthorRepoDay.lines_added + AggAuthorRepoDay.lines_deleted
+        rows = self._ranged_rows(
+            AggAuthorRepoDay,
+            AggAuthorRepoPeriod,
+            ("author_id", "commits", "lines_added", "lines_deleted"),
+            filters,
+        )
+        lines_expr = rows.c.lines_added + rows.c.lines_deleted
         stmt = sa.select(
-            AggAuthorRepoDay.author_id,
-            sa.func.sum(AggAuthorRepoDay.commits).label("commits"),
+            rows.c.author_id,
+            sa.func.sum(rows.c.commits).label("commits"),
             sa.func.sum(lines_expr).label("lines"),
             Author.git_name,
             Author.git_email,
-        ).join(Author, Author.id == AggAuthorRepoDay.author_id, isouter=True)
-        stmt = self._apply_author_filters(stmt, filters)
+        ).join(Author, Author.id == rows.c.author_id, isouter=True)
         stmt = stmt.group_by(
-            AggAuthorRepoDay.author_id,
+            rows.c.author_id,
             Author.git_name,
             Author.git_email,
         ).order_by(sa.desc("commits"), sa.desc("lines")).limit(limit)
@@ -477,14 +690,21 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return MessageQualityStats(avg_length=0.0, short_pct=0.0, total_commits=0)
 
+        rows = self._ranged_rows(
+            AggAuthorRepoDay, AggAuthorRepoPeriod, ("msg_total_len", "msg_short_count", "commits"), filters,
+        )
         stmt = sa.select(
-            sa.func.coalesce(sa.func.sum(AggAuthorRepoDay.msg_total_len), 0),
-            sa.func.coalesce(sa.func.sum(AggAuthorRepoDay.msg_short_count), 0),
-            sa.func.coalesce(sa.func.sum(AggAuthorRepoDay.commits), 0),
+            sa.func.coalesce(sa.func.sum(rows.c.msg_total_len), 0),
+            sa.func.coalesce(sa.func.sum(rows.c.msg_short_count), 0),
+            sa.func.coalesce(sa.func.sum(rows.c.commits), 0),
         )
-        stmt = self._apply_author_filters(stmt, filters)
         result = await self.session.execute(stmt)
-        total_len, short_count, total_commits = result.one()
+        return self._message_quality(*result.one())
+
+    @staticmethod
+    def _message_quality(total_len: int | None, short_count: int | None, total_commits: int | None) -> MessageQualityStats:
+        total_len = int(total_len or 0)
+        short_count = int(short_count or 0)
         total_commits = int(total_commits or 0)
         avg_length = (total_len / total_commits) if total_commits else 0.0
         short_pct = (short_count / total_commits * 100) if total_commits else 0.0
@@ -498,15 +718,18 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return SizeHistogramStats(histogram=[], approx_avg_churn=None, approx_median_churn=None)
 
+        rows = self._ranged_rows(AggSizeBucketRepoDay, AggSizeBucketRepoPeriod, ("bucket", "cnt"), filters)
         stmt = sa.select(
-            AggSizeBucketRepoDay.bucket,
-            sa.func.sum(AggSizeBucketRepoDay.cnt).label("count"),
+            rows.c.bucket,
+            sa.func.sum(rows.c.cnt).label("count"),
         )
-        stmt = self._apply_common_filters(stmt, AggSizeBucketRepoDay, filters)
-        stmt = stmt.group_by(AggSizeBucketRepoDay.bucket)
+        stmt = stmt.group_by(rows.c.bucket)
         result = await self.session.execute(stmt)
 
         raw_rows = {row.bucket: int(row.count or 0) for row in result.fetchall()}  # pyright: ignore[reportArgumentType]
+        return self._size_histogram(raw_rows)
+
+    def _size_histogram(self, raw_rows: dict[SizeBucket, int]) -> SizeHistogramStats:
         histogram = [
             SizeHistogramBin(bucket=bucket, count=raw_rows.get(bucket, 0))
             for bucket in SizeBucket
@@ -544,15 +767,20 @@ class AggregateMetricsInterface:
         if filters.repo_ids is not None and len(filters.repo_ids) == 0:
             return []
 
+        rows = self._ranged_rows(
+            AggFileRepoDay,
+            AggFileRepoPeriod,
+            ("path", "commits_touch", "lines_added", "lines_deleted", "churn"),
+            filters,
+        )
         stmt = sa.select(
-            AggFileRepoDay.path,
-            sa.func.sum(AggFileRepoDay.commits_touch).label("commits_touch"),
-            sa.func.sum(AggFileRepoDay.lines_added).label("lines_added"),
-            sa.func.sum(AggFileRepoDay.lines_deleted).label("lines_deleted"),
-            sa.func.sum(AggFileRepoDay.churn).label("churn"),
-        )
-        stmt = self._apply_common_filters(stmt, AggFileRepoDay, filters)
-        stmt = stmt.group_by(AggFileRepoDay.path).order_by(sa.desc("churn"), sa.desc("commits_touch")).limit(limit)
+            rows.c.path,
+            sa.func.sum(rows.c.commits_touch).label("commits_touch"),
+            sa.func.sum(rows.c.lines_added).label("lines_added"),
+            sa.func.sum(rows.c.lines_deleted).label("lines_deleted"),
+            sa.func.sum(rows.c.churn).label("churn"),
+        )
+        stmt = stmt.group_by(rows.c.path).order_by(sa.desc("churn"), sa.desc("commits_touch")).limit(limit)
         result = await self.session.execute(stmt)
         return [
             HotFileRow(
@@ -565,10 +793,366 @@ class AggregateMetricsInterface:
             for row in result.fetchall()
         ]
 
-    def _apply_author_filters(self, stmt: Select, filters: AggregationFilter) -> Select:
-        stmt = self._apply_common_filters(stmt, AggAuthorRepoDay, filters)
+    async def get_dashboard(
+        self,
+        filters: AggregationFilter,
+        *,
+        top_authors_limit: int = 10,
+        hot_files_limit: int = 3,
+    ) -> DashboardAggregates:
+        """
+        Every dashboard block in two round-trips instead of one query per block.
+
+        The first statement groups the planned author range by
+        `GROUPING SETS ((), (author_id))` into the KPIs and message quality and
+        the ranked top authors, and appends the daily series read from
+        `agg_author_repo_day`. The second one returns the hourly heatmap from the
+        planned hour range, the weekday heatmap from `agg_hour_repo_day`, the size
+        histogram and the hot files, joined with `UNION ALL`. Results match the
+        per-block getters.
+        """
+        if filters.repo_ids is not None and len(filters.repo_ids) == 0:
+            return DashboardAggregates(
+                kpi=KPIResult(commits=0, active_devs=0, active_repos=0),
+                message_quality=MessageQualityStats(avg_length=0.0, short_pct=0.0, total_commits=0),
+                size_stats=SizeHistogramStats(histogram=[], approx_avg_churn=None, approx_median_churn=None),
+                daily=[],
+                hourly=[],
+                weekday=[],
+                top_authors=[],
+                hot_files=[],
+            )
+
+        kpi = KPIResult(commits=0, active_devs=0, active_repos=0)
+        message_quality = self._message_quality(0, 0, 0)
+        daily: list[DailyCommitsPoint] = []
+        top_authors: list[TopAuthorRow] = []
+        result = await self.session.execute(self._dashboard_author_stmt(filters, top_authors_limit))
+        for row in result.fetchall():
+            if row.grouping_id == self._GROUPED_TOTAL:
+                kpi = KPIResult(
+                    commits=int(row.commits or 0),
+                    active_devs=int(row.active_devs or 0),
+                    active_repos=int(row.active_repos or 0),
+                )
+                message_quality = self._message_quality(row.msg_total_len, row.msg_short_count, row.commits)
+            elif row.grouping_id == self._GROUPED_BY_DAY:
+                daily.append(DailyCommitsPoint(day=row.day, commits=int(row.commits or 0)))
+            else:
+                top_authors.append(
+                    TopAuthorRow(
+                        author_id=row.author_id,
+                        commits=int(row.commits or 0),
+                        lines=int(row.lines or 0),
+                        git_name=row.git_name,
+                        git_email=row.git_email,
+                    )
+                )
+        daily.sort(key=lambda point: point.day)
+        top_authors.sort(key=lambda author: (-author.commits, -author.lines))
+
+        hourly: list[HourHeatmapPoint] = []
+        weekday: list[WeekdayHeatmapPoint] = []
+        sizes: dict[SizeBucket, int] = {}
+        hot_files: list[HotFileRow] = []
+        result = await self.session.execute(self._dashboard_activity_stmt(filters, hot_files_limit))
+        for row in result.fetchall():
+            if row.block == "hour":
+                hourly.append(
+                    HourHeatmapPoint(
+                        hour=int(row.num),
+                        commits=int(row.v1 or 0),
+                        lines_added=int(row.v2 or 0),
+                        lines_deleted=int(row.v3 or 0),
+                    )
+                )
+            elif row.block == "weekday":
+                weekday.append(WeekdayHeatmapPoint(weekday=int(row.num), commits=int(row.v1 or 0)))
+            elif row.block == "size":
+                sizes[SizeBucket[row.label]] = int(row.v1 or 0)
+            else:
+                hot_files.append(
+                    HotFileRow(
+                        path=row.label,
+                        commits_touch=int(row.v1 or 0),
+                        lines_added=int(row.v2 or 0),
+                        lines_deleted=int(row.v3 or 0),
+                        churn=int(row.v4 or 0),
+                    )
+                )
+        hourly.sort(key=lambda point: point.hour)
+        weekday.sort(key=lambda point: point.weekday)
+        hot_files.sort(key=lambda file: (-file.churn, -file.commits_touch))
+
+        return DashboardAggregates(
+            kpi=kpi,
+            message_quality=message_quality,
+            size_stats=self._size_histogram(sizes),
+            daily=daily,
+            hourly=hourly,
+            weekday=weekday,
+            top_authors=top_authors,
+            hot_files=hot_files,
+        )
+
+    def _dashboard_author_stmt(self, filters: AggregationFilter, top_authors_limit: int) -> Select:
+        rows = self._ranged_rows(
+            AggAuthorRepoDay,
+            AggAuthorRepoPeriod,
+            (
+                "author_id", *self._repo_column(filters), "commits", "lines_added", "lines_deleted",
+                "msg_total_len", "msg_short_count",
+            ),
+            filters,
+        )
+        # NULL fillers are cast, otherwise the UNION would type them as text
+        by_author = sa.select(
+            sa.func.grouping(rows.c.author_id).label("grouping_id"),
+            sa.cast(sa.null(), sa.Date).label("day"),
+            rows.c.author_id,
+            sa.func.sum(rows.c.commits).label("commits"),
+            sa.func.sum(rows.c.lines_added + rows.c.lines_deleted).label("lines"),
+            sa.func.sum(rows.c.msg_total_len).label("msg_total_len"),
+            sa.func.sum(rows.c.msg_short_count).label("msg_short_count"),
+            sa.func.count(sa.distinct(rows.c.author_id)).label("active_devs"),
+            self._active_repos(rows, filters).label("active_repos"),
+        ).group_by(sa.func.grouping_sets(sa.text("()"), sa.tuple_(rows.c.author_id)))
+
+        days = self._day_table(AggAuthorRepoDay, filters)
+        by_day = self._apply_author_filters(
+            sa.select(
+                sa.literal(self._GROUPED_BY_DAY).label("grouping_id"),
+                days.day,
+                sa.cast(sa.null(), sa.Uuid).label("author_id"),
+                sa.func.sum(days.commits).label("commits"),
+                sa.func.sum(days.lines_added + days.lines_deleted).label("lines"),
+                sa.cast(sa.null(), sa.BigInteger).label("msg_total_len"),
+                sa.cast(sa.null(), sa.BigInteger).label("msg_short_count"),
+                sa.cast(sa.null(), sa.BigInteger).label("active_devs"),
+                sa.cast(sa.null(), sa.BigInteger).label("active_repos"),
+            ),
+            filters,
+            days,
+        ).group_by(days.day)
+
+        grouped = sa.union_all(by_author, by_day).subquery("dashboard_author_groups")
+        ranked = sa.select(
+            grouped,
+            sa.func.row_number()
+            .over(
+                partition_by=grouped.c.grouping_id,
+                order_by=(grouped.c.commits.desc(), grouped.c.lines.desc()),
+            )
+            .label("rank"),
+        ).subquery("dashboard_author_ranked")
+
+        return (
+            sa.select(ranked, Author.git_name, Author.git_email)
+            .join(Author, Author.id == ranked.c.author_id, isouter=True)
+            .where(
+                sa.or_(
+                    ranked.c.grouping_id != self._GROUPED_BY_AUTHOR,
+                    ranked.c.rank <= top_authors_limit,
+                )
+            )
+        )
+
+    def _dashboard_activity_stmt(self, filters: AggregationFilter, hot_files_limit: int) -> sa.CompoundSelect:
+        hours = self._ranged_rows(
+            AggHourRepoDay, AggHourRepoPeriod, ("hour", "commits", "lines_added", "lines_deleted"), filters,
+        )
+        # NULL fillers are cast, otherwise the UNION would type them as text
+        by_hour = sa.select(
+            sa.literal("hour").label("block"),
+            hours.c.hour.label("num"),
+            sa.cast(sa.null(), sa.Text).label("label"),
+            sa.func.sum(hours.c.commits).label("v1"),
+            sa.func.sum(hours.c.lines_added).label("v2"),
+            sa.func.sum(hours.c.lines_deleted).label("v3"),
+            sa.cast(sa.null(), sa.BigInteger).label("v4"),
+        ).group_by(hours.c.hour)
+
+        # Rollups do not keep the weekday, so this block always reads daily rows
+        hour_days = self._day_table(AggHourRepoDay, filters)
+        weekday_expr = sa.cast(sa.func.extract("dow", hour_days.day), sa.Integer)
+        by_weekday = self._apply_common_filters(
+            sa.select(
+                sa.literal("weekday").label("block"),
+                weekday_expr.label("num"),
+                sa.cast(sa.null(), sa.Text).label("label"),
+                sa.func.sum(hour_days.commits).label("v1"),
+                sa.cast(sa.null(), sa.BigInteger).label("v2"),
+                sa.cast(sa.null(), sa.BigInteger).label("v3"),
+                sa.cast(sa.null(), sa.BigInteger).label("v4"),
+            ),
+            hour_days,
+            filters,
+        ).group_by(weekday_expr)
+
+        buckets = self._ranged_rows(AggSizeBucketRepoDay, AggSizeBucketRepoPeriod, ("bucket", "cnt"), filters)
+        sizes = sa.select(
+            sa.literal("size").label("block"),
+            sa.cast(sa.null(), sa.Integer).label("num"),
+            sa.cast(buckets.c.bucket, sa.Text).label("label"),
+            sa.func.sum(buckets.c.cnt).label("v1"),
+            sa.cast(sa.null(), sa.BigInteger).label("v2"),
+            sa.cast(sa.null(), sa.BigInteger).label("v3"),
+            sa.cast(sa.null(), sa.BigInteger).label("v4"),
+        ).group_by(buckets.c.bucket)
+
+        paths = self._ranged_rows(
+            AggFileRepoDay,
+            AggFileRepoPeriod,
+            ("path", "commits_touch", "lines_added", "lines_deleted", "churn"),
+            filters,
+        )
+        files = (
+            sa.select(
+                sa.literal("file").label("block"),
+                sa.cast(sa.null(), sa.Integer).label("num"),
+                paths.c.path.label("label"),
+                sa.func.sum(paths.c.commits_touch).label("v1"),
+                sa.func.sum(paths.c.lines_added).label("v2"),
+                sa.func.sum(paths.c.lines_deleted).label("v3"),
+                sa.func.sum(paths.c.churn).label("v4"),
+            )
+            .group_by(paths.c.path)
+            .order_by(sa.desc("v4"), sa.desc("v1"))
+            .limit(hot_files_limit)
+            .subquery("dashboard_hot_files")
+        )
+
+        return sa.union_all(by_hour, by_weekday, sizes, sa.select(files))
+
+    @staticmethod
+    def plan_ranges(since: date, until: date) -> RangePlan:
+        """
+        Split `since..until` into whole months, whole weeks at the edges and single days.
+
+        Weeks run Monday to Sunday, so a period row is only used when the range
+        covers every day of it.
+        """
+        plan = RangePlan()
+        if since > until:
+            return plan
+
+        one_day = timedelta(days=1)
+        month_first = since if since.day == 1 else (since.replace(day=1) + timedelta(days=32)).replace(day=1)
+        month_last = until if (until + one_day).day == 1 else until.replace(day=1) - one_day
+        if month_first <= month_last:
+            plan.months.append((month_first, month_last))
+            edges = [(since, month_first - one_day), (month_last + one_day, until)]
+        else:
+            edges = [(since, until)]
+
+        for first, last in edges:
+            if first > last:
+                continue
+            week_first = first + timedelta(days=(7 - first.weekday()) % 7)
+            week_last = last - timedelta(days=(last.weekday() + 1) % 7)
+            if week_first > week_last:
+                plan.days.append((first, last))
+                continue
+            plan.weeks.append((week_first, week_last))
+            if first < week_first:
+                plan.days.append((first, week_first - one_day))
+            if week_last < last:
+                plan.days.append((week_last + one_day, last))
+        return plan
+
+    def _ranged_rows(
+        self,
+        day_model: Any,
+        period_model: Any,
+        columns: Sequence[str],
+        filters: AggregationFilter,
+        *,
+        by_project: bool = True,
+    ) -> sa.Subquery:
+        """
+        `columns` of every row in the filtered range, reading whole weeks and
+        months from `period_model` and the remaining days from `day_model`.
+
+        Open-ended ranges are read from the daily table only. Filters narrowed
+        to a project alone read the project-wide daily table instead, unless
+        `by_project` is off.
+        """
+        if by_project:
+            day_model = self._day_table(day_model, filters)
+
+        def select_from(model: Any) -> Select:
+            stmt = self._apply_scope_filters(sa.select(*(getattr(model, name) for name in columns)), model, filters)
+            if filters.author_ids and hasattr(model, "author_id"):
+                stmt = stmt.where(model.author_id.in_(tuple(filters.author_ids)))
+            return stmt
+
+        if filters.since is None or filters.until is None:
+            stmt = select_from(day_model)
+            if filters.since:
+                stmt = stmt.where(day_model.day >= filters.since)
+            if filters.until:
+                stmt = stmt.where(day_model.day <= filters.until)
+            return stmt.subquery()
+
+        plan = self.plan_ranges(filters.since, filters.until)
+        parts: list[Select] = []
+        if plan.days:
+            parts.append(
+                select_from(day_model).where(
+                    sa.or_(*(day_model.day.between(first, last) for first, last in plan.days))
+                )
+            )
+        periods = [
+            sa.and_(period_model.grain == grain, period_model.period_start.between(first, last))
+            for grain, ranges in ((RollupGrain.WEEK, plan.weeks), (RollupGrain.MONTH, plan.months))
+            for first, last in ranges
+        ]
+        if periods:
+            parts.append(select_from(period_model).where(sa.or_(*periods)))
+
+        if not parts:
+            # An empty range still needs the column shape
+            return select_from(day_model).where(sa.false()).subquery()
+        if len(parts) == 1:
+            return parts[0].subquery()
+        return sa.union_all(*parts).subquery()
+
+    @staticmethod
+    def _project_scoped(filters: AggregationFilter) -> bool:
+        return filters.project_id is not None and not filters.repo_ids and not filters.author_ids
+
+    def _day_table(self, table: Any, filters: AggregationFilter) -> Any:
+        """The daily table to read: the project-wide one when only the project is filtered."""
+        if self._project_scoped(filters):
+            return self._PROJECT_TABLES[table]
+        return table
+
+    def _repo_column(self, filters: AggregationFilter) -> tuple[str, ...]:
+        return () if self._project_scoped(filters) else ("repo_id",)
+
+    def _active_repos(self, rows: sa.Subquery, filters: AggregationFilter) -> sa.ColumnElement[int]:
+        """
+        Distinct repositories behind `rows`.
+
+        Project-wide rows have no repository, so the count then comes from the
+        size buckets, the narrowest per-repository table every commit lands in.
+        """
+        if not self._project_scoped(filters):
+            return sa.func.count(sa.distinct(rows.c.repo_id))
+        buckets = self._ranged_rows(
+            AggSizeBucketRepoDay, AggSizeBucketRepoPeriod, ("repo_id",), filters, by_project=False,
+        )
+        return sa.select(sa.func.count(sa.distinct(buckets.c.repo_id))).scalar_subquery()
+
+    def _apply_author_filters(
+        self,
+        stmt: Select,
+        filters: AggregationFilter,
+        table: Any = AggAuthorRepoDay,
+    ) -> Select:
+        stmt = self._apply_common_filters(stmt, table, filters)
         if filters.author_ids:
-            stmt = stmt.where(AggAuthorRepoDay.author_id.in_(tuple(filters.author_ids)))
+            stmt = stmt.where(table.author_id.in_(tuple(filters.author_ids)))
         return stmt
 
     def _apply_common_filters(self, stmt: Select, table: Any, filters: AggregationFilter) -> Select:
@@ -576,6 +1160,9 @@ class AggregateMetricsInterface:
             stmt = stmt.where(table.day >= filters.since)
         if filters.until:
             stmt = stmt.where(table.day <= filters.until)
+        return self._apply_scope_filters(stmt, table, filters)
+
+    def _apply_scope_filters(self, stmt: Select, table: Any, filters: AggregationFilter) -> Select:
         if filters.project_id is not None:
             stmt = stmt.where(table.project_id == filters.project_id)
         if filters.repo_ids:
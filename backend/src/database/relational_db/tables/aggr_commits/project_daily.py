@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    Text,
+    Uuid,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..table_base import Base
+from .commit_size import SizeBucket
+
+if TYPE_CHECKING:
+    from ..authors.authors_table import Author
+    from ..projects.projects_table import Project
+
+
+class AggAuthorProjectDay(Base):
+    """`agg_author_repo_day` summed over the repositories of a project."""
+
+    __tablename__ = "agg_author_project_day"
+
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    author_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    commits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    files_changed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    msg_total_len: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    msg_short_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+    author: Mapped["Author"] = relationship("Author", lazy="noload")
+
+    __table_args__ = (
+        Index("idx_apd_author_day", "author_id", "day"),
+    )
+
+
+class AggHourProjectDay(Base):
+    """`agg_hour_repo_day` summed over the repositories of a project."""
+
+    __tablename__ = "agg_hour_project_day"
+
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    hour: Mapped[int] = mapped_column(
+        SmallInteger, primary_key=True, comment="Hour of the day (0-23)"
+    )
+
+    commits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+
+    __table_args__ = (
+        CheckConstraint("hour >= 0 AND hour < 24", name="ck_agg_hour_project_valid_range"),
+    )
+
+
+class AggSizeBucketProjectDay(Base):
+    """`agg_size_bucket_repo_day` summed over the repositories of a project."""
+
+    __tablename__ = "agg_size_bucket_project_day"
+
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    bucket: Mapped[SizeBucket] = mapped_column(
+        SAEnum(SizeBucket, name="size_bucket"), primary_key=True
+    )
+
+    cnt: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+
+
+class AggFileProjectDay(Base):
+    """`agg_file_repo_day` summed over the repositories of a project."""
+
+    __tablename__ = "agg_file_project_day"
+
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date(), primary_key=True)
+    path: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    commits_touch: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    churn: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="added+deleted")
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    Text,
+    Uuid,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..table_base import Base
+from .commit_size import SizeBucket
+
+if TYPE_CHECKING:
+    from ..authors.authors_table import Author
+    from ..projects.projects_table import Project
+    from ..repositories.repositories_table import Repository
+
+
+class RollupGrain(str, Enum):
+    WEEK = "week"
+    MONTH = "month"
+
+    def period_start(self, day: date) -> date:
+        """First day of the period holding `day`; weeks start on Monday like `date_trunc('week')`."""
+        if self is RollupGrain.WEEK:
+            return day - timedelta(days=day.weekday())
+        return day.replace(day=1)
+
+
+class AggAuthorRepoPeriod(Base):
+    """Week and month sums of `agg_author_repo_day`, keyed by the first day of the period."""
+
+    __tablename__ = "agg_author_repo_period"
+
+    grain: Mapped[RollupGrain] = mapped_column(SAEnum(RollupGrain, name="rollup_grain"), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date(), primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    repo_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("repositories.id", ondelete="CASCADE"), primary_key=True
+    )
+    author_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("authors.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    commits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    files_changed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    msg_total_len: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    msg_short_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+    repository: Mapped["Repository"] = relationship("Repository", lazy="noload")
+    author: Mapped["Author"] = relationship("Author", lazy="noload")
+
+    __table_args__ = (
+        Index("idx_arp_project_period", "project_id", "grain", "period_start"),
+        Index("idx_arp_author_period", "author_id", "grain", "period_start"),
+    )
+
+
+class AggHourRepoPeriod(Base):
+    """Week and month sums of `agg_hour_repo_day`."""
+
+    __tablename__ = "agg_hour_repo_period"
+
+    grain: Mapped[RollupGrain] = mapped_column(SAEnum(RollupGrain, name="rollup_grain"), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date(), primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    repo_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("repositories.id", ondelete="CASCADE"), primary_key=True
+    )
+    hour: Mapped[int] = mapped_column(
+        SmallInteger, primary_key=True, comment="Hour of the day (0-23)"
+    )
+
+    commits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+    repository: Mapped["Repository"] = relationship("Repository", lazy="noload")
+
+    __table_args__ = (
+        CheckConstraint("hour >= 0 AND hour < 24", name="ck_agg_hour_period_valid_range"),
+        Index("idx_ahrp_project_period", "project_id", "grain", "period_start"),
+    )
+
+
+class AggSizeBucketRepoPeriod(Base):
+    """Week and month sums of `agg_size_bucket_repo_day`."""
+
+    __tablename__ = "agg_size_bucket_repo_period"
+
+    grain: Mapped[RollupGrain] = mapped_column(SAEnum(RollupGrain, name="rollup_grain"), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date(), primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    repo_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("repositories.id", ondelete="CASCADE"), primary_key=True
+    )
+    bucket: Mapped[SizeBucket] = mapped_column(
+        SAEnum(SizeBucket, name="size_bucket"), primary_key=True
+    )
+
+    cnt: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+    repository: Mapped["Repository"] = relationship("Repository", lazy="noload")
+
+    __table_args__ = (
+        Index("idx_asbrp_project_period", "project_id", "grain", "period_start"),
+    )
+
+
+class AggFileRepoPeriod(Base):
+    """Week and month sums of `agg_file_repo_day`."""
+
+    __tablename__ = "agg_file_repo_period"
+
+    grain: Mapped[RollupGrain] = mapped_column(SAEnum(RollupGrain, name="rollup_grain"), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date(), primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    repo_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True), ForeignKey("repositories.id", ondelete="CASCADE"), primary_key=True
+    )
+    path: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    commits_touch: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lines_deleted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    churn: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="added+deleted")
+
+    project: Mapped["Project"] = relationship("Project", lazy="noload")
+    repository: Mapped["Repository"] = relationship("Repository", lazy="noload")
+
+    __table_args__ = (
+        Index("idx_afrp_project_period", "project_id", "grain", "period_start"),
+    )
@@ -1,2 +1,2 @@
 from .authors_table import Author
-from .authors_interface import AuthorInterface
+from .authors_interface import AuthorInterface, normalize_email
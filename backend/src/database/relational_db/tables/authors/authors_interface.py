@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Iterable, Mapping
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from domain.parsing.schemas.author import GitUser
 
@@ -43,6 +47,105 @@ class AuthorInterface:
 
         return author
 
+    async def resolve_many(
+        self,
+        users: Iterable[GitUser | None],
+        identity_map: dict[str, Author] | None = None,
+    ) -> dict[str, Author]:
+        """
+        Resolve a batch of git users to authors keyed by normalized email.
+
+        Emails missing from `identity_map` are looked up with one `IN` query and the
+        rest are created with one `INSERT ... ON CONFLICT DO NOTHING`. The map is
+        updated in place so callers can keep it across batches.
+        """
+        resolved = identity_map if identity_map is not None else {}
+
+        latest: dict[str, GitUser] = {}
+        for user in users:
+            if user is None or not user.email:
+                continue
+            latest[normalize_email(user.email)] = user
+
+        missing = [email for email in latest if email not in resolved]
+        if missing:
+            resolved.update(await self._load_by_emails(missing))
+
+            to_create = [email for email in missing if email not in resolved]
+            if to_create:
+                stmt = insert(Author).values([
+                    {
+                        "id": uuid4(),
+                        "git_name": latest[email].name or latest[email].email,
+                        "git_email": latest[email].email,
+                        "email_normalized": email,
+                    }
+                    for email in to_create
+                ])
+                stmt = stmt.on_conflict_do_nothing(index_elements=[Author.email_normalized])
+                await self.session.execute(stmt)
+                resolved.update(await self._load_by_emails(to_create))
+
+        for email, user in latest.items():
+            author = resolved.get(email)
+            if author is None:
+                continue
+            if user.name and author.git_name != user.name:
+                author.git_name = user.name
+            if author.git_email != user.email:
+                author.git_email = user.email
+
+        return resolved
+
+    async def _load_by_emails(self, emails: list[str]) -> dict[str, Author]:
+        stmt = (
+            select(Author)
+            .where(Author.email_normalized.in_(emails))
+            .options(
+                noload(Author.authored_commits),
+                noload(Author.committed_commits),
+            )
+        )
+        rows = await self.session.scalars(stmt)
+        return {author.email_normalized: author for author in rows.all()}
+
+    async def extend_commit_windows(
+        self,
+        windows: Mapping[UUID, tuple[datetime, datetime]],
+    ) -> None:
+        """
+        Widen first/last commit timestamps of several authors in SQL.
+
+        LEAST/GREATEST on the stored values keeps concurrent sync sessions from
+        overwriting each other, and ids are updated in sorted order so two
+        transactions lock shared authors in the same sequence.
+        """
+        if not windows:
+            return
+
+        table = Author.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("author_id"))
+            .values(
+                first_commit_at=func.least(
+                    func.coalesce(table.c.first_commit_at, bindparam("first_at")),
+                    bindparam("first_at"),
+                ),
+                last_commit_at=func.greatest(
+                    func.coalesce(table.c.last_commit_at, bindparam("last_at")),
+                    bindparam("last_at"),
+                ),
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {"author_id": author_id, "first_at": first_at, "last_at": last_at}
+                for author_id, (first_at, last_at) in sorted(windows.items(), key=lambda item: str(item[0]))
+            ],
+        )
+
     async def touch_commit_window(self, author: Author | None, created_at: datetime) -> None:
         if author is None:
             return
@@ -3,7 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.parsing import BranchModel
@@ -45,6 +45,19 @@ class BranchInterface:
 
         return synced
 
+    async def mark_default(self, repository_id: UUID, default_branch: str | None) -> None:
+        """Flag `default_branch` as the repository default, touching only rows that change."""
+        is_default = Branch.name == (default_branch or "")
+        await self.session.execute(
+            update(Branch)
+            .where(
+                Branch.repo_id == repository_id,
+                Branch.is_default.is_distinct_from(is_default),
+            )
+            .values(is_default=is_default)
+            .execution_options(synchronize_session=False)
+        )
+
     async def list_for_repository(
         self, repository_id: UUID,
         *,
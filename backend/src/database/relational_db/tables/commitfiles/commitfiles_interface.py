@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Iterable, Mapping, Optional
+from uuid import uuid4
 
-from sqlalchemy import delete
+from sqlalchemy import String, any_, bindparam, delete, insert
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .commitfiles_table import CommitFile
+from ..patch_blobs import EncodedPatch, PatchBlobInterface, encode_patch
 
 
 @dataclass
@@ -18,29 +21,65 @@ class CommitFilePayload:
     patch: str
     is_binary: bool
     previous_path: Optional[str] = None
+    # Pre-encoded `patch`; computed on write when missing
+    patch_blob: Optional[EncodedPatch] = None
+
+    def encoded_patch(self) -> EncodedPatch:
+        if self.patch_blob is None:
+            self.patch_blob = encode_patch(self.patch)
+        return self.patch_blob
 
 
 class CommitFileInterface:
     def __init__(self, session: AsyncSession):
         self.session = session
+        self._blobs = PatchBlobInterface(session)
 
     async def replace_for_commit(
         self,
         commit_sha: str,
         files: Iterable[CommitFilePayload],
     ) -> None:
+        await self.replace_for_commits({commit_sha: files})
+
+    async def replace_for_commits(
+        self,
+        files_by_sha: Mapping[str, Iterable[CommitFilePayload]],
+    ) -> None:
+        """
+        Replace the file changes of several commits at once.
+
+        One `DELETE ... WHERE commit_sha = ANY(...)` and one multi-row insert on the
+        Core table, so large diffs never materialise ORM objects in the session.
+        """
+        if not files_by_sha:
+            return
+
         await self.session.execute(
-            delete(CommitFile).where(CommitFile.commit_sha == commit_sha)
+            delete(CommitFile).where(
+                CommitFile.commit_sha
+                == any_(bindparam("commit_shas", list(files_by_sha), type_=ARRAY(String)))
+            )
         )
 
-        for payload in files:
-            record = CommitFile(
-                commit_sha=commit_sha,
-                file_path=payload.path,
-                status=payload.status,
-                added_lines=payload.added_lines,
-                deleted_lines=payload.deleted_lines,
-                patch=payload.patch,
-                is_binary=payload.is_binary,
-            )
-            self.session.add(record)
+        payloads = [
+            (commit_sha, payload)
+            for commit_sha, files in files_by_sha.items()
+            for payload in files
+        ]
+        rows = [
+            {
+                "change_id": uuid4(),
+                "commit_sha": commit_sha,
+                "file_path": payload.path,
+                "status": payload.status,
+                "added_lines": payload.added_lines,
+                "deleted_lines": payload.deleted_lines,
+                "patch_hash": payload.encoded_patch().hash,
+                "is_binary": payload.is_binary,
+            }
+            for commit_sha, payload in payloads
+        ]
+        if rows:
+            await self._blobs.store_many(payload.encoded_patch() for _, payload in payloads)
+            await self.session.execute(insert(CommitFile.__table__), rows)
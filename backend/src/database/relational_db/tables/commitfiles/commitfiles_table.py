@@ -21,7 +21,10 @@ class CommitFile(Base):
     added_lines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     deleted_lines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     status: Mapped[str] = mapped_column(String, nullable=False)
-    patch: Mapped[str | None] = mapped_column(Text, nullable=True)
+    patch_hash: Mapped[str | None] = mapped_column(
+        ForeignKey("patch_blobs.hash", ondelete="SET NULL"),
+        nullable=True,
+    )
     is_binary: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     commit: Mapped["Commit"] = relationship(back_populates="files", lazy="selectin")
@@ -1,2 +1,2 @@
 from .commits_table import Commit
-from .commits_interface import CommitInterface
+from .commits_interface import CommitDiffStats, CommitInterface, CommitUpsert
@@ -1,20 +1,39 @@
 from __future__ import annotations
 
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Sequence
 
+import sqlalchemy as sa
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, noload, selectinload
 
 from domain.parsing.schemas.commits import CommitModel
 
 from .commits_table import Commit
 from ..authors import Author
+from ..projects import Project
 from ..repositories import Repository
 
 
+@dataclass(slots=True)
+class CommitDiffStats:
+    added_lines: int
+    deleted_lines: int
+    files_changed: int
+
+
+@dataclass(slots=True)
+class CommitUpsert:
+    model: CommitModel
+    author: Author | None
+    committer: Author | None
+    diff: CommitDiffStats
+
+
 class CommitInterface:
     """Helpers for persisting commits."""
 
@@ -59,18 +78,91 @@ class CommitInterface:
 
         return commit, created
 
+    async def upsert_many(
+        self,
+        repository: Repository,
+        items: Sequence[CommitUpsert],
+    ) -> set[str]:
+        """
+        Upsert a page of commits with one `INSERT ... ON CONFLICT (sha) DO UPDATE`.
+
+        Returns SHAs of the rows that were inserted rather than updated.
+        """
+        rows: dict[str, dict] = {}
+        for item in items:
+            rows[item.model.sha] = self._build_row(repository, item)
+        if not rows:
+            return set()
+
+        # Sorted by sha so sessions syncing forks that share commits lock rows in one order
+        stmt = insert(Commit).values([rows[sha] for sha in sorted(rows)])
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Commit.sha],
+            set_={
+                "repo_id": excluded.repo_id,
+                "author_id": excluded.author_id,
+                "committer_id": excluded.committer_id,
+                "author_name": excluded.author_name,
+                "author_email": excluded.author_email,
+                "committer_name": excluded.committer_name,
+                "committer_email": excluded.committer_email,
+                "message": excluded.message,
+                "issues": excluded.issues,
+                "parents": excluded.parents,
+                "branch_names": excluded.branch_names,
+                "tag_names": excluded.tag_names,
+                "old_tag_names": excluded.old_tag_names,
+                "created_at": excluded.created_at,
+                "committed_at": excluded.committed_at,
+                "is_merge_commit": Commit.is_merge_commit | excluded.is_merge_commit,
+                "added_lines": excluded.added_lines,
+                "deleted_lines": excluded.deleted_lines,
+                "files_changed": excluded.files_changed,
+            },
+        ).returning(Commit.sha, sa.literal_column("xmax = 0").label("inserted"))
+
+        result = await self.session.execute(stmt)
+        return {row.sha for row in result if row.inserted}
+
+    @staticmethod
+    def _build_row(repository: Repository, item: CommitUpsert) -> dict:
+        model, author, committer, diff = item.model, item.author, item.committer, item.diff
+        parents = model.parents or []
+        return {
+            "sha": model.sha,
+            "repo_id": repository.id,
+            "author_id": author.id if author else None,
+            "committer_id": committer.id if committer else None,
+            "author_name": model.author.name if model.author else author.git_name if author else "Unknown",
+            "author_email": model.author.email if model.author else author.git_email if author else "unknown@example.com",
+            "committer_name": model.committer.name if model.committer else committer.git_name if committer else None,
+            "committer_email": model.committer.email if model.committer else committer.git_email if committer else None,
+            "message": (model.message or "").strip(),
+            "issues": model.issues or {},
+            "parents": parents,
+            "branch_names": model.branch_names or [],
+            "tag_names": model.tag_names or [],
+            "old_tag_names": model.old_tags or [],
+            "created_at": model.created_at,
+            "committed_at": model.created_at,
+            "is_merge_commit": len(parents) > 1,
+            "added_lines": diff.added_lines,
+            "deleted_lines": diff.deleted_lines,
+            "files_changed": diff.files_changed,
+        }
+
     async def apply_diff_stats(
         self,
         commit: Commit,
         *,
-        diff_content: str,
         added_lines: int,
         deleted_lines: int,
         files_changed: int,
     ) -> Commit:
-        commit.diff_content = diff_content
         commit.added_lines = added_lines
         commit.deleted_lines = deleted_lines
+        commit.files_changed = files_changed
         commit.is_merge_commit = commit.is_merge_commit or files_changed > 0 and len(commit.parents) > 1
         return commit
 
@@ -84,6 +176,54 @@ class CommitInterface:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _feed_options() -> tuple:
+        """
+        Load only what the commit feeds render.
+
+        Diff and file rows are never touched (`files_changed` is stored on the
+        commit), and the selectin collections of authors, repositories and
+        projects are switched off so a page does not drag in their history.
+        """
+        person = (
+            load_only(Author.id, Author.git_name, Author.git_email),
+            noload(Author.authored_commits),
+            noload(Author.committed_commits),
+        )
+        return (
+            load_only(
+                Commit.sha,
+                Commit.repo_id,
+                Commit.author_id,
+                Commit.committer_id,
+                Commit.author_name,
+                Commit.author_email,
+                Commit.committer_name,
+                Commit.committer_email,
+                Commit.message,
+                Commit.added_lines,
+                Commit.deleted_lines,
+                Commit.files_changed,
+                Commit.is_merge_commit,
+                Commit.created_at,
+                Commit.committed_at,
+            ),
+            noload(Commit.files),
+            selectinload(Commit.author).options(*person),
+            selectinload(Commit.committer).options(*person),
+            selectinload(Commit.repository).options(
+                load_only(Repository.id, Repository.project_id, Repository.name),
+                noload(Repository.commits),
+                noload(Repository.branches),
+                selectinload(Repository.project).options(
+                    load_only(Project.id, Project.name),
+                    noload(Project.parent),
+                    noload(Project.children),
+                    noload(Project.repositories),
+                ),
+            ),
+        )
+
     async def list_recent(
         self,
         repository_id: uuid.UUID,
@@ -105,12 +245,7 @@ class CommitInterface:
         stmt = (
             stmt.order_by(Commit.created_at.desc(), Commit.sha.desc())
             .limit(limit + 1)
-            .options(
-                selectinload(Commit.author),
-                selectinload(Commit.committer),
-                selectinload(Commit.files),
-                selectinload(Commit.repository).selectinload(Repository.project),
-            )
+            .options(*self._feed_options())
         )
 
         result = await self.session.execute(stmt)
@@ -158,12 +293,7 @@ class CommitInterface:
         stmt = (
             stmt.order_by(Commit.created_at.desc(), Commit.sha.desc())
             .limit(limit + 1)
-            .options(
-                selectinload(Commit.author),
-                selectinload(Commit.committer),
-                selectinload(Commit.files),
-                selectinload(Commit.repository).selectinload(Repository.project),
-            )
+            .options(*self._feed_options())
         )
 
         result = await self.session.execute(stmt)
@@ -67,7 +67,10 @@ class Commit(Base):
     added_lines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     deleted_lines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     is_merge_commit: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    diff_content: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Denormalized count of commit_files rows, kept in sync at ingest
+    files_changed: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -0,0 +1,3 @@
+from .patch_blobs_table import PatchBlob
+from .patch_codec import EncodedPatch, decode_patch, encode_patch
+from .patch_blobs_interface import PatchBlobInterface
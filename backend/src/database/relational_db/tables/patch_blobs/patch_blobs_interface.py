@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .patch_blobs_table import PatchBlob
+from .patch_codec import EncodedPatch
+
+
+class PatchBlobInterface:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def store_many(self, blobs: Iterable[EncodedPatch]) -> None:
+        """Insert blobs that are not stored yet; identical content is kept once."""
+        unique = {blob.hash: blob for blob in blobs}
+        if not unique:
+            return
+
+        # Sorted so concurrent writers take row locks in the same order
+        rows = [
+            {
+                "hash": blob.hash,
+                "codec": blob.codec,
+                "raw_size": blob.raw_size,
+                "stored_size": len(blob.data),
+                "data": blob.data,
+            }
+            for _, blob in sorted(unique.items())
+        ]
+        stmt = insert(PatchBlob.__table__).on_conflict_do_nothing(index_elements=["hash"])
+        await self.session.execute(stmt, rows)
@@ -0,0 +1,18 @@
+from sqlalchemy import Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, deferred, mapped_column
+
+from ..table_base import Base
+from ..mixins import CreatedAtMixin
+
+
+class PatchBlob(Base, CreatedAtMixin):
+    """Compressed diff text shared by every commit and file row with the same content."""
+
+    __tablename__ = "patch_blobs"
+
+    # sha256 of the UTF-8 encoded text
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(16), nullable=False)
+    raw_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    stored_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = deferred(mapped_column(LargeBinary, nullable=False))
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import zlib
+from dataclasses import dataclass
+
+from core.config import config
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is always available
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+
+@dataclass(slots=True, frozen=True)
+class EncodedPatch:
+    hash: str
+    codec: str
+    data: bytes
+    raw_size: int
+
+
+def _resolve_codec(requested: str) -> str:
+    if requested == CODEC_ZSTD and zstandard is None:
+        logger.warning("PATCH_CODEC=zstd but 'zstandard' is not installed; using zlib")
+        return CODEC_ZLIB
+    return requested
+
+
+_codec = _resolve_codec(config.PATCH_CODEC)
+
+
+def encode_patch(text: str) -> EncodedPatch:
+    """Hash and compress a patch; data is stored raw when compression does not pay off."""
+    raw = text.encode("utf-8", errors="replace")
+    digest = hashlib.sha256(raw).hexdigest()
+
+    codec, data = _codec, raw
+    if _codec == CODEC_ZLIB:
+        data = zlib.compress(raw, config.PATCH_COMPRESSION_LEVEL)
+    elif _codec == CODEC_ZSTD:
+        data = zstandard.ZstdCompressor(level=config.PATCH_COMPRESSION_LEVEL).compress(raw)
+
+    if len(data) >= len(raw):
+        codec, data = CODEC_NONE, raw
+    return EncodedPatch(hash=digest, codec=codec, data=data, raw_size=len(raw))
+
+
+def decode_patch(codec: str, data: bytes) -> str:
+    if codec == CODEC_ZLIB:
+        raw = zlib.decompress(data)
+    elif codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Patch is zstd-compressed but 'zstandard' is not installed")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raw = data
+    return raw.decode("utf-8", errors="replace")
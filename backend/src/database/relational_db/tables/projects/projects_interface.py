@@ -18,7 +18,13 @@ class ProjectInterface:
 
     async def upsert_from_model(self, model: ProjectModel) -> Project:
         project = await self.session.scalar(
-            select(Project).where(Project.name == model.name)
+            select(Project)
+            .where(Project.name == model.name)
+            .options(
+                noload(Project.repositories),
+                noload(Project.children),
+                noload(Project.parent),
+            )
         )
 
         if project is None:
@@ -44,6 +50,19 @@ class ProjectInterface:
         stmt = select(Project).where(Project.name == name)
         return await self.session.scalar(stmt)
     
+    async def get_for_sync(self, name: str) -> Project | None:
+        """Project row alone, without eagerly loading its repositories and relatives."""
+        stmt = (
+            select(Project)
+            .where(Project.name == name)
+            .options(
+                noload(Project.repositories),
+                noload(Project.children),
+                noload(Project.parent),
+            )
+        )
+        return await self.session.scalar(stmt)
+
     async def get_by_id(self, id: int) -> Project | None:
         stmt = (
             select(Project)
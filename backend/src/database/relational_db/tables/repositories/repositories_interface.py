@@ -3,6 +3,7 @@ from __future__ import annotations
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.orm import noload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.parsing.schemas.repos import RepositoryModel
@@ -24,9 +25,17 @@ class RepositoryInterface:
         project: Project,
         model: RepositoryModel,
     ) -> Repository:
-        stmt = select(Repository).where(
-            Repository.project_id == project.id,
-            Repository.name == model.key,
+        stmt = (
+            select(Repository)
+            .where(
+                Repository.project_id == project.id,
+                Repository.name == model.key,
+            )
+            .options(
+                noload(Repository.commits),
+                noload(Repository.branches),
+                noload(Repository.project),
+            )
         )
         repository = await self.session.scalar(stmt)
 
@@ -65,13 +74,34 @@ class RepositoryInterface:
         stmt = select(Repository).where(Repository.id == repo_id)
         return await self.session.scalar(stmt)
 
+    async def get_for_sync(self, repo_id: UUID) -> Repository | None:
+        """Repository row alone, without eagerly loading its commits and branches."""
+        stmt = (
+            select(Repository)
+            .where(Repository.id == repo_id)
+            .options(
+                noload(Repository.commits),
+                noload(Repository.branches),
+                noload(Repository.project),
+            )
+        )
+        return await self.session.scalar(stmt)
+
     async def get_by_project_and_name(
         self,
         project_id: int,
         repository_name: str,
     ) -> Repository | None:
-        stmt = select(Repository).where(
-            Repository.project_id == project_id,
-            Repository.name == repository_name,
+        stmt = (
+            select(Repository)
+            .where(
+                Repository.project_id == project_id,
+                Repository.name == repository_name,
+            )
+            .options(
+                noload(Repository.commits),
+                noload(Repository.branches),
+                noload(Repository.project),
+            )
         )
         return await self.session.scalar(stmt)
@@ -0,0 +1,2 @@
+from .sync_state_table import SyncState
+from .sync_state_interface import PushRequest, ScheduledRepository, SyncStateInterface
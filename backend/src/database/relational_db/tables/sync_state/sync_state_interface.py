@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..projects.projects_table import Project
+from ..repositories.repositories_table import Repository
+from .sync_state_table import SyncState
+
+
+@dataclass(slots=True)
+class PushRequest:
+    repo_id: UUID
+    next_run_at: datetime
+    # True when an earlier push is still waiting and this one rode along with it
+    coalesced: bool
+
+
+@dataclass(slots=True)
+class ScheduledRepository:
+    repo_id: UUID
+    project_id: int
+    project_key: str
+    repository_name: str
+    next_run_at: datetime | None
+    poll_interval_seconds: int | None
+    last_completed_at: datetime | None
+    in_progress: bool
+
+
+class SyncStateInterface:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, repo_id: UUID) -> SyncState | None:
+        return await self.session.get(SyncState, repo_id)
+
+    async def get_or_create(self, repo_id: UUID) -> SyncState:
+        state = await self.get(repo_id)
+        if state is None:
+            state = SyncState(repo_id=repo_id, pages=0, commits=0)
+            self.session.add(state)
+        return state
+
+    async def list_all(self) -> list[SyncState]:
+        result = await self.session.execute(select(SyncState))
+        return list(result.scalars().all())
+
+    async def list_schedule(
+        self,
+        *,
+        due_before: datetime | None = None,
+        repo_ids: Collection[UUID] | None = None,
+        project_keys: Collection[str] | None = None,
+        limit: int | None = None,
+    ) -> list[ScheduledRepository]:
+        """Repositories ordered by next run, optionally only those due before `due_before`."""
+        stmt = (
+            select(
+                SyncState.repo_id,
+                Repository.project_id,
+                Project.name,
+                Repository.name,
+                SyncState.next_run_at,
+                SyncState.poll_interval_seconds,
+                SyncState.last_completed_at,
+                SyncState.cursor.is_not(None),
+            )
+            .join(Repository, Repository.id == SyncState.repo_id)
+            .join(Project, Project.id == Repository.project_id)
+            .order_by(SyncState.next_run_at.asc().nulls_first(), SyncState.repo_id)
+        )
+        if due_before is not None:
+            stmt = stmt.where(
+                (SyncState.next_run_at.is_(None)) | (SyncState.next_run_at <= due_before)
+            )
+        if repo_ids is not None:
+            stmt = stmt.where(SyncState.repo_id.in_(list(repo_ids)))
+        if project_keys is not None:
+            stmt = stmt.where(Project.name.in_(list(project_keys)))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
+        return [ScheduledRepository(*row) for row in result.all()]
+
+    async def postpone(self, repo_id: UUID, next_run_at: datetime) -> None:
+        await self.session.execute(
+            update(SyncState)
+            .where(SyncState.repo_id == repo_id)
+            .values(next_run_at=next_run_at)
+        )
+
+    async def request_push_sync(
+        self,
+        project_key: str,
+        repository_name: str,
+        *,
+        due_at: datetime,
+    ) -> PushRequest | None:
+        """
+        Move the repository's next run up to `due_at` for a push event.
+
+        The run is never pushed back, so a burst of events collapses into the
+        run the first one scheduled. Returns None for unknown repositories.
+        """
+        now = datetime.now(UTC)
+        stmt = (
+            update(SyncState)
+            .where(
+                SyncState.repo_id == Repository.id,
+                Repository.project_id == Project.id,
+                Project.name == project_key,
+                Repository.name == repository_name,
+            )
+            .values(
+                next_run_at=func.least(func.coalesce(SyncState.next_run_at, due_at), due_at),
+                push_requested_at=func.coalesce(SyncState.push_requested_at, now),
+            )
+            .returning(
+                SyncState.repo_id,
+                SyncState.next_run_at,
+                SyncState.push_requested_at < now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return None
+        return PushRequest(*row)
+
+    async def schedule_next(
+        self,
+        repo_id: UUID,
+        interval: timedelta,
+        next_run_at: datetime,
+        *,
+        push_due_at: datetime,
+    ) -> None:
+        """
+        Record the cadence of a completed run and when the next one is due.
+
+        Done in one statement so a push recorded while the run was going on is
+        not overwritten: it keeps the repository due at `push_due_at` instead.
+        """
+        pushed_during_run = SyncState.push_requested_at > SyncState.run_started_at
+        await self.session.execute(
+            update(SyncState)
+            .where(SyncState.repo_id == repo_id)
+            .values(
+                poll_interval_seconds=int(interval.total_seconds()),
+                next_run_at=case(
+                    (pushed_during_run, func.least(next_run_at, push_due_at)),
+                    else_=next_run_at,
+                ),
+                push_requested_at=case(
+                    (pushed_during_run, SyncState.push_requested_at),
+                    else_=None,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def start_run(state: SyncState, after: datetime | None) -> None:
+        state.cursor = None
+        state.cursor_after = after
+        state.pending_watermark = None
+        state.pages = 0
+        state.commits = 0
+        state.run_started_at = datetime.now(UTC)
+
+    @staticmethod
+    def record_page(
+        state: SyncState,
+        *,
+        next_cursor: str | None,
+        page_number: int,
+        commits: int,
+        newest: datetime | None,
+    ) -> None:
+        state.cursor = next_cursor
+        state.pages = page_number
+        state.commits += commits
+        if newest is not None and (
+            state.pending_watermark is None or newest > state.pending_watermark
+        ):
+            state.pending_watermark = newest
+
+    @staticmethod
+    def complete_run(state: SyncState) -> None:
+        if state.pending_watermark is not None and (
+            state.watermark is None or state.pending_watermark > state.watermark
+        ):
+            state.watermark = state.pending_watermark
+        state.cursor = None
+        state.cursor_after = None
+        state.pending_watermark = None
+        state.last_completed_at = datetime.now(UTC)
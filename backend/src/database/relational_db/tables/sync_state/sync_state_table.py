@@ -0,0 +1,44 @@
+from uuid import UUID
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Text, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..table_base import Base
+from ..mixins import TimestampMixin
+
+
+class SyncState(Base, TimestampMixin):
+    """Commit sync progress of a repository, used to resume interrupted runs."""
+
+    __tablename__ = "sync_state"
+    __table_args__ = (
+        Index("idx_sync_state_next_run_at", "next_run_at"),
+    )
+
+    repo_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("repositories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Cursor of the next page to fetch; NULL when no run is in progress
+    cursor: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # `after` filter the in-progress run was started with, the cursor is only valid with it
+    cursor_after: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Newest commit timestamp covered by a completed run
+    watermark: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Newest commit timestamp seen by the in-progress run
+    pending_watermark: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    pages: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    commits: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    run_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Polling cadence derived from recent commit activity; NULL until the first completed run
+    poll_interval_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # First push event not yet covered by a started run; NULL when none is pending
+    push_requested_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
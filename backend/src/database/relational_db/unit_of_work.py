@@ -24,6 +24,10 @@ class UoW:
         await self.session.begin()
         self._committed = False
 
+    async def rollback(self):
+        """Discard the current transaction; the next operation starts a new one."""
+        await self.session.rollback()
+
     async def savepoint(self):
         """Create a savepoint for partial rollbacks."""
         return self.session.begin_nested()
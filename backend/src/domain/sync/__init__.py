@@ -0,0 +1 @@
+from .schemas import RepositorySyncReport, RepositorySyncSchedule, SyncRunReport
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class RepositorySyncSchedule(BaseModel):
+    repo_id: UUID
+    project_id: int
+    project_key: str
+    repository_name: str
+    next_run_at: datetime | None = Field(None, description="When the next incremental sync is due; null means as soon as possible")
+    poll_interval_seconds: int | None = Field(None, description="Polling interval derived from recent commit activity")
+    last_completed_at: datetime | None = None
+    in_progress: bool = Field(False, description="A started run has not completed yet")
+
+
+class RepositorySyncReport(BaseModel):
+    repo_id: UUID
+    project_key: str
+    repository_name: str
+    status: Literal["completed", "failed"]
+    error: str | None = None
+    started_at: datetime
+    finished_at: datetime
+    pages: int = 0
+    commits: int = 0
+    commits_per_second: float = Field(0.0, description="Stored commits over the wall time of the run")
+    requests: int = 0
+    retries: int = 0
+    bytes_downloaded: int = 0
+    step_seconds: dict[str, float] = Field(
+        default_factory=dict,
+        description="Time per step: fetch_pages, fetch_diffs, decode, parse_diff, compress, upsert, aggregate_flush, commit",
+    )
+
+
+class SyncRunReport(BaseModel):
+    worker: str
+    started_at: datetime
+    finished_at: datetime
+    repositories: int = 0
+    failed: int = 0
+    commits: int = 0
+    commits_per_second: float = 0.0
+    requests: int = 0
+    retries: int = 0
+    bytes_downloaded: int = 0
+    step_seconds: dict[str, float] = Field(default_factory=dict, description="Step times summed over repositories")
+    items: list[RepositorySyncReport] = Field(default_factory=list)
+
+    @classmethod
+    def from_repositories(cls, worker: str, items: list[RepositorySyncReport]) -> SyncRunReport:
+        started_at = min(item.started_at for item in items)
+        finished_at = max(item.finished_at for item in items)
+        elapsed = (finished_at - started_at).total_seconds()
+        commits = sum(item.commits for item in items)
+
+        step_seconds: dict[str, float] = {}
+        for item in items:
+            for step, seconds in item.step_seconds.items():
+                step_seconds[step] = step_seconds.get(step, 0.0) + seconds
+
+        return cls(
+            worker=worker,
+            started_at=started_at,
+            finished_at=finished_at,
+            repositories=len(items),
+            failed=sum(1 for item in items if item.status == "failed"),
+            commits=commits,
+            commits_per_second=commits / elapsed if elapsed > 0 else 0.0,
+            requests=sum(item.requests for item in items),
+            retries=sum(item.retries for item in items),
+            bytes_downloaded=sum(item.bytes_downloaded for item in items),
+            step_seconds={step: round(seconds, 3) for step, seconds in step_seconds.items()},
+            items=items,
+        )
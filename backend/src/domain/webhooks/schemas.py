@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class PushEvent(BaseModel):
+    project: str = Field(..., description="Project key the repository belongs to")
+    repository: str = Field(..., description="Repository name")
+    ref: str | None = Field(None, description="Pushed ref, e.g. refs/heads/main")
+    after: str | None = Field(None, description="Head commit sha after the push")
+
+    @property
+    def branch(self) -> str | None:
+        if self.ref is None:
+            return None
+        return self.ref.removeprefix("refs/heads/")
+
+
+class PushEventAccepted(BaseModel):
+    queued: bool = Field(..., description="False when the repository is not known yet")
+    coalesced: bool = Field(False, description="Merged into a sync already queued by an earlier push")
+    repo_id: UUID | None = None
+    branch: str | None = None
+    next_run_at: datetime | None = None
@@ -1,6 +1,5 @@
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.base import STATE_RUNNING
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
 from starlette.middleware.cors import CORSMiddleware
@@ -10,29 +9,22 @@ from webhooks import get_webhooks
 from core.config import Settings, configure_logging
 from database.redis import get_redis
 from database.relational_db import wait_for_db
-from scheduler import init_scheduler
+from service.api_service import close_external_api_client
 
 
 config = Settings() # pyright: ignore[reportCallIssue]
 configure_logging()
-scheduler = init_scheduler(config.API_URL)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     redis = get_redis()
     try:
         await wait_for_db()
-        
-        if scheduler.state != STATE_RUNNING:
-            # scheduler.start()
-            pass
-            
         await FastAPILimiter.init(redis)
         yield
     finally:
         await redis.aclose()
-        if scheduler.state == STATE_RUNNING:
-            scheduler.shutdown()
+        await close_external_api_client()
 
 
 app = FastAPI(
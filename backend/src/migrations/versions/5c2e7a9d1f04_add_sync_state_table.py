@@ -0,0 +1,52 @@
+"""add sync state table
+
+Revision ID: 5c2e7a9d1f04
+Revises: 41ffcd3b898b
+Create Date: 2025-11-03 12:14:08.412907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e7a9d1f04'
+down_revision: Union[str, Sequence[str], None] = '41ffcd3b898b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_state',
+    sa.Column('repo_id', sa.Uuid(), nullable=False),
+    sa.Column('cursor', sa.Text(), nullable=True),
+    sa.Column('cursor_after', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('watermark', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('pending_watermark', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('pages', sa.Integer(), nullable=False),
+    sa.Column('commits', sa.Integer(), nullable=False),
+    sa.Column('run_started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['repo_id'], ['repositories.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('repo_id')
+    )
+
+    # Seed watermarks from already synced history so the first run does not start over
+    op.execute(
+        """
+        INSERT INTO sync_state (repo_id, watermark, pages, commits, last_completed_at)
+        SELECT repo_id, max(created_at), 0, 0, now()
+        FROM commits
+        GROUP BY repo_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sync_state')
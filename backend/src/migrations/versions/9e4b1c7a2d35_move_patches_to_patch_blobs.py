@@ -0,0 +1,153 @@
+"""move patches to patch blobs
+
+Revision ID: 9e4b1c7a2d35
+Revises: 5c2e7a9d1f04
+Create Date: 2025-11-05 16:40:21.118532
+
+"""
+import hashlib
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b1c7a2d35'
+down_revision: Union[str, Sequence[str], None] = '5c2e7a9d1f04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def _encode(text: str) -> dict:
+    raw = text.encode("utf-8", errors="replace")
+    data = zlib.compress(raw, 6)
+    codec = "zlib"
+    if len(data) >= len(raw):
+        codec, data = "none", raw
+    return {
+        "hash": hashlib.sha256(raw).hexdigest(),
+        "codec": codec,
+        "raw_size": len(raw),
+        "stored_size": len(data),
+        "data": data,
+    }
+
+
+def _decode(codec: str, data: bytes) -> str:
+    if codec == "zstd":
+        import zstandard
+
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "zlib":
+        raw = zlib.decompress(data)
+    else:
+        raw = data
+    return raw.decode("utf-8", errors="replace")
+
+
+def _move_text_to_blobs(table: str, key: str, text_column: str, hash_column: str) -> None:
+    bind = op.get_bind()
+    insert_blob = sa.text(
+        "INSERT INTO patch_blobs (hash, codec, raw_size, stored_size, data) "
+        "VALUES (:hash, :codec, :raw_size, :stored_size, :data) "
+        "ON CONFLICT (hash) DO NOTHING"
+    )
+    set_hash = sa.text(f"UPDATE {table} SET {hash_column} = :hash WHERE {key} = :key")
+
+    last_key = None
+    while True:
+        where = f"WHERE {text_column} IS NOT NULL"
+        if last_key is not None:
+            where += f" AND {key} > :last_key"
+        rows = bind.execute(
+            sa.text(f"SELECT {key}, {text_column} FROM {table} {where} ORDER BY {key} LIMIT :limit"),
+            {"last_key": last_key, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        blobs = {}
+        updates = []
+        for row_key, text in rows:
+            blob = _encode(text)
+            blobs[blob["hash"]] = blob
+            updates.append({"key": row_key, "hash": blob["hash"]})
+
+        bind.execute(insert_blob, [blobs[h] for h in sorted(blobs)])
+        bind.execute(set_hash, updates)
+        last_key = rows[-1][0]
+
+
+def _restore_text_from_blobs(table: str, key: str, text_column: str, hash_column: str) -> None:
+    bind = op.get_bind()
+    set_text = sa.text(f"UPDATE {table} SET {text_column} = :text WHERE {key} = :key")
+
+    last_key = None
+    while True:
+        where = f"WHERE t.{hash_column} IS NOT NULL"
+        if last_key is not None:
+            where += f" AND t.{key} > :last_key"
+        rows = bind.execute(
+            sa.text(
+                f"SELECT t.{key}, b.codec, b.data FROM {table} t "
+                f"JOIN patch_blobs b ON b.hash = t.{hash_column} "
+                f"{where} ORDER BY t.{key} LIMIT :limit"
+            ),
+            {"last_key": last_key, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            set_text,
+            [{"key": row_key, "text": _decode(codec, data)} for row_key, codec, data in rows],
+        )
+        last_key = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('patch_blobs',
+    sa.Column('hash', sa.String(length=64), nullable=False),
+    sa.Column('codec', sa.String(length=16), nullable=False),
+    sa.Column('raw_size', sa.Integer(), nullable=False),
+    sa.Column('stored_size', sa.Integer(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('hash')
+    )
+    op.add_column('commits', sa.Column('diff_hash', sa.String(length=64), nullable=True))
+    op.add_column('commit_files', sa.Column('patch_hash', sa.String(length=64), nullable=True))
+
+    _move_text_to_blobs('commits', 'sha', 'diff_content', 'diff_hash')
+    _move_text_to_blobs('commit_files', 'change_id', 'patch', 'patch_hash')
+
+    op.create_foreign_key(
+        'commits_diff_hash_fkey', 'commits', 'patch_blobs',
+        ['diff_hash'], ['hash'], ondelete='SET NULL',
+    )
+    op.create_foreign_key(
+        'commit_files_patch_hash_fkey', 'commit_files', 'patch_blobs',
+        ['patch_hash'], ['hash'], ondelete='SET NULL',
+    )
+    op.drop_column('commits', 'diff_content')
+    op.drop_column('commit_files', 'patch')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('commit_files', sa.Column('patch', sa.Text(), nullable=True))
+    op.add_column('commits', sa.Column('diff_content', sa.Text(), nullable=True))
+
+    _restore_text_from_blobs('commits', 'sha', 'diff_content', 'diff_hash')
+    _restore_text_from_blobs('commit_files', 'change_id', 'patch', 'patch_hash')
+
+    op.drop_constraint('commit_files_patch_hash_fkey', 'commit_files', type_='foreignkey')
+    op.drop_constraint('commits_diff_hash_fkey', 'commits', type_='foreignkey')
+    op.drop_column('commit_files', 'patch_hash')
+    op.drop_column('commits', 'diff_hash')
+    op.drop_table('patch_blobs')
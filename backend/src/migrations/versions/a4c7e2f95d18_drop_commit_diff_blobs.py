@@ -0,0 +1,39 @@
+"""drop commit diff blobs
+
+Revision ID: a4c7e2f95d18
+Revises: f3b8d2a61c47
+Create Date: 2025-11-18 15:06:44.219873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2f95d18'
+down_revision: Union[str, Sequence[str], None] = 'f3b8d2a61c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The full diff is rebuilt from the per-file patches, which hold the same text
+    op.drop_constraint('commits_diff_hash_fkey', 'commits', type_='foreignkey')
+    op.drop_column('commits', 'diff_hash')
+    op.execute(
+        "DELETE FROM patch_blobs b "
+        "WHERE NOT EXISTS (SELECT 1 FROM commit_files f WHERE f.patch_hash = b.hash)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Deleted commit-level blobs are not restored; the column comes back empty
+    op.add_column('commits', sa.Column('diff_hash', sa.String(length=64), nullable=True))
+    op.create_foreign_key(
+        'commits_diff_hash_fkey', 'commits', 'patch_blobs',
+        ['diff_hash'], ['hash'], ondelete='SET NULL',
+    )
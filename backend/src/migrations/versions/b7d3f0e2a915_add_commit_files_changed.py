@@ -0,0 +1,40 @@
+"""add commit files changed
+
+Revision ID: b7d3f0e2a915
+Revises: 9e4b1c7a2d35
+Create Date: 2025-11-07 11:02:37.540219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3f0e2a915'
+down_revision: Union[str, Sequence[str], None] = '9e4b1c7a2d35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('commits', sa.Column('files_changed', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE commits c
+        SET files_changed = f.cnt
+        FROM (
+            SELECT commit_sha, count(*) AS cnt
+            FROM commit_files
+            GROUP BY commit_sha
+        ) f
+        WHERE f.commit_sha = c.sha
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('commits', 'files_changed')
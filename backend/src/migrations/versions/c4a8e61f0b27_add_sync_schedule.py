@@ -0,0 +1,61 @@
+"""add sync schedule
+
+Revision ID: c4a8e61f0b27
+Revises: b7d3f0e2a915
+Create Date: 2025-11-10 09:27:45.302716
+
+"""
+from typing import Sequence, Union
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8e61f0b27'
+down_revision: Union[str, Sequence[str], None] = 'b7d3f0e2a915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sync_state', sa.Column('poll_interval_seconds', sa.Integer(), nullable=True))
+    op.add_column('sync_state', sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('idx_sync_state_next_run_at', 'sync_state', ['next_run_at'], unique=False)
+
+    permissions_table = sa.table(
+        "permissions",
+        sa.column("id", sa.Uuid()),
+        sa.column("slug", sa.String()),
+        sa.column("name", sa.String()),
+        sa.column("description", sa.Text()),
+    )
+    permission_id = uuid4()
+    op.bulk_insert(
+        permissions_table,
+        [
+            {
+                "id": permission_id,
+                "slug": "sync.read",
+                "name": "Read sync status",
+                "description": "View the repository sync schedule",
+            },
+        ],
+    )
+    op.get_bind().execute(
+        sa.text(
+            "INSERT INTO role_permissions (role_id, permission_id) "
+            "SELECT id, :permission_id FROM roles WHERE slug = 'admin'"
+        ),
+        {"permission_id": str(permission_id)}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM permissions WHERE slug = 'sync.read'")
+    op.drop_index('idx_sync_state_next_run_at', table_name='sync_state')
+    op.drop_column('sync_state', 'next_run_at')
+    op.drop_column('sync_state', 'poll_interval_seconds')
@@ -0,0 +1,28 @@
+"""add sync push requests
+
+Revision ID: d2f95b3c8e60
+Revises: c4a8e61f0b27
+Create Date: 2025-11-11 14:52:09.816344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f95b3c8e60'
+down_revision: Union[str, Sequence[str], None] = 'c4a8e61f0b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sync_state', sa.Column('push_requested_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('sync_state', 'push_requested_at')
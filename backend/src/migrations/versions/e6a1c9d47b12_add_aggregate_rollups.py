@@ -0,0 +1,131 @@
+"""add aggregate rollups
+
+Revision ID: e6a1c9d47b12
+Revises: d2f95b3c8e60
+Create Date: 2025-11-14 10:21:37.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a1c9d47b12'
+down_revision: Union[str, Sequence[str], None] = 'd2f95b3c8e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+rollup_grain = postgresql.ENUM('WEEK', 'MONTH', name='rollup_grain', create_type=False)
+size_bucket = postgresql.ENUM(
+    'ZERO_TEN', 'ELEVEN_FIFTY', 'FIFTY_ONE_HUNDRED', 'HUNDRED_PLUS', name='size_bucket', create_type=False,
+)
+
+# Daily table, rollup table, grouping key columns and summed columns
+ROLLUPS = (
+    ('agg_author_repo_day', 'agg_author_repo_period', ('repo_id', 'author_id'),
+     ('commits', 'lines_added', 'lines_deleted', 'files_changed', 'msg_total_len', 'msg_short_count')),
+    ('agg_hour_repo_day', 'agg_hour_repo_period', ('repo_id', 'hour'),
+     ('commits', 'lines_added', 'lines_deleted')),
+    ('agg_size_bucket_repo_day', 'agg_size_bucket_repo_period', ('repo_id', 'bucket'), ('cnt',)),
+    ('agg_file_repo_day', 'agg_file_repo_period', ('repo_id', 'path'),
+     ('commits_touch', 'lines_added', 'lines_deleted', 'churn')),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    rollup_grain.create(op.get_bind(), checkfirst=True)
+
+    op.create_table('agg_author_repo_period',
+    sa.Column('grain', rollup_grain, nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('repo_id', sa.Uuid(), nullable=False),
+    sa.Column('author_id', sa.Uuid(), nullable=False),
+    sa.Column('commits', sa.Integer(), nullable=False),
+    sa.Column('lines_added', sa.Integer(), nullable=False),
+    sa.Column('lines_deleted', sa.Integer(), nullable=False),
+    sa.Column('files_changed', sa.Integer(), nullable=False),
+    sa.Column('msg_total_len', sa.Integer(), nullable=False),
+    sa.Column('msg_short_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['authors.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['repo_id'], ['repositories.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('grain', 'period_start', 'repo_id', 'author_id')
+    )
+    op.create_index('idx_arp_author_period', 'agg_author_repo_period', ['author_id', 'grain', 'period_start'], unique=False)
+    op.create_index('idx_arp_project_period', 'agg_author_repo_period', ['project_id', 'grain', 'period_start'], unique=False)
+    op.create_table('agg_hour_repo_period',
+    sa.Column('grain', rollup_grain, nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('repo_id', sa.Uuid(), nullable=False),
+    sa.Column('hour', sa.SmallInteger(), nullable=False, comment='Hour of the day (0-23)'),
+    sa.Column('commits', sa.Integer(), nullable=False),
+    sa.Column('lines_added', sa.Integer(), nullable=False),
+    sa.Column('lines_deleted', sa.Integer(), nullable=False),
+    sa.CheckConstraint('hour >= 0 AND hour < 24', name='ck_agg_hour_period_valid_range'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['repo_id'], ['repositories.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('grain', 'period_start', 'repo_id', 'hour')
+    )
+    op.create_index('idx_ahrp_project_period', 'agg_hour_repo_period', ['project_id', 'grain', 'period_start'], unique=False)
+    op.create_table('agg_size_bucket_repo_period',
+    sa.Column('grain', rollup_grain, nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('repo_id', sa.Uuid(), nullable=False),
+    sa.Column('bucket', size_bucket, nullable=False),
+    sa.Column('cnt', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['repo_id'], ['repositories.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('grain', 'period_start', 'repo_id', 'bucket')
+    )
+    op.create_index('idx_asbrp_project_period', 'agg_size_bucket_repo_period', ['project_id', 'grain', 'period_start'], unique=False)
+    op.create_table('agg_file_repo_period',
+    sa.Column('grain', rollup_grain, nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('repo_id', sa.Uuid(), nullable=False),
+    sa.Column('path', sa.Text(), nullable=False),
+    sa.Column('commits_touch', sa.Integer(), nullable=False),
+    sa.Column('lines_added', sa.Integer(), nullable=False),
+    sa.Column('lines_deleted', sa.Integer(), nullable=False),
+    sa.Column('churn', sa.Integer(), nullable=False, comment='added+deleted'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['repo_id'], ['repositories.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('grain', 'period_start', 'repo_id', 'path')
+    )
+    op.create_index('idx_afrp_project_period', 'agg_file_repo_period', ['project_id', 'grain', 'period_start'], unique=False)
+
+    # Backfill from the daily rows; from here on the upserts keep both in step.
+    # A repository only ever belongs to one project, so project_id is carried by max()
+    for day_table, period_table, keys, sums in ROLLUPS:
+        columns = ', '.join(keys + sums)
+        summed = ', '.join(f'sum({name})' for name in sums)
+        grouped = ', '.join(keys)
+        for grain, field in (('WEEK', 'week'), ('MONTH', 'month')):
+            op.execute(
+                f"INSERT INTO {period_table} (grain, period_start, project_id, {columns}) "
+                f"SELECT '{grain}', date_trunc('{field}', day)::date, max(project_id), {grouped}, {summed} "
+                f"FROM {day_table} "
+                f"GROUP BY date_trunc('{field}', day)::date, {grouped}"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_afrp_project_period', table_name='agg_file_repo_period')
+    op.drop_table('agg_file_repo_period')
+    op.drop_index('idx_asbrp_project_period', table_name='agg_size_bucket_repo_period')
+    op.drop_table('agg_size_bucket_repo_period')
+    op.drop_index('idx_ahrp_project_period', table_name='agg_hour_repo_period')
+    op.drop_table('agg_hour_repo_period')
+    op.drop_index('idx_arp_project_period', table_name='agg_author_repo_period')
+    op.drop_index('idx_arp_author_period', table_name='agg_author_repo_period')
+    op.drop_table('agg_author_repo_period')
+    rollup_grain.drop(op.get_bind(), checkfirst=True)
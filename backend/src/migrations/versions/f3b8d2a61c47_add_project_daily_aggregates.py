@@ -0,0 +1,104 @@
+"""add project daily aggregates
+
+Revision ID: f3b8d2a61c47
+Revises: e6a1c9d47b12
+Create Date: 2025-11-17 09:42:15.730264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2a61c47'
+down_revision: Union[str, Sequence[str], None] = 'e6a1c9d47b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+size_bucket = postgresql.ENUM(
+    'ZERO_TEN', 'ELEVEN_FIFTY', 'FIFTY_ONE_HUNDRED', 'HUNDRED_PLUS', name='size_bucket', create_type=False,
+)
+
+# Per-repository table, project table, grouping key columns and summed columns
+PROJECT_TABLES = (
+    ('agg_author_repo_day', 'agg_author_project_day', ('author_id',),
+     ('commits', 'lines_added', 'lines_deleted', 'files_changed', 'msg_total_len', 'msg_short_count')),
+    ('agg_hour_repo_day', 'agg_hour_project_day', ('hour',), ('commits', 'lines_added', 'lines_deleted')),
+    ('agg_size_bucket_repo_day', 'agg_size_bucket_project_day', ('bucket',), ('cnt',)),
+    ('agg_file_repo_day', 'agg_file_project_day', ('path',),
+     ('commits_touch', 'lines_added', 'lines_deleted', 'churn')),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('agg_author_project_day',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('author_id', sa.Uuid(), nullable=False),
+    sa.Column('commits', sa.Integer(), nullable=False),
+    sa.Column('lines_added', sa.Integer(), nullable=False),
+    sa.Column('lines_deleted', sa.Integer(), nullable=False),
+    sa.Column('files_changed', sa.Integer(), nullable=False),
+    sa.Column('msg_total_len', sa.Integer(), nullable=False),
+    sa.Column('msg_short_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['authors.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'day', 'author_id')
+    )
+    op.create_index('idx_apd_author_day', 'agg_author_project_day', ['author_id', 'day'], unique=False)
+    op.create_table('agg_hour_project_day',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('hour', sa.SmallInteger(), nullable=False, comment='Hour of the day (0-23)'),
+    sa.Column('commits', sa.Integer(), nullable=False),
+    sa.Column('lines_added', sa.Integer(), nullable=False),
+    sa.Column('lines_deleted', sa.Integer(), nullable=False),
+    sa.CheckConstraint('hour >= 0 AND hour < 24', name='ck_agg_hour_project_valid_range'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'day', 'hour')
+    )
+    op.create_table('agg_size_bucket_project_day',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('bucket', size_bucket, nullable=False),
+    sa.Column('cnt', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'day', 'bucket')
+    )
+    op.create_table('agg_file_project_day',
+    sa.Column('project_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('path', sa.Text(), nullable=False),
+    sa.Column('commits_touch', sa.Integer(), nullable=False),
+    sa.Column('lines_added', sa.Integer(), nullable=False),
+    sa.Column('lines_deleted', sa.Integer(), nullable=False),
+    sa.Column('churn', sa.Integer(), nullable=False, comment='added+deleted'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'day', 'path')
+    )
+
+    # Backfill from the per-repository rows; the upserts keep both in step afterwards
+    for repo_table, project_table, keys, sums in PROJECT_TABLES:
+        columns = ', '.join(keys + sums)
+        summed = ', '.join(f'sum({name})' for name in sums)
+        grouped = ', '.join(keys)
+        op.execute(
+            f"INSERT INTO {project_table} (project_id, day, {columns}) "
+            f"SELECT project_id, day, {grouped}, {summed} "
+            f"FROM {repo_table} "
+            f"GROUP BY project_id, day, {grouped}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('agg_file_project_day')
+    op.drop_table('agg_size_bucket_project_day')
+    op.drop_table('agg_hour_project_day')
+    op.drop_index('idx_apd_author_day', table_name='agg_author_project_day')
+    op.drop_table('agg_author_project_day')
@@ -1,35 +1,45 @@
-import logging
 from datetime import datetime, timedelta, UTC
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from .parsing import run_initial_projects_sync
-
-
-logger = logging.getLogger(__name__)
+from core.config import config
+from .incremental import IncrementalSyncRunner
 
 
 def init_scheduler(
-    api_base_url: str,
+    runner: IncrementalSyncRunner,
 ) -> AsyncIOScheduler:
     scheduler = AsyncIOScheduler()
-    if not api_base_url:
-        logger.warning(
-            "External API base URL is not configured; skipping initial sync job registration"
-        )
-        return scheduler
 
     scheduler.add_job(
-        func=run_initial_projects_sync,
+        func=runner.run_discovery,
         trigger="date",
         run_date=datetime.now(UTC) + timedelta(seconds=3),
         id="external-api-initial-sync",
-        kwargs={
-            "base_url": api_base_url,
-        },
         misfire_grace_time=60,
         coalesce=True,
         max_instances=1,
         replace_existing=True,
     )
+    # Picks up projects and repositories created upstream since the last run
+    scheduler.add_job(
+        func=runner.run_discovery,
+        trigger="interval",
+        hours=config.SYNC_DISCOVERY_INTERVAL_HOURS,
+        jitter=600,
+        id="external-api-discovery-sync",
+        coalesce=True,
+        max_instances=1,
+        replace_existing=True,
+    )
+    # Each repository is synced on its own activity-based cadence (see SyncCadence)
+    scheduler.add_job(
+        func=runner.dispatch_due,
+        trigger="interval",
+        seconds=config.SYNC_DISPATCH_INTERVAL_SECONDS,
+        id="external-api-incremental-sync",
+        coalesce=True,
+        max_instances=1,
+        replace_existing=True,
+    )
     return scheduler
@@ -0,0 +1,261 @@
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Collection, Iterable
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from database.redis import SyncLeaseRepo, SyncReportRepo, get_redis
+from database.relational_db.session import async_session
+from database.relational_db import (
+    RepositoryInterface,
+    ScheduledRepository,
+    SyncStateInterface,
+    UoW,
+)
+from domain.sync import RepositorySyncReport, SyncRunReport
+from service.api_service import ExternalAPIError, get_external_api_client
+
+from .parsing import build_sync_cadence, build_sync_service
+
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLost(Exception):
+    """The lease expired or was taken over while its holder was still working."""
+
+
+class IncrementalSyncRunner:
+    """
+    Runs incremental repository syncs across replicas through Redis leases.
+
+    On each dispatch one replica, holding the short feeder lease, queues the
+    repositories whose `next_run_at` has passed; every replica then claims as
+    many queued repositories as it has free slots. A claimed repository is
+    leased to its replica and the lease is renewed while the sync runs, so a
+    repository is never synced twice at once. When a replica dies its leases
+    expire, its repositories are still due in the database and get queued and
+    claimed by the others, resuming from the stored cursor.
+
+    At most `project_concurrency` repositories of one project sync at once on
+    a replica, so a large project cannot take every slot and its upstream
+    rate limit is not hit by all of them together.
+    """
+
+    DISCOVERY_LEASE = "discovery"
+    FEEDER_LEASE = "feeder"
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        lease_ttl: timedelta,
+        dispatch_interval: timedelta,
+        feed_batch: int,
+        project_concurrency: int = 1,
+        diff_concurrency: int | None = None,
+        leases: SyncLeaseRepo | None = None,
+        reports: SyncReportRepo | None = None,
+    ) -> None:
+        self._concurrency = max(concurrency, 1)
+        self._project_concurrency = max(project_concurrency, 1)
+        self._project_slots: dict[str, asyncio.Semaphore] = {}
+        self._diff_concurrency = diff_concurrency
+        self._lease_ttl_ms = int(lease_ttl.total_seconds() * 1000)
+        self._dispatch_interval_ms = int(dispatch_interval.total_seconds() * 1000)
+        self._feed_batch = feed_batch
+        self._cadence = build_sync_cadence()
+        self._leases = leases or SyncLeaseRepo(
+            get_redis(), f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        )
+        self._reports = reports or SyncReportRepo(get_redis())
+        self._running: dict[UUID, asyncio.Task[None]] = {}
+
+    async def run_discovery(self, project_keys: Collection[str] | None = None) -> None:
+        """Pick up projects and repositories created upstream; one replica at a time."""
+        if not await self._leases.acquire(self.DISCOVERY_LEASE, self._lease_ttl_ms):
+            logger.info("Discovery is already running on another worker")
+            return
+        try:
+            async with async_session() as session:
+                async with UoW(session) as uow:
+                    service = build_sync_service(
+                        get_external_api_client(), uow, diff_concurrency=self._diff_concurrency,
+                    )
+                    await self._with_heartbeat(
+                        self.DISCOVERY_LEASE, service.discover_repositories(project_keys)
+                    )
+        finally:
+            await self._leases.release(self.DISCOVERY_LEASE)
+
+    async def sync_now(self, entries: Iterable[ScheduledRepository]) -> None:
+        """
+        Sync the given repositories once, whether due or not.
+
+        Repositories leased by another replica are skipped, they are being
+        synced already.
+        """
+        slots = asyncio.Semaphore(self._concurrency)
+        reports: list[RepositorySyncReport] = []
+
+        async def run(entry: ScheduledRepository) -> None:
+            async with slots:
+                if not await self._leases.acquire(str(entry.repo_id), self._lease_ttl_ms):
+                    logger.info(
+                        "Skipping %s/%s, another worker is syncing it",
+                        entry.project_key, entry.repository_name,
+                    )
+                    return
+                await self._sync_leased(entry, reports)
+
+        await asyncio.gather(*(run(entry) for entry in entries))
+        await self._publish(reports)
+
+    async def close(self) -> None:
+        """Cancel in-flight syncs; their leases are released for other replicas."""
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def dispatch_due(self) -> None:
+        now = datetime.now(UTC)
+        await self._feed_queue(now)
+
+        claimed = await self._leases.claim(
+            now, self._concurrency - len(self._running), self._lease_ttl_ms,
+        )
+        if not claimed:
+            return
+
+        async with async_session() as session:
+            entries = await SyncStateInterface(session).list_schedule(repo_ids=claimed)
+        found = {entry.repo_id for entry in entries}
+        for repo_id in claimed:
+            if repo_id not in found:
+                await self._leases.release(str(repo_id))
+
+        for entry in entries:
+            task = asyncio.create_task(self._sync_repository(entry))
+            self._running[entry.repo_id] = task
+            task.add_done_callback(
+                lambda _, repo_id=entry.repo_id: self._running.pop(repo_id, None)
+            )
+
+    async def _feed_queue(self, now: datetime) -> None:
+        # The feeder lease is left to expire, so at most one replica feeds per dispatch interval
+        if not await self._leases.acquire(self.FEEDER_LEASE, self._dispatch_interval_ms):
+            return
+        async with async_session() as session:
+            due = await SyncStateInterface(session).list_schedule(
+                due_before=now, limit=self._feed_batch,
+            )
+        await self._leases.enqueue(
+            (entry.repo_id, entry.next_run_at or now) for entry in due
+        )
+
+    async def _sync_repository(self, entry: ScheduledRepository) -> None:
+        reports: list[RepositorySyncReport] = []
+        await self._sync_leased(entry, reports)
+        await self._publish(reports)
+
+    async def _sync_leased(
+        self,
+        entry: ScheduledRepository,
+        reports: list[RepositorySyncReport],
+    ) -> None:
+        lease = str(entry.repo_id)
+        label = f"{entry.project_key}/{entry.repository_name}"
+        try:
+            await self._with_heartbeat(lease, self._run_sync(entry, reports))
+        except LeaseLost:
+            # Another replica owns the repository now and resumes from the last checkpoint
+            logger.warning("Lost the sync lease of repository %s; abandoning the run", label)
+        except ExternalAPIError as exc:
+            logger.error("Failed to sync repository %s: %s", label, exc)
+            await self._postpone(entry, label)
+        except asyncio.CancelledError:
+            logger.warning("Sync of repository %s was cancelled", label)
+            raise
+        except Exception:
+            logger.exception("Unexpected error while syncing repository %s", label)
+            await self._postpone(entry, label)
+        finally:
+            await self._leases.release(lease)
+
+    async def _postpone(self, entry: ScheduledRepository, label: str) -> None:
+        """
+        Move a failed repository to the shortest interval instead of every dispatch tick.
+
+        Runs while the lease is still held, so no other replica claims the
+        repository before its retry time is stored. A successful run schedules
+        itself.
+        """
+        try:
+            async with async_session() as session:
+                async with UoW(session):
+                    await SyncStateInterface(session).postpone(
+                        entry.repo_id, self._cadence.retry_at()
+                    )
+        except Exception:
+            logger.exception("Failed to postpone sync of repository %s", label)
+
+    async def _run_sync(
+        self,
+        entry: ScheduledRepository,
+        reports: list[RepositorySyncReport],
+    ) -> None:
+        # Waited for under the lease heartbeat, so a queued repository keeps its lease
+        async with self._project_slot(entry.project_key), async_session() as session:
+            async with UoW(session) as uow:
+                repository = await RepositoryInterface(session).get_for_sync(entry.repo_id)
+                if repository is None:
+                    return
+                service = build_sync_service(
+                    get_external_api_client(), uow, diff_concurrency=self._diff_concurrency,
+                )
+                try:
+                    await service.sync_repository(entry.project_key, repository)
+                finally:
+                    reports.extend(service.reports())
+
+    def _project_slot(self, project_key: str) -> asyncio.Semaphore:
+        slot = self._project_slots.get(project_key)
+        if slot is None:
+            slot = self._project_slots[project_key] = asyncio.Semaphore(self._project_concurrency)
+        return slot
+
+    async def _publish(self, reports: list[RepositorySyncReport]) -> None:
+        """Store the run report for the admin endpoint; a Redis hiccup must not fail the sync."""
+        if not reports:
+            return
+        run = SyncRunReport.from_repositories(self._leases.owner, reports)
+        logger.info(
+            "Sync run: %d repositories (%d failed), %d commits, %.1f commits/s, %d requests, %d retries, %d bytes",
+            run.repositories, run.failed, run.commits, run.commits_per_second,
+            run.requests, run.retries, run.bytes_downloaded,
+        )
+        try:
+            await self._reports.save(
+                run.model_dump_json(),
+                {report.repo_id: report.model_dump_json() for report in reports},
+            )
+        except Exception:
+            logger.exception("Failed to store sync report")
+
+    async def _with_heartbeat(self, lease: str, work: Awaitable[None]) -> None:
+        """Await `work` while renewing `lease`; the work is cancelled if the lease is lost."""
+        task = asyncio.ensure_future(work)
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self._lease_ttl_ms / 3000)
+                if done:
+                    return task.result()
+                if not await self._leases.renew(lease, self._lease_ttl_ms):
+                    raise LeaseLost(lease)
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
@@ -1,37 +1,41 @@
 import logging
+from datetime import timedelta
 
-from database.relational_db.session import async_session
+from core.config import config
 from database.relational_db import UoW
 from service.api_service import (
     ExternalAPIClient,
-    ExternalAPIError,
     SourceCodeSyncService,
+    SyncCadence,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
-async def run_initial_projects_sync(
-    base_url: str,
-) -> None:
-    if not base_url:
-        logger.warning("External API base URL is empty; skipping projects sync")
-        return
+def build_sync_cadence() -> SyncCadence:
+    return SyncCadence(
+        min_interval=timedelta(seconds=config.SYNC_MIN_INTERVAL_SECONDS),
+        max_interval=timedelta(seconds=config.SYNC_MAX_INTERVAL_SECONDS),
+        activity_window_days=config.SYNC_ACTIVITY_WINDOW_DAYS,
+        jitter=config.SYNC_INTERVAL_JITTER,
+        push_debounce=timedelta(seconds=config.SYNC_PUSH_DEBOUNCE_SECONDS),
+    )
+
 
-    client = ExternalAPIClient(
-        base_url=base_url,
+def build_sync_service(
+    client: ExternalAPIClient,
+    uow: UoW,
+    *,
+    diff_concurrency: int | None = None,
+) -> SourceCodeSyncService:
+    return SourceCodeSyncService(
+        client=client,
+        uow=uow,
+        diff_concurrency=diff_concurrency or config.SYNC_DIFF_CONCURRENCY,
+        pipeline_depth=config.SYNC_PIPELINE_DEPTH,
+        checkpoint_pages=config.SYNC_CHECKPOINT_PAGES,
+        aggregate_flush_keys=config.SYNC_AGGREGATE_FLUSH_KEYS,
+        cadence=build_sync_cadence(),
     )
 
-    async with async_session() as session:
-        async with UoW(session) as uow:
-            sync_service = SourceCodeSyncService(client=client, uow=uow)
-
-            try:
-                await sync_service.sync_all()
-            except ExternalAPIError as exc:
-                logger.error("External API returned invalid response: %s", exc)
-                raise
-            except Exception:
-                logger.exception("Unexpected error while syncing external data")
-                raise
@@ -0,0 +1,144 @@
+"""
+Sync worker, run separately from the API:
+
+    python -m scheduler.worker                         # daemon, activity-based incremental syncs
+    python -m scheduler.worker --once                  # discover, then sync every repository once
+    python -m scheduler.worker --once --due            # only repositories that are due now
+    python -m scheduler.worker --once --project KEY --repository KEY/NAME
+
+Workers coordinate through Redis leases, so any number of them can run at once.
+"""
+import argparse
+import asyncio
+import logging
+import signal
+from datetime import UTC, datetime, timedelta
+
+from core.config import config, configure_logging
+from database.redis import get_redis
+from database.relational_db import SyncStateInterface, wait_for_db
+from database.relational_db.session import async_session
+from service.api_service import close_external_api_client, get_external_api_client
+
+from . import init_scheduler
+from .incremental import IncrementalSyncRunner
+
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m scheduler.worker",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--once", action="store_true",
+        help="run a single pass over the selected repositories and exit instead of running as a daemon",
+    )
+    parser.add_argument(
+        "--due", action="store_true",
+        help="with --once, sync only repositories whose next run is due",
+    )
+    parser.add_argument(
+        "--project", action="append", dest="projects", metavar="KEY",
+        help="with --once, limit the pass to this project (repeatable)",
+    )
+    parser.add_argument(
+        "--repository", action="append", dest="repositories", metavar="PROJECT/NAME",
+        help="with --once, limit the pass to this repository (repeatable)",
+    )
+    parser.add_argument(
+        "--skip-discovery", action="store_true",
+        help="with --once, do not look for new projects and repositories first",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=config.SYNC_REPO_CONCURRENCY,
+        help="repositories synced at once by this worker (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--diff-concurrency", type=int, default=config.SYNC_DIFF_CONCURRENCY,
+        help="diff requests in flight per repository (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.once and (args.due or args.projects or args.repositories or args.skip_discovery):
+        parser.error("--due, --project, --repository and --skip-discovery require --once")
+    for repository in args.repositories or ():
+        if repository.count("/") != 1:
+            parser.error(f"--repository expects PROJECT/NAME, got {repository!r}")
+    return args
+
+
+async def run_once(runner: IncrementalSyncRunner, args: argparse.Namespace) -> None:
+    projects = set(args.projects or ())
+    repositories = {tuple(repository.split("/")) for repository in args.repositories or ()}
+    project_keys = projects | {project_key for project_key, _ in repositories}
+
+    if not args.skip_discovery:
+        await runner.run_discovery(project_keys or None)
+
+    async with async_session() as session:
+        entries = await SyncStateInterface(session).list_schedule(
+            due_before=datetime.now(UTC) if args.due else None,
+            project_keys=project_keys or None,
+        )
+    if repositories:
+        entries = [
+            entry for entry in entries
+            if entry.project_key in projects
+            or (entry.project_key, entry.repository_name) in repositories
+        ]
+
+    logger.info("Syncing %d repositories", len(entries))
+    await runner.sync_now(entries)
+    logger.info("External API pool stats after sync: %s", get_external_api_client().pool_stats())
+
+
+async def run_daemon(runner: IncrementalSyncRunner) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    scheduler = init_scheduler(runner)
+    scheduler.start()
+    logger.info("Sync worker started")
+    try:
+        await stop.wait()
+    finally:
+        scheduler.shutdown(wait=False)
+        await runner.close()
+        logger.info("Sync worker stopped")
+
+
+async def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    if not config.API_URL:
+        logger.warning("External API base URL is not configured; nothing to sync")
+        return
+
+    await wait_for_db()
+    runner = IncrementalSyncRunner(
+        concurrency=args.concurrency,
+        lease_ttl=timedelta(seconds=config.SYNC_LEASE_TTL_SECONDS),
+        dispatch_interval=timedelta(seconds=config.SYNC_DISPATCH_INTERVAL_SECONDS),
+        feed_batch=config.SYNC_QUEUE_FEED_BATCH,
+        project_concurrency=config.SYNC_PROJECT_REPO_CONCURRENCY,
+        diff_concurrency=args.diff_concurrency,
+    )
+    redis = get_redis()
+    try:
+        if args.once:
+            await run_once(runner, args)
+        else:
+            await run_daemon(runner)
+    finally:
+        await redis.aclose()
+        await close_external_api_client()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
@@ -490,7 +490,9 @@ async def seed_database() -> None:
                     "TRUNCATE TABLE "
                     "role_permissions, user_roles, permissions, roles, users, languages, "
                     "commit_files, commits, branches, repositories, projects, authors, "
-                    "agg_author_repo_day, agg_hour_repo_day, agg_size_bucket_repo_day, agg_file_repo_day "
+                    "agg_author_repo_day, agg_hour_repo_day, agg_size_bucket_repo_day, agg_file_repo_day, "
+                    "agg_author_repo_period, agg_hour_repo_period, agg_size_bucket_repo_period, agg_file_repo_period, "
+                    "agg_author_project_day, agg_hour_project_day, agg_size_bucket_project_day, agg_file_project_day "
                     "RESTART IDENTITY CASCADE"
                 )
             )
@@ -768,7 +770,6 @@ async def seed_database() -> None:
                     file_churns = _split_churn(repo_rand, churn, len(file_paths))
 
                     files_payload: list[CommitFilePayload] = []
-                    patches: list[str] = []
                     total_added = 0
                     total_deleted = 0
 
@@ -785,8 +786,6 @@ async def seed_database() -> None:
 
                         binary_flag = _is_binary(path)
                         patch = None if binary_flag else _build_patch(path, added, deleted)
-                        if patch:
-                            patches.append(patch)
 
                         files_payload.append(
                             CommitFilePayload(
@@ -799,12 +798,9 @@ async def seed_database() -> None:
                             )
                         )
 
-                    diff_content = "\n\n".join(patches)
-
                     await commit_files_repo.replace_for_commit(sha, files_payload)
                     await commit_repo.apply_diff_stats(
                         commit,
-                        diff_content=diff_content,
                         added_lines=total_added,
                         deleted_lines=total_deleted,
                         files_changed=len(files_payload),
@@ -887,6 +883,7 @@ async def seed_database() -> None:
             await aggregates.upsert_size_buckets(size_deltas)
         if file_deltas:
             await aggregates.upsert_hot_files(file_deltas)
+        await aggregates.flush_project_days()
 
         await session.commit()
 
@@ -1,11 +1,13 @@
 from fastapi import Depends
 
+from core.config import config
 from database.relational_db import (
     AggregateMetricsInterface,
     CommitInterface,
     UoW,
     get_uow,
 )
+from database.relational_db.session import async_session
 
 from .service import AggregatedMetricsService
 
@@ -16,7 +18,14 @@ async def get_aggregated_metrics_service(
     session = uow.session
     aggregates = AggregateMetricsInterface(session)
     commits = CommitInterface(session)
-    return AggregatedMetricsService(uow, aggregates, commits)
+    return AggregatedMetricsService(
+        uow,
+        aggregates,
+        commits,
+        read_sessions=async_session,
+        query_mode=config.METRICS_QUERY_MODE,
+        read_concurrency=config.METRICS_READ_CONCURRENCY,
+    )
 
 
 __all__ = ["AggregatedMetricsService", "get_aggregated_metrics_service"]
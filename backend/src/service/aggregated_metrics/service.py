@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, time
-from typing import Sequence
+from typing import Any, Literal, Sequence
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
 from database.relational_db import (
     AggregateMetricsInterface,
     AggregationFilter,
     CommitInterface,
+    DashboardAggregates,
     HotFileRow,
     KPIResult,
     MessageQualityStats,
@@ -50,6 +55,9 @@ class _FilterParams:
     author_ids: Sequence[UUID] | None
 
 
+_AggregateRead = Callable[[AggregateMetricsInterface], Awaitable[Any]]
+
+
 class AggregatedMetricsService:
     WORKING_HOURS = set(range(9, 19))
 
@@ -58,10 +66,18 @@ class AggregatedMetricsService:
         uow: UoW,
         aggregates: AggregateMetricsInterface,
         commits: CommitInterface,
+        *,
+        read_sessions: async_sessionmaker[AsyncSession] | None = None,
+        query_mode: Literal["fused", "parallel", "sequential"] = "fused",
+        read_concurrency: int = 4,
     ) -> None:
         self._uow = uow
         self._aggregates = aggregates
         self._commits = commits
+        # Parallel reads need sessions of their own; without a factory they run sequentially
+        self._read_sessions = read_sessions
+        self._query_mode = query_mode
+        self._read_concurrency = max(read_concurrency, 1)
 
     async def get_dashboard_summary(
         self,
@@ -71,15 +87,15 @@ class AggregatedMetricsService:
     ) -> DashboardSummary:
         agg_filter = self._build_filter(params)
 
-        # NOTE: AsyncSession does not allow concurrent operations.
-        kpi = await self._aggregates.get_kpis(agg_filter)
-        message_quality = await self._aggregates.get_message_quality(agg_filter)
-        size_stats = await self._aggregates.get_size_histogram(agg_filter)
-        daily_points = await self._aggregates.get_daily_commit_series(agg_filter)
-        hour_points = await self._aggregates.get_hourly_heatmap(agg_filter)
-        weekday_points = await self._aggregates.get_weekday_heatmap(agg_filter)
-        top_authors = await self._aggregates.get_top_authors(agg_filter, limit=10)
-        hot_files = await self._aggregates.get_hot_files(agg_filter, limit=3)
+        dashboard = await self._load_dashboard(agg_filter, top_authors_limit=10, hot_files_limit=3)
+        kpi = dashboard.kpi
+        message_quality = dashboard.message_quality
+        size_stats = dashboard.size_stats
+        daily_points = dashboard.daily
+        hour_points = dashboard.hourly
+        weekday_points = dashboard.weekday
+        top_authors = dashboard.top_authors
+        hot_files = dashboard.hot_files
 
         series = DashboardSeries(
             commits_daily=[CommitSeriesPoint(date=p.day, count=p.commits) for p in daily_points],
@@ -158,11 +174,12 @@ class AggregatedMetricsService:
 
     async def get_developers_summary(self, *, params: _FilterParams) -> DevelopersSummary:
         agg_filter = self._build_filter(params)
-        # NOTE: AsyncSession does not allow concurrent operations.
-        kpi = await self._aggregates.get_kpis(agg_filter)
-        message_quality = await self._aggregates.get_message_quality(agg_filter)
-        size_stats = await self._aggregates.get_size_histogram(agg_filter)
-        top_authors = await self._aggregates.get_top_authors(agg_filter, limit=50)
+        kpi, message_quality, size_stats, top_authors = await self._read_aggregates(
+            lambda aggregates: aggregates.get_kpis(agg_filter),
+            lambda aggregates: aggregates.get_message_quality(agg_filter),
+            lambda aggregates: aggregates.get_size_histogram(agg_filter),
+            lambda aggregates: aggregates.get_top_authors(agg_filter, limit=50),
+        )
 
         total_commits = kpi.commits
         denominator = total_commits if total_commits > 0 else 1
@@ -212,13 +229,21 @@ class AggregatedMetricsService:
         )
         agg_filter = self._build_filter(author_params)
 
-        # NOTE: AsyncSession does not allow concurrent operations.
-        kpi = await self._aggregates.get_kpis(agg_filter)
-        message_quality = await self._aggregates.get_message_quality(agg_filter)
-        size_stats = await self._aggregates.get_size_histogram(agg_filter)
-        daily_points = await self._aggregates.get_daily_commit_series(agg_filter)
-        hour_points = await self._aggregates.get_hourly_heatmap(agg_filter)
-        weekday_points = await self._aggregates.get_weekday_heatmap(agg_filter)
+        (
+            kpi,
+            message_quality,
+            size_stats,
+            daily_points,
+            hour_points,
+            weekday_points,
+        ) = await self._read_aggregates(
+            lambda aggregates: aggregates.get_kpis(agg_filter),
+            lambda aggregates: aggregates.get_message_quality(agg_filter),
+            lambda aggregates: aggregates.get_size_histogram(agg_filter),
+            lambda aggregates: aggregates.get_daily_commit_series(agg_filter),
+            lambda aggregates: aggregates.get_hourly_heatmap(agg_filter),
+            lambda aggregates: aggregates.get_weekday_heatmap(agg_filter),
+        )
 
         series = DashboardSeries(
             commits_daily=[CommitSeriesPoint(date=p.day, count=p.commits) for p in daily_points],
@@ -276,6 +301,73 @@ class AggregatedMetricsService:
         summary = await self.get_dashboard_summary(params=params, latest_limit=0)
         return summary.recommendations
 
+    async def _load_dashboard(
+        self,
+        agg_filter: AggregationFilter,
+        *,
+        top_authors_limit: int,
+        hot_files_limit: int,
+    ) -> DashboardAggregates:
+        if self._query_mode == "fused":
+            return await self._aggregates.get_dashboard(
+                agg_filter,
+                top_authors_limit=top_authors_limit,
+                hot_files_limit=hot_files_limit,
+            )
+
+        (
+            kpi,
+            message_quality,
+            size_stats,
+            daily,
+            hourly,
+            weekday,
+            top_authors,
+            hot_files,
+        ) = await self._read_aggregates(
+            lambda aggregates: aggregates.get_kpis(agg_filter),
+            lambda aggregates: aggregates.get_message_quality(agg_filter),
+            lambda aggregates: aggregates.get_size_histogram(agg_filter),
+            lambda aggregates: aggregates.get_daily_commit_series(agg_filter),
+            lambda aggregates: aggregates.get_hourly_heatmap(agg_filter),
+            lambda aggregates: aggregates.get_weekday_heatmap(agg_filter),
+            lambda aggregates: aggregates.get_top_authors(agg_filter, limit=top_authors_limit),
+            lambda aggregates: aggregates.get_hot_files(agg_filter, limit=hot_files_limit),
+        )
+        return DashboardAggregates(
+            kpi=kpi,
+            message_quality=message_quality,
+            size_stats=size_stats,
+            daily=daily,
+            hourly=hourly,
+            weekday=weekday,
+            top_authors=top_authors,
+            hot_files=hot_files,
+        )
+
+    async def _read_aggregates(self, *reads: _AggregateRead) -> list[Any]:
+        """
+        Run independent aggregate reads, returning their results in order.
+
+        In parallel mode every read gets a short-lived read-only session from
+        the engine pool and at most `read_concurrency` of them run at once, so
+        one request cannot take the whole pool. Otherwise they run one after
+        another on the request session, which does not allow concurrent operations.
+        """
+        if self._query_mode != "parallel" or self._read_sessions is None:
+            return [await read(self._aggregates) for read in reads]
+
+        read_sessions = self._read_sessions
+        slots = asyncio.Semaphore(self._read_concurrency)
+
+        async def run(read: _AggregateRead) -> Any:
+            async with slots:
+                async with read_sessions() as session:
+                    await session.connection(execution_options={"postgresql_readonly": True})
+                    return await read(AggregateMetricsInterface(session))
+
+        return list(await asyncio.gather(*(run(read) for read in reads)))
+
     @staticmethod
     def create_params(
         *,
@@ -356,7 +448,7 @@ class AggregatedMetricsService:
             is_merge=commit.is_merge_commit,
             added_lines=commit.added_lines,
             deleted_lines=commit.deleted_lines,
-            files_changed=len(commit.files),
+            files_changed=commit.files_changed,
         )
 
     def _to_person(self, entity, fallback_name: str | None, fallback_email: str | None) -> PersonRef:
@@ -1,3 +1,13 @@
-from .external_api import ExternalAPIClient
+from .external_api import (
+    ConditionalJSON,
+    ExternalAPIClient,
+    PoolStats,
+    TransferStats,
+    close_external_api_client,
+    get_external_api_client,
+    track_transfers,
+)
 from .exceptions import ExternalAPIError
+from .rate_limit import AdaptiveRateLimiter, RetryPolicy
 from .sync import SourceCodeSyncService
+from .sync_cadence import SyncCadence
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from database.relational_db import CommitDiffStats, CommitFilePayload
+from domain.parsing.schemas import CommitModel, DiffModel
+
+
+PIPELINE_END = object()
+
+
+@dataclass(slots=True)
+class StageFailure:
+    """Travels down the queues in place of a page when an upstream stage raised."""
+
+    error: Exception
+
+
+@dataclass(slots=True)
+class ParsedCommit:
+    model: CommitModel
+    diff: CommitDiffStats
+    files: list[CommitFilePayload]
+
+
+@dataclass(slots=True)
+class CommitPage:
+    index: int
+    commits: list[CommitModel]
+    next_cursor: str | None = None
+    diffs: list[DiffModel | None] = field(default_factory=list)
+    parsed: list[ParsedCommit] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class StageStats:
+    """
+    Per-stage counters of the commit pipeline.
+
+    `busy_seconds` is time spent doing the stage's own work, `starved_seconds` is
+    time waiting for the upstream stage and `blocked_seconds` is time waiting for
+    room in the downstream queue. The bottleneck is the stage that is busy while
+    the others are starved or blocked.
+    """
+
+    name: str
+    pages: int = 0
+    commits: int = 0
+    busy_seconds: float = 0.0
+    starved_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+
+    @property
+    def commits_per_second(self) -> float:
+        if not self.busy_seconds:
+            return 0.0
+        return self.commits / self.busy_seconds
+
+    @contextmanager
+    def busy(self, page: CommitPage) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.busy_seconds += time.perf_counter() - started
+            self.pages += 1
+            self.commits += len(page.commits)
+
+    async def take(self, queue: asyncio.Queue[Any]) -> Any:
+        started = time.perf_counter()
+        item = await queue.get()
+        self.starved_seconds += time.perf_counter() - started
+        return item
+
+    async def emit(self, queue: asyncio.Queue[Any], item: Any) -> None:
+        started = time.perf_counter()
+        await queue.put(item)
+        self.blocked_seconds += time.perf_counter() - started
+
+    def merge(self, other: StageStats) -> None:
+        self.pages += other.pages
+        self.commits += other.commits
+        self.busy_seconds += other.busy_seconds
+        self.starved_seconds += other.starved_seconds
+        self.blocked_seconds += other.blocked_seconds
+
+    def describe(self) -> str:
+        return (
+            f"{self.name}: {self.pages} pages/{self.commits} commits, "
+            f"busy {self.busy_seconds:.2f}s ({self.commits_per_second:.1f} commits/s), "
+            f"starved {self.starved_seconds:.2f}s, blocked {self.blocked_seconds:.2f}s"
+        )
+
+
+async def run_stage(
+    inbox: asyncio.Queue[Any],
+    outbox: asyncio.Queue[Any],
+    stats: StageStats,
+    handler: Callable[[CommitPage], Awaitable[None]],
+) -> None:
+    """Run `handler` on every page from `inbox` and pass it on; end and failure markers are forwarded."""
+    try:
+        while True:
+            item = await stats.take(inbox)
+            if item is PIPELINE_END or isinstance(item, StageFailure):
+                await outbox.put(item)
+                return
+
+            with stats.busy(item):
+                await handler(item)
+            await stats.emit(outbox, item)
+    except Exception as exc:
+        await outbox.put(StageFailure(exc))
@@ -1,119 +1,110 @@
 from __future__ import annotations
 
 import base64
+import binascii
+from collections.abc import Iterator
 
 from database.relational_db import CommitFilePayload
 
 
-def decode_diff_content(content: str | None) -> str:
+_FILE_HEADER = b"diff --git "
+_FILE_BOUNDARY = b"\n" + _FILE_HEADER
+
+
+def decode_diff_bytes(content: str | None) -> bytes:
     if not content:
-        return ""
+        return b""
 
     try:
-        decoded = base64.b64decode(content)
-    except (ValueError, TypeError):
-        return ""
-
-    return decoded.decode("utf-8", errors="replace")
+        return base64.b64decode(content)
+    except (binascii.Error, ValueError, TypeError):
+        return b""
 
 
-def parse_diff(diff_text: str) -> tuple[list[CommitFilePayload], int, int]:
-    if not diff_text:
+def parse_diff(diff: str | bytes) -> tuple[list[CommitFilePayload], int, int]:
+    if not diff:
         return [], 0, 0
 
-    files: list[CommitFilePayload] = []
-
-    class _FileBuffer:
-        __slots__ = (
-            "path",
-            "status",
-            "added",
-            "deleted",
-            "patch_lines",
-            "is_binary",
-        )
-
-        def __init__(self) -> None:
-            self.path = ""
-            self.status = "modified"
-            self.added = 0
-            self.deleted = 0
-            self.patch_lines: list[str] = []
-            self.is_binary = False
-
-        def finalize(self) -> CommitFilePayload | None:
-            if not self.patch_lines:
-                return None
-
-            path = self.path or _extract_path_from_diff_header(self.patch_lines[0]) or "unknown"
-            patch = "\n".join(self.patch_lines).strip()
-            return CommitFilePayload(
-                path=path,
-                status=self.status,
-                added_lines=self.added,
-                deleted_lines=self.deleted,
-                patch=patch,
-                is_binary=self.is_binary,
-            )
-
-    def flush(current: _FileBuffer | None) -> None:
-        if current is None:
-            return
-        payload = current.finalize()
-        if payload:
-            files.append(payload)
-
-    current: _FileBuffer | None = None
+    if isinstance(diff, str):
+        diff = diff.encode("utf-8", errors="replace")
 
-    for line in diff_text.splitlines():
-        if line.startswith("diff --git "):
-            flush(current)
-            current = _FileBuffer()
-            current.patch_lines.append(line)
-            path_hint = _extract_path_from_diff_header(line)
-            if path_hint:
-                current.path = path_hint
-            continue
+    files = list(iter_diff_files(diff))
+    total_added = sum(f.added_lines for f in files)
+    total_deleted = sum(f.deleted_lines for f in files)
+    return files, total_added, total_deleted
 
-        if current is None:
-            continue
 
-        current.patch_lines.append(line)
+def iter_diff_files(data: bytes) -> Iterator[CommitFilePayload]:
+    """
+    Yield one payload per `diff --git` section of a unified diff.
 
+    Sections are located and counted in place on the raw bytes; only the header
+    lines and each file's own patch are ever decoded, so memory stays bounded
+    by the largest single file rather than the whole commit.
+    """
+    if data.startswith(_FILE_HEADER):
+        start = 0
+    else:
+        start = data.find(_FILE_BOUNDARY)
+        if start < 0:
+            return
+        start += 1
+
+    while start >= 0:
+        end = data.find(_FILE_BOUNDARY, start)
+        next_start = end + 1 if end >= 0 else -1
+        if end < 0:
+            end = len(data)
+
+        yield _parse_file_section(data, start, end)
+        start = next_start
+
+
+def _parse_file_section(data: bytes, start: int, end: int) -> CommitFilePayload:
+    # Metadata only lives before the first hunk; hunk lines always carry a
+    # ' ', '+', '-' or '\' prefix and are never inspected one by one.
+    header_end = data.find(b"\n@@", start, end)
+    if header_end < 0:
+        header_end = end
+    header_lines = data[start:header_end].decode("utf-8", errors="replace").splitlines()
+
+    path = _extract_path_from_diff_header(header_lines[0]) or ""
+    status = "modified"
+    is_binary = False
+    for line in header_lines[1:]:
         if line.startswith("new file mode"):
-            current.status = "added"
+            status = "added"
         elif line.startswith("deleted file mode"):
-            current.status = "deleted"
+            status = "deleted"
         elif line.startswith("rename from"):
-            current.status = "renamed"
+            status = "renamed"
         elif line.startswith("rename to"):
-            current.path = line.partition("rename to")[2].strip()
-
-        if line.startswith("Binary files") or line.startswith("GIT binary patch"):
-            current.is_binary = True
-
-        if line.startswith("+++ "):
+            path = line.partition("rename to")[2].strip()
+        elif line.startswith("Binary files") or line.startswith("GIT binary patch"):
+            is_binary = True
+        elif line.startswith("+++ "):
             new_path = _normalize_path_fragment(line[4:].strip())
             if new_path and new_path != "/dev/null":
-                current.path = new_path
+                path = new_path
         elif line.startswith("--- "):
             old_path = _normalize_path_fragment(line[4:].strip())
-            if current.status == "deleted" and old_path:
-                current.path = old_path
-
-        if current.is_binary:
-            continue
-
-        if line.startswith("+") and not line.startswith("+++"):
-            current.added += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            current.deleted += 1
-
-    flush(current)
-
-    total_added = sum(f.added_lines for f in files)
-    total_deleted = sum(f.deleted_lines for f in files)
-    return files, total_added, total_deleted
+            if status == "deleted" and old_path:
+                path = old_path
+
+    added = deleted = 0
+    if not is_binary:
+        # Lines starting with '+'/'-', minus the '+++'/'---' file markers
+        added = data.count(b"\n+", start, end) - data.count(b"\n+++", start, end)
+        deleted = data.count(b"\n-", start, end) - data.count(b"\n---", start, end)
+
+    return CommitFilePayload(
+        path=path or "unknown",
+        status=status,
+        added_lines=added,
+        deleted_lines=deleted,
+        patch=data[start:end].decode("utf-8", errors="replace").strip(),
+        is_binary=is_binary,
+    )
 
 
 def _extract_path_from_diff_header(header: str) -> str | None:
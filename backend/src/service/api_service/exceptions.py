@@ -1,3 +1,15 @@
 class ExternalAPIError(RuntimeError):
     """Raised when the external API returns an unexpected response."""
 
+    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+        super().__init__(message)
+        # HTTP status of the final response, None for transport and decoding failures
+        self.status_code = status_code
+
+    @property
+    def is_permanent(self) -> bool:
+        """A client error that retrying the same request later will not fix."""
+        if self.status_code is None:
+            return False
+        return 400 <= self.status_code < 500 and self.status_code not in (401, 408, 429)
+
@@ -1,15 +1,88 @@
+import asyncio
+import importlib.util
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlparse, urlunparse
 
 import httpx
+import jwt
 
 from .exceptions import ExternalAPIError
+from .rate_limit import AdaptiveRateLimiter, RetryPolicy
 from core.config import config
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class PoolStats:
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    http2: bool
+    requests_total: int
+    retries_total: int
+    not_modified_total: int
+    in_flight: int
+    peak_in_flight: int
+    connections_open: int
+    connections_idle: int
+
+
+@dataclass(slots=True)
+class TransferStats:
+    requests: int = 0
+    retries: int = 0
+    bytes_downloaded: int = 0
+
+
+@dataclass(slots=True)
+class ConditionalJSON:
+    """Raw JSON body of a conditional GET; `modified` is False when it came from the validator cache."""
+
+    content: bytes
+    modified: bool
+
+
+@dataclass(slots=True)
+class _CachedListing:
+    etag: str | None
+    last_modified: str | None
+    content: bytes
+
+
+_transfer_stats: ContextVar[TransferStats | None] = ContextVar("external_api_transfer_stats", default=None)
+
+
+@contextmanager
+def track_transfers() -> Iterator[TransferStats]:
+    """
+    Count requests, retries and downloaded bytes made from the current context.
+
+    Tasks started inside the block inherit the context, so a shared client
+    still attributes traffic to the sync that caused it.
+    """
+    stats = TransferStats()
+    token = _transfer_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _transfer_stats.reset(token)
+
+
 class ExternalAPIClient:
+    """
+    Client for the Source Code API backed by one long-lived connection pool.
+
+    Close it with `aclose()` (or use it as an async context manager) once the
+    owning job or application shuts down.
+    """
+
     def __init__(
         self,
         base_url: str,
@@ -17,6 +90,11 @@ class ExternalAPIClient:
         timeout: httpx.Timeout | None = None,
         default_headers: dict[str, str] | None = None,
         auth_path: str = "/api/auth/login",
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        validator_cache_size: int | None = None,
     ) -> None:
         if not base_url:
             raise ValueError("External API base URL must be provided")
@@ -33,12 +111,100 @@ class ExternalAPIClient:
         self._password = config.API_PASSWORD.get_secret_value()
         self._token: str | None = None
         self._token_type: str = "Bearer"
+        # Monotonic time after which the token is renewed before use
+        self._token_refresh_at: float | None = None
+        self._token_refresh_margin = config.API_TOKEN_REFRESH_MARGIN
+        self._auth_lock = asyncio.Lock()
 
         parsed = urlparse(self._base_url)
         if not parsed.scheme or not parsed.netloc:
             raise ValueError("API URL must include scheme and hostname")
         self._auth_url = urlunparse((parsed.scheme, parsed.netloc, auth_path, "", "", ""))
 
+        self._limits = limits or httpx.Limits(
+            max_connections=config.API_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=config.API_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=config.API_POOL_KEEPALIVE_EXPIRY,
+        )
+        self._http2 = self._resolve_http2(config.API_HTTP2 if http2 is None else http2)
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=self._timeout,
+            limits=self._limits,
+            http2=self._http2,
+        )
+        self._requests_total = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._retries_total = 0
+        self._not_modified_total = 0
+
+        # URL -> validators and body of its last 200 response, least recently used first
+        self._validators: OrderedDict[str, _CachedListing] = OrderedDict()
+        self._validator_cache_size = (
+            config.API_VALIDATOR_CACHE_SIZE if validator_cache_size is None else validator_cache_size
+        )
+
+        self._retry_policy = retry_policy or RetryPolicy(
+            max_attempts=config.API_RETRY_MAX_ATTEMPTS,
+            base_delay=config.API_RETRY_BASE_DELAY,
+            max_delay=config.API_RETRY_MAX_DELAY,
+        )
+        self._rate_limiter = rate_limiter
+        if self._rate_limiter is None and config.API_RATE_LIMIT > 0:
+            self._rate_limiter = AdaptiveRateLimiter(
+                config.API_RATE_LIMIT,
+                min_rate=config.API_RATE_LIMIT_MIN,
+                max_rate=config.API_RATE_LIMIT_MAX,
+            )
+
+    async def __aenter__(self) -> "ExternalAPIClient":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        return self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close pooled connections. The client cannot be used afterwards."""
+        if not self._client.is_closed:
+            logger.debug("Closing external API client, pool stats: %s", self.pool_stats())
+            await self._client.aclose()
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter | None:
+        return self._rate_limiter
+
+    def pool_stats(self) -> PoolStats:
+        connections = []
+        pool = getattr(self._client._transport, "_pool", None)
+        if pool is not None:
+            connections = list(getattr(pool, "connections", []))
+
+        open_connections = [conn for conn in connections if not conn.is_closed()]
+        return PoolStats(
+            max_connections=self._limits.max_connections,
+            max_keepalive_connections=self._limits.max_keepalive_connections,
+            http2=self._http2,
+            requests_total=self._requests_total,
+            retries_total=self._retries_total,
+            not_modified_total=self._not_modified_total,
+            in_flight=self._in_flight,
+            peak_in_flight=self._peak_in_flight,
+            connections_open=len(open_connections),
+            connections_idle=sum(1 for conn in open_connections if conn.is_idle()),
+        )
+
+    @staticmethod
+    def _resolve_http2(requested: bool) -> bool:
+        if requested and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested for external API but 'h2' is not installed; using HTTP/1.1")
+            return False
+        return requested
+
     async def _request(
         self,
         method: str,
@@ -52,39 +218,104 @@ class ExternalAPIClient:
         if headers:
             request_headers.update(headers)
 
-        await self._apply_auth(request_headers)
-
-        async with httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
-        ) as client:
+        attempt = 0
+        while True:
+            used_token = await self._apply_auth(request_headers)
             try:
-                response = await client.request(
+                response = await self._send(
                     method,
                     url,
                     headers=request_headers,
                     **kwargs,
                 )
                 if response.status_code == 401 and self._should_authenticate():
-                    await self._authenticate(force=True)
-                    if self._token:
-                        request_headers["Authorization"] = f"{self._token_type} {self._token}"
-                    response = await client.request(
+                    token = await self._authenticate(force=True, stale_token=used_token)
+                    if token:
+                        request_headers["Authorization"] = f"{self._token_type} {token}"
+                    response = await self._send(
                         method,
                         url,
                         headers=request_headers,
                         **kwargs,
                     )
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                raise ExternalAPIError(
-                    f"{method} {exc.request.url} returned {exc.response.status_code}"
-                ) from exc
+            except httpx.TransportError as exc:
+                if not self._retry_policy.should_retry(attempt):
+                    raise ExternalAPIError(
+                        f"{method} {self._base_url}{url} failed: {exc}"
+                    ) from exc
+                await self._wait_before_retry(method, url, None, attempt, reason=str(exc))
+                attempt += 1
+                continue
             except httpx.HTTPError as exc:
                 raise ExternalAPIError(
                     f"{method} {self._base_url}{url} failed: {exc}"
                 ) from exc
 
+            if self._retry_policy.is_retryable(response) and self._retry_policy.should_retry(attempt):
+                await self._wait_before_retry(
+                    method, url, response, attempt, reason=f"status {response.status_code}",
+                )
+                attempt += 1
+                continue
+
+            break
+
+        if response.status_code == 304:
+            return response
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise ExternalAPIError(
+                f"{method} {exc.request.url} returned {exc.response.status_code}",
+                status_code=exc.response.status_code,
+            ) from exc
+
+        return response
+
+    async def _wait_before_retry(
+        self,
+        method: str,
+        url: str,
+        response: httpx.Response | None,
+        attempt: int,
+        *,
+        reason: str,
+    ) -> None:
+        delay = self._retry_policy.delay_for(response, attempt)
+        self._retries_total += 1
+        transfers = _transfer_stats.get()
+        if transfers is not None:
+            transfers.retries += 1
+        logger.warning(
+            "%s %s%s failed with %s, retry %d/%d in %.2fs",
+            method, self._base_url, url, reason,
+            attempt + 1, self._retry_policy.max_attempts - 1, delay,
+        )
+        await asyncio.sleep(delay)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        self._requests_total += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        finally:
+            self._in_flight -= 1
+
+        transfers = _transfer_stats.get()
+        if transfers is not None:
+            transfers.requests += 1
+            transfers.bytes_downloaded += response.num_bytes_downloaded
+
+        if self._rate_limiter is not None:
+            if response.status_code == 429:
+                self._rate_limiter.on_throttled(self._retry_policy.capped_retry_after(response))
+            elif response.status_code < 500:
+                self._rate_limiter.on_success()
         return response
 
     async def get_json(
@@ -104,6 +335,71 @@ class ExternalAPIClient:
         )
         return self._parse_json_response(response)
 
+    async def get_json_bytes(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bytes:
+        """Raw body of a JSON response, for callers that validate it straight from bytes."""
+        response = await self._request("GET", path, headers=headers, params=params)
+        self._ensure_json(response)
+        return response.content
+
+    async def get_json_bytes_if_modified(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> ConditionalJSON:
+        """
+        GET a slowly changing resource, revalidating the last response instead of downloading it again.
+
+        The ETag and Last-Modified of every 200 response are kept per URL and
+        sent back as `If-None-Match`/`If-Modified-Since`; on 304 the cached body
+        is returned with `modified=False`. Responses without validators are not
+        cached, so such URLs are always downloaded.
+        """
+        key = self._validator_key(path, params)
+        cached = self._validators.get(key)
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._request("GET", path, headers=headers, params=params)
+        if response.status_code == 304:
+            if cached is None:
+                raise ExternalAPIError(
+                    f"GET {response.request.url} returned 304 to an unconditional request"
+                )
+            self._not_modified_total += 1
+            self._validators.move_to_end(key)
+            return ConditionalJSON(cached.content, modified=False)
+
+        self._ensure_json(response)
+        content = response.content
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if self._validator_cache_size > 0 and (etag or last_modified):
+            self._validators[key] = _CachedListing(etag, last_modified, content)
+            self._validators.move_to_end(key)
+            while len(self._validators) > self._validator_cache_size:
+                self._validators.popitem(last=False)
+        else:
+            self._validators.pop(key, None)
+        return ConditionalJSON(content, modified=True)
+
+    def forget_validators(self, path: str, *, params: dict[str, Any] | None = None) -> None:
+        """Drop the cached response of `path`, e.g. when what was built from it was rolled back."""
+        self._validators.pop(self._validator_key(path, params), None)
+
+    def _validator_key(self, path: str, params: dict[str, Any] | None) -> str:
+        return str(httpx.URL(self._normalize_path(path), params=params))
+
     async def fetch_test_payload(self) -> str:
         response = await self._request("GET", "/health")
         return response.text
@@ -114,7 +410,7 @@ class ExternalAPIClient:
         return path if path.startswith("/") else f"/{path}"
 
     @staticmethod
-    def _parse_json_response(response: httpx.Response) -> dict[str, Any]:
+    def _ensure_json(response: httpx.Response) -> None:
         content_type = response.headers.get("content-type", "")
         if "application/json" not in content_type.lower():
             raise ExternalAPIError(
@@ -122,6 +418,9 @@ class ExternalAPIClient:
                 f"got {content_type or 'unknown content-type'}"
             )
 
+    @classmethod
+    def _parse_json_response(cls, response: httpx.Response) -> dict[str, Any]:
+        cls._ensure_json(response)
         try:
             data = response.json()
         except ValueError as exc:
@@ -139,41 +438,72 @@ class ExternalAPIClient:
     def _should_authenticate(self) -> bool:
         return bool(self._username and self._password)
 
-    async def _apply_auth(self, headers: dict[str, str]) -> None:
+    async def _apply_auth(self, headers: dict[str, str]) -> str | None:
         if not self._should_authenticate():
-            return
+            return None
 
-        await self._authenticate()
-        if self._token:
-            headers["Authorization"] = f"{self._token_type} {self._token}"
+        token = await self._authenticate()
+        if token:
+            headers["Authorization"] = f"{self._token_type} {token}"
+        return token
 
-    async def _authenticate(self, *, force: bool = False) -> None:
+    def _token_is_fresh(self) -> bool:
+        if not self._token:
+            return False
+        if self._token_refresh_at is None:
+            return True
+        return time.monotonic() < self._token_refresh_at
+
+    async def _authenticate(
+        self,
+        *,
+        force: bool = False,
+        stale_token: str | None = None,
+    ) -> str | None:
+        """
+        Returns a usable access token, logging in at most once at a time.
+
+        Concurrent callers wait on the same lock and reuse the token obtained by
+        whoever logged in first. With `force`, a new login happens only if the
+        current token is still the `stale_token` that was rejected.
+        """
         if not self._should_authenticate():
-            return
+            return None
 
-        if self._token and not force:
-            return
+        if not force and self._token_is_fresh():
+            return self._token
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            try:
-                response = await client.post(
-                    self._auth_url,
-                    json={
-                        "username": self._username,
-                        "password": self._password,
-                    },
-                    headers={
-                        "Accept": "application/json",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                raise ExternalAPIError(
-                    f"Authentication failed with status {exc.response.status_code}"
-                ) from exc
-            except httpx.HTTPError as exc:
-                raise ExternalAPIError(f"Authentication request failed: {exc}") from exc
+        async with self._auth_lock:
+            if force:
+                if self._token and self._token != stale_token:
+                    return self._token
+            elif self._token_is_fresh():
+                return self._token
+
+            await self._login()
+        return self._token
+
+    async def _login(self) -> None:
+        try:
+            response = await self._send(
+                "POST",
+                self._auth_url,
+                json={
+                    "username": self._username,
+                    "password": self._password,
+                },
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise ExternalAPIError(
+                f"Authentication failed with status {exc.response.status_code}"
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise ExternalAPIError(f"Authentication request failed: {exc}") from exc
 
         payload = response.json()
         token = payload.get("access_token")
@@ -182,3 +512,45 @@ class ExternalAPIClient:
 
         self._token = token
         self._token_type = payload.get("token_type", "Bearer")
+        lifetime = self._resolve_token_lifetime(token, payload.get("expires_in"))
+        if lifetime is None:
+            self._token_refresh_at = None
+        else:
+            # Short-lived tokens would otherwise be stale on arrival and
+            # every request would log in again
+            margin = min(self._token_refresh_margin, max(lifetime, 0.0) / 2)
+            self._token_refresh_at = time.monotonic() + lifetime - margin
+        logger.debug("Obtained external API access token")
+
+    @staticmethod
+    def _resolve_token_lifetime(token: str, expires_in: Any) -> float | None:
+        """Returns seconds the token stays valid using `expires_in` or the JWT `exp` claim."""
+        lifetime: float | None = None
+        if isinstance(expires_in, (int, float)) and expires_in > 0:
+            lifetime = float(expires_in)
+        else:
+            try:
+                claims = jwt.decode(token, options={"verify_signature": False})
+            except jwt.PyJWTError:
+                return None
+            exp = claims.get("exp")
+            if isinstance(exp, (int, float)):
+                lifetime = exp - time.time()
+        return lifetime
+
+_shared_client: ExternalAPIClient | None = None
+
+
+def get_external_api_client() -> ExternalAPIClient:
+    """Returns process-wide client so request handlers share one connection pool"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = ExternalAPIClient(config.API_URL)
+    return _shared_client
+
+
+async def close_external_api_client() -> None:
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
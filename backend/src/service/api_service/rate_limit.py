@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter; `Retry-After` wins when the server sends it."""
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 120.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+
+    def should_retry(self, attempt: int) -> bool:
+        return attempt + 1 < self.max_attempts
+
+    def is_retryable(self, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def delay_for(self, response: httpx.Response | None, attempt: int) -> float:
+        retry_after = self.capped_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+    def capped_retry_after(self, response: httpx.Response) -> float | None:
+        """`Retry-After` bounded by `max_retry_after`, so a bogus header cannot stall the client."""
+        retry_after = self.retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> float | None:
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        return max((moment - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+@dataclass(slots=True)
+class RateLimiterStats:
+    rate: float
+    throttled: int
+    waited_seconds: float
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose refill rate follows AIMD.
+
+    Every successful response adds `increase_step / rate` requests per second, so
+    the rate grows by about `increase_step` each second of clean traffic. A 429
+    multiplies the rate by `decrease_factor` (at most once per `cooldown`, so a
+    burst of throttled in-flight requests counts as one signal) and pauses the
+    bucket for the server's `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        min_rate: float = 1.0,
+        max_rate: float = 100.0,
+        burst: float | None = None,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self._min_rate = min_rate
+        self._max_rate = max(max_rate, min_rate)
+        self._rate = min(max(rate, self._min_rate), self._max_rate)
+        self._burst = burst
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._cooldown = cooldown
+
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = asyncio.Lock()
+
+        self._throttled = 0
+        self._waited = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def _capacity(self) -> float:
+        return self._burst if self._burst is not None else max(self._rate, 1.0)
+
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(
+            rate=round(self._rate, 2),
+            throttled=self._throttled,
+            waited_seconds=round(self._waited, 3),
+        )
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await self._sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await self._sleep((1 - self._tokens) / self._rate)
+
+    def on_success(self) -> None:
+        self._rate = min(self._max_rate, self._rate + self._increase_step / self._rate)
+
+    def on_throttled(self, retry_after: float | None = None) -> None:
+        now = time.monotonic()
+        self._throttled += 1
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        previous = self._rate
+        self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+        self._tokens = min(self._tokens, self._capacity)
+        logger.info(
+            "External API throttled, lowering request rate %.2f -> %.2f req/s",
+            previous, self._rate,
+        )
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+    async def _sleep(self, seconds: float) -> None:
+        self._waited += seconds
+        await asyncio.sleep(seconds)
@@ -1,43 +1,88 @@
+import asyncio
 import logging
+import time
+from collections.abc import Collection
 from datetime import UTC, date, datetime, timedelta
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import TypeAdapter, ValidationError
 
 from database.relational_db import (
+    AggregateAccumulator,
     AggregateMetricsInterface,
+    Author,
     AuthorInterface,
-    AuthorRepoDayDelta,
     BranchInterface,
+    CommitDiffStats,
     CommitFileInterface,
+    CommitFilePayload,
     CommitInterface,
-    FileRepoDayDelta,
-    HourRepoDayDelta,
+    CommitUpsert,
     Project,
     ProjectInterface,
     Repository,
     RepositoryInterface,
     SizeBucket,
-    SizeBucketDelta,
+    SyncState,
+    SyncStateInterface,
     UoW,
+    normalize_email,
 )
 from domain.parsing.schemas import (
     BranchModel,
     CommitModel,
     DiffModel,
+    GitUser,
     ProjectModel,
     RepositoryModel,
     APIListResponse,
     APIResponse
 )
-
-from .diff_parser import decode_diff_content, parse_diff
-from .external_api import ExternalAPIClient
+from domain.sync import RepositorySyncReport
+
+from .commit_pipeline import (
+    PIPELINE_END,
+    CommitPage,
+    ParsedCommit,
+    StageFailure,
+    StageStats,
+    run_stage,
+)
+from .diff_parser import decode_diff_bytes, iter_diff_files
+from .external_api import ConditionalJSON, ExternalAPIClient, track_transfers
 from .exceptions import ExternalAPIError
+from .sync_cadence import SyncCadence
+from .sync_report import SyncMeter
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Built once per process: validating raw bytes through these skips both the
+# intermediate dict tree of `response.json()` and the per-call lookup of the
+# parametrised envelope types
+_PROJECT_LIST = TypeAdapter(APIListResponse[ProjectModel])
+_REPOSITORY_LIST = TypeAdapter(APIListResponse[RepositoryModel])
+_BRANCH_LIST = TypeAdapter(APIListResponse[BranchModel])
+_COMMIT_PAGE = TypeAdapter(APIListResponse[CommitModel])
+_DIFF = TypeAdapter(APIResponse[DiffModel | None])
+
+
+def _validate_json(adapter: TypeAdapter[T], content: bytes, path: str) -> T:
+    try:
+        return adapter.validate_json(content)
+    except ValidationError as exc:
+        # Malformed JSON is a transport problem, like it was with `response.json()`
+        if any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise ExternalAPIError(f"Failed to decode JSON from {path}") from exc
+        raise
+
 
 class SourceCodeSyncService:
     SHORT_MESSAGE_THRESHOLD = 50
+    PIPELINE_STAGES = ("fetch_pages", "fetch_diffs", "parse", "persist")
 
     def __init__(
         self,
@@ -48,6 +93,11 @@ class SourceCodeSyncService:
         commit_window_days: int = 365*1,
         max_commit_pages: int = 100,
         resync_overlap_seconds: int = 60,
+        diff_concurrency: int = 8,
+        pipeline_depth: int = 2,
+        checkpoint_pages: int = 10,
+        aggregate_flush_keys: int = 5000,
+        cadence: SyncCadence | None = None,
     ) -> None:
         self._client = client
         self._uow = uow
@@ -57,6 +107,14 @@ class SourceCodeSyncService:
         )
         self._max_commit_pages = max_commit_pages
         self._resync_overlap = timedelta(seconds=resync_overlap_seconds)
+        self._diff_concurrency = max(diff_concurrency, 1)
+        # Pages each pipeline queue may hold before the producing stage waits.
+        self._pipeline_depth = max(pipeline_depth, 1)
+        self._pipeline_stats = {name: StageStats(name) for name in self.PIPELINE_STAGES}
+        self._checkpoint_pages = max(checkpoint_pages, 1)
+        self._aggregate_flush_keys = aggregate_flush_keys
+        # When set, every completed run schedules the repository's next incremental run
+        self._cadence = cadence
 
         session = uow.session
         self._projects = ProjectInterface(session)
@@ -66,160 +124,399 @@ class SourceCodeSyncService:
         self._commits = CommitInterface(session)
         self._commit_files = CommitFileInterface(session)
         self._aggregates = AggregateMetricsInterface(session)
-
-    async def sync_all(self) -> None:
-        projects = await self._fetch_projects()
+        self._sync_state = SyncStateInterface(session)
+        # Normalized email -> Author, shared by every page of this sync run.
+        self._author_map: dict[str, Author] = {}
+        self._reports: list[RepositorySyncReport] = []
+        # Listings downloaded since the last commit; their validators are dropped
+        # on rollback so the next sync does not take a 304 for rows never stored
+        self._fresh_listings: list[str] = []
+
+    async def discover_repositories(self, project_keys: Collection[str] | None = None) -> None:
+        """
+        Upsert projects and repositories without syncing commits.
+
+        Newly seen repositories get a sync state with no next run, which makes
+        them due for their first sync right away.
+        """
+        projects, projects_modified = await self._fetch_projects(project_keys)
         for project_model in projects:
             try:
-                project = await self._projects.upsert_from_model(project_model)
-                await self._sync_project(project, project_model)
+                project = await self._project_from_listing(project_model, projects_modified)
+                repositories, modified = await self._fetch_repositories(project_model.name)
+                if not modified:
+                    # Same repositories as last time, all of them stored already
+                    await self._uow.commit()
+                    continue
+                for repo_model in repositories:
+                    repository = await self._repositories.upsert_from_model(project, repo_model)
+                    # Assigns the id of a new repository
+                    await self._uow.session.flush()
+                    await self._sync_state.get_or_create(repository.id)
                 await self._uow.commit()
+                self._fresh_listings.clear()
             except ExternalAPIError as exc:
-                logger.error("Failed to sync project %s: %s", project_model.name, exc)
+                logger.error("Failed to discover repositories of %s: %s", project_model.name, exc)
+                await self._discard_uncheckpointed()
             except Exception:
-                logger.exception("Unexpected error while syncing project %s", project_model.name)
-
-    async def _sync_project(self, project: Project, model: ProjectModel) -> None:
-        logger.info("Syncing project %s (%s)", model.name, project.id)
-        repositories = await self._fetch_repositories(model.name)
-        for repo_model in repositories:
-            repository = await self._repositories.upsert_from_model(project, repo_model)
-            await self._sync_repository(model.name, repository, repo_model)
-
-    async def _sync_repository(
-        self,
-        project_key: str,
-        repository: Repository,
-        model: RepositoryModel,
-    ) -> None:
-        logger.info("Syncing repository %s/%s", project_key, model.key)
-        branches = await self._fetch_branches(project_key, model.key)
-        for branch in branches:
-            branch.is_default = branch.name == (model.default_branch or "")
-        await self._branches.sync_from_models(repository, branches)
-
-        await self._sync_commits(project_key, model.key, repository)
+                logger.exception("Unexpected error while discovering repositories of %s", project_model.name)
+                await self._discard_uncheckpointed()
+
+    async def _discard_uncheckpointed(self) -> None:
+        """Roll back to the last checkpoint so a failed project does not leak partial pages."""
+        await self._uow.rollback()
+        self._author_map.clear()
+        self._forget_fresh_listings()
+
+    def _forget_fresh_listings(self) -> None:
+        for path in self._fresh_listings:
+            self._client.forget_validators(path)
+        self._fresh_listings.clear()
+
+    async def _project_from_listing(self, model: ProjectModel, modified: bool) -> Project:
+        """Upsert a listed project, or only load it when the listing is unchanged since the last sync."""
+        if not modified:
+            project = await self._projects.get_for_sync(model.name)
+            if project is not None:
+                return project
+        return await self._projects.upsert_from_model(model)
+
+    async def sync_repository(self, project_key: str, repository: Repository) -> None:
+        """Sync branches and new commits of a known repository, committing as it goes."""
+        logger.info("Syncing repository %s/%s", project_key, repository.name)
+        meter = SyncMeter()
+        with track_transfers() as transfers:
+            try:
+                branches, modified = await self._fetch_branches(project_key, repository.name)
+                if modified:
+                    for branch in branches:
+                        branch.is_default = branch.name == (repository.default_branch or "")
+                    await self._branches.sync_from_models(repository, branches)
+                else:
+                    # The default branch comes from the repository listing and may still have moved
+                    await self._branches.mark_default(repository.id, repository.default_branch)
+
+                await self._sync_commits(project_key, repository.name, repository, meter)
+            except Exception as exc:
+                self._forget_fresh_listings()
+                self._aggregates.discard_project_days()
+                self._reports.append(
+                    meter.report(repository.id, project_key, repository.name, transfers, exc)
+                )
+                raise
+
+        report = meter.report(repository.id, project_key, repository.name, transfers)
+        self._reports.append(report)
+        logger.info(
+            "Synced %s/%s: %d commits in %d pages, %.1f commits/s, %d requests, %d retries, %d bytes; steps %s",
+            project_key, repository.name, report.commits, report.pages, report.commits_per_second,
+            report.requests, report.retries, report.bytes_downloaded, report.step_seconds,
+        )
 
     async def _sync_commits(
         self,
         project_key: str,
         repository_name: str,
         repository: Repository,
+        meter: SyncMeter,
     ) -> None:
-        after_iso: str | None = None
-        
-        latest_created = await self._commits.get_latest_created_at(repository.id)
-        if latest_created is not None:
-            anchor = latest_created - self._resync_overlap
-            after_iso = anchor.isoformat()
-        elif self._commit_window is not None:
-            anchor = datetime.now(UTC) - self._commit_window
-            after_iso = anchor.isoformat()
-
-        cursor: str | None = None
-        page = 0
-        author_deltas: list[AuthorRepoDayDelta] = []
-        hour_deltas: list[HourRepoDayDelta] = []
-        size_deltas: list[SizeBucketDelta] = []
-        file_deltas: list[FileRepoDayDelta] = []
-        while True:
-            logger.debug(
-                "Fetching commits for %s/%s page=%d cursor=%s after=%s",
-                project_key, repository_name, page, cursor, after_iso,
-            )
-            commits, cursor = await self._fetch_commits(
-                project_key, repository_name, cursor=cursor, after=after_iso,
-            )
-            logger.debug(
-                "Fetched %d commits for %s/%s page=%d next_cursor=%s",
-                len(commits), project_key, repository_name, page, cursor,
+        state = await self._sync_state.get_or_create(repository.id)
+        if state.cursor:
+            logger.info(
+                "Resuming commit sync for %s/%s at page %d",
+                project_key, repository_name, state.pages,
             )
+            after = state.cursor_after
+        else:
+            after = await self._resolve_commit_anchor(repository, state)
+            self._sync_state.start_run(state, after)
+        after_iso = after.isoformat() if after is not None else None
+
+        stages = {name: StageStats(name) for name in self.PIPELINE_STAGES}
+        pages: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._pipeline_depth)
+        fetched: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._pipeline_depth)
+        parsed: asyncio.Queue[Any] = asyncio.Queue(maxsize=self._pipeline_depth)
+
+        async def fetch_diffs(page: CommitPage) -> None:
+            page.diffs = await self._fetch_diffs(project_key, repository_name, page.commits)
 
-            if not commits:
-                break
+        async def parse(page: CommitPage) -> None:
+            page.parsed = await asyncio.to_thread(self._parse_page, page, meter)
 
-            for commit_model in commits:
-                await self._store_commit(
+        tasks = [
+            asyncio.create_task(
+                self._produce_commit_pages(
                     project_key,
                     repository_name,
-                    repository,
-                    commit_model,
-                    author_deltas,
-                    hour_deltas,
-                    size_deltas,
-                    file_deltas,
-                )
-
-            page += 1
-            if not cursor:
-                break
-            if self._max_commit_pages and page >= self._max_commit_pages:
-                logger.info(
-                    "Stopping commit fetch for %s/%s after %d pages (cap reached)",
-                    project_key, repository_name, self._max_commit_pages,
+                    after_iso,
+                    state.cursor,
+                    state.pages,
+                    pages,
+                    stages["fetch_pages"],
                 )
-                break
+            ),
+            asyncio.create_task(run_stage(pages, fetched, stages["fetch_diffs"], fetch_diffs)),
+            asyncio.create_task(run_stage(fetched, parsed, stages["parse"], parse)),
+        ]
+
+        aggregates = AggregateAccumulator(self._aggregate_flush_keys)
+        persist = stages["persist"]
+        pending_pages = 0
+        try:
+            while True:
+                item = await persist.take(parsed)
+                if item is PIPELINE_END:
+                    break
+                if isinstance(item, StageFailure):
+                    raise item.error
+
+                with persist.busy(item):
+                    with meter.time("upsert"):
+                        await self._store_page(repository, item.parsed, aggregates)
+                        self._sync_state.record_page(
+                            state,
+                            next_cursor=item.next_cursor,
+                            page_number=item.index + 1,
+                            commits=len(item.commits),
+                            newest=max(commit.created_at for commit in item.commits),
+                        )
+                    meter.pages += 1
+                    meter.commits += len(item.commits)
+                    pending_pages += 1
+                    if pending_pages >= self._checkpoint_pages:
+                        await self._checkpoint(aggregates, meter)
+                        pending_pages = 0
+                    elif aggregates.should_flush:
+                        with meter.time("aggregate_flush"):
+                            await aggregates.flush(self._aggregates)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            meter.add("fetch_pages", stages["fetch_pages"].busy_seconds)
+            meter.add("fetch_diffs", stages["fetch_diffs"].busy_seconds)
+
+        self._sync_state.complete_run(state)
+        await self._checkpoint(aggregates, meter)
+        if self._cadence is not None:
+            await self._schedule_next_run(repository, self._cadence)
+
+        logger.info(
+            "Commit pipeline for %s/%s: %s",
+            project_key, repository_name,
+            "; ".join(stats.describe() for stats in stages.values()),
+        )
+        for name, stats in stages.items():
+            self._pipeline_stats[name].merge(stats)
 
-        await self._flush_aggregate_deltas(
-            author_deltas,
-            hour_deltas,
-            size_deltas,
-            file_deltas,
+    async def _resolve_commit_anchor(
+        self,
+        repository: Repository,
+        state: SyncState,
+    ) -> datetime | None:
+        # Upserts make the overlap idempotent; it picks up commits pushed late or
+        # stamped just before the watermark by a skewed clock. This also covers
+        # the watermarks seeded from max(created_at) by the sync_state migration.
+        if state.watermark is not None:
+            return state.watermark - self._resync_overlap
+
+        # No completed run recorded yet: fall back to the stored history
+        latest_created = await self._commits.get_latest_created_at(repository.id)
+        if latest_created is not None:
+            return latest_created - self._resync_overlap
+        if self._commit_window is not None:
+            return datetime.now(UTC) - self._commit_window
+        return None
+
+    async def _schedule_next_run(self, repository: Repository, cadence: SyncCadence) -> None:
+        # Runs after the final checkpoint so the activity count includes this run
+        recent = await self._aggregates.count_repo_commits_since(
+            repository.id, cadence.activity_since()
+        )
+        interval = cadence.interval_for(recent)
+        await self._sync_state.schedule_next(
+            repository.id,
+            interval,
+            cadence.next_run_at(interval),
+            push_due_at=cadence.push_due_at(),
         )
+        await self._uow.commit()
+
+    async def _checkpoint(self, aggregates: AggregateAccumulator, meter: SyncMeter) -> None:
+        """Flush aggregates and commit them together with the stored pages and sync state."""
+        with meter.time("aggregate_flush"):
+            await aggregates.flush(self._aggregates)
+            await self._aggregates.flush_project_days()
+        with meter.time("commit"):
+            await self._uow.commit()
+
+    def pipeline_stats(self) -> list[StageStats]:
+        """Stage counters summed over every repository synced by this service."""
+        return list(self._pipeline_stats.values())
+
+    def reports(self) -> list[RepositorySyncReport]:
+        """One report per repository synced by this service, failed ones included."""
+        return list(self._reports)
 
-    async def _store_commit(
+    async def _produce_commit_pages(
         self,
         project_key: str,
         repository_name: str,
-        repository: Repository,
-        commit_model: CommitModel,
-        author_deltas: list[AuthorRepoDayDelta],
-        hour_deltas: list[HourRepoDayDelta],
-        size_deltas: list[SizeBucketDelta],
-        file_deltas: list[FileRepoDayDelta],
+        after_iso: str | None,
+        cursor: str | None,
+        page: int,
+        outbox: asyncio.Queue[Any],
+        stats: StageStats,
     ) -> None:
-        author = await self._authors.get_or_create(commit_model.author)
-        await self._authors.touch_commit_window(author, commit_model.created_at)
+        """First pipeline stage: walk the commit cursor and queue pages ahead of the consumers."""
+        resumed = cursor is not None
+        try:
+            while True:
+                logger.debug(
+                    "Fetching commits for %s/%s page=%d cursor=%s after=%s",
+                    project_key, repository_name, page, cursor, after_iso,
+                )
+                started = time.perf_counter()
+                try:
+                    commits, cursor = await self._fetch_commits(
+                        project_key, repository_name, cursor=cursor, after=after_iso,
+                    )
+                except ExternalAPIError as exc:
+                    if not resumed:
+                        raise
+                    # A stored cursor may have expired upstream; redo the run's window instead
+                    logger.warning(
+                        "Stored cursor for %s/%s was rejected (%s); restarting from the first page",
+                        project_key, repository_name, exc,
+                    )
+                    resumed = False
+                    cursor, page = None, 0
+                    continue
+                finally:
+                    stats.busy_seconds += time.perf_counter() - started
+                resumed = False
+                logger.debug(
+                    "Fetched %d commits for %s/%s page=%d next_cursor=%s",
+                    len(commits), project_key, repository_name, page, cursor,
+                )
 
-        committer = await self._authors.get_or_create(commit_model.committer)
-        await self._authors.touch_commit_window(committer, commit_model.created_at)
+                if not commits:
+                    break
 
-        commit, created = await self._commits.upsert_from_model(
-            repository, commit_model, author, committer,
-        )
+                stats.pages += 1
+                stats.commits += len(commits)
+                await stats.emit(
+                    outbox, CommitPage(index=page, commits=commits, next_cursor=cursor),
+                )
 
-        try:
-            diff = await self._fetch_diff(project_key, repository_name, commit_model.sha)
-        except ExternalAPIError as exc:
-            logger.warning(
-                "Failed to fetch diff for %s/%s@%s: %s",
-                project_key, repository_name, commit_model.sha, exc,
+                page += 1
+                if not cursor:
+                    break
+                if self._max_commit_pages and page >= self._max_commit_pages:
+                    logger.info(
+                        "Stopping commit fetch for %s/%s after %d pages (cap reached)",
+                        project_key, repository_name, self._max_commit_pages,
+                    )
+                    break
+        except Exception as exc:
+            await outbox.put(StageFailure(exc))
+        else:
+            await outbox.put(PIPELINE_END)
+
+    @staticmethod
+    def _parse_page(page: CommitPage, meter: SyncMeter) -> list[ParsedCommit]:
+        parsed: list[ParsedCommit] = []
+        for commit_model, diff in zip(page.commits, page.diffs):
+            with meter.time("decode"):
+                raw_diff = decode_diff_bytes(diff.content if diff else None)
+            files: list[CommitFilePayload] = []
+            added = deleted = 0
+            sections = iter_diff_files(raw_diff)
+            while True:
+                with meter.time("parse_diff"):
+                    file_payload = next(sections, None)
+                if file_payload is None:
+                    break
+                # Compress here, in the parse worker thread, rather than on the event loop.
+                # Only the blob is persisted, so the text is let go as soon as it is
+                # encoded and one file's patch is held uncompressed at a time.
+                with meter.time("compress"):
+                    file_payload.encoded_patch()
+                file_payload.patch = ""
+                added += file_payload.added_lines
+                deleted += file_payload.deleted_lines
+                files.append(file_payload)
+            parsed.append(
+                ParsedCommit(
+                    commit_model,
+                    CommitDiffStats(
+                        added_lines=added,
+                        deleted_lines=deleted,
+                        files_changed=len(files),
+                    ),
+                    files,
+                )
             )
-            diff = None
-
-        diff_text = decode_diff_content(diff.content if diff else None)
-        files, added, deleted = parse_diff(diff_text)
-        files_changed = len(files)
-        await self._commit_files.replace_for_commit(commit_model.sha, files)
-        await self._commits.apply_diff_stats(
-            commit,
-            diff_content=diff_text,
-            added_lines=added,
-            deleted_lines=deleted,
-            files_changed=files_changed,
+        return parsed
+
+    async def _store_page(
+        self,
+        repository: Repository,
+        page: list[ParsedCommit],
+        aggregates: AggregateAccumulator,
+    ) -> None:
+        await self._authors.resolve_many(
+            (user for item in page for user in (item.model.author, item.model.committer)),
+            self._author_map,
         )
 
-        if not created:
-            return
+        upserts: list[CommitUpsert] = []
+        windows: dict[UUID, tuple[datetime, datetime]] = {}
+        for item in page:
+            commit_model = item.model
+            author = self._lookup_author(commit_model.author)
+            committer = self._lookup_author(commit_model.committer)
+            for person in (author, committer):
+                if person is None:
+                    continue
+                first_at, last_at = windows.get(person.id, (commit_model.created_at, commit_model.created_at))
+                windows[person.id] = (
+                    min(first_at, commit_model.created_at),
+                    max(last_at, commit_model.created_at),
+                )
+            upserts.append(CommitUpsert(commit_model, author, committer, item.diff))
+
+        await self._authors.extend_commit_windows(windows)
+        created = await self._commits.upsert_many(repository, upserts)
+
+        await self._commit_files.replace_for_commits(
+            {item.model.sha: item.files for item in page}
+        )
 
-        timestamp = commit.committed_at or commit.created_at
-        if timestamp is None:
-            logger.debug("Skipping aggregates for commit %s: missing timestamp", commit.sha)
-            return
+        for upsert, item in zip(upserts, page):
+            if item.model.sha not in created:
+                continue
+            self._collect_deltas(
+                repository,
+                upsert,
+                item.files,
+                item.diff.added_lines,
+                item.diff.deleted_lines,
+                aggregates,
+            )
 
-        day, hour = self._extract_day_and_hour(timestamp)
-        churn = added + deleted
-        message = commit.message or ""
+    def _collect_deltas(
+        self,
+        repository: Repository,
+        item: CommitUpsert,
+        files: list[CommitFilePayload],
+        added: int,
+        deleted: int,
+        aggregates: AggregateAccumulator,
+    ) -> None:
+        commit_model = item.model
+        day, hour = self._extract_day_and_hour(commit_model.created_at)
+        message = (commit_model.message or "").strip()
         message_length = len(message)
         short_flag = 1 if message_length < self.SHORT_MESSAGE_THRESHOLD else 0
 
@@ -227,80 +524,42 @@ class SourceCodeSyncService:
         repo_id = repository.id
 
         author_id = None
-        if author is not None:
-            author_id = author.id
-        elif committer is not None:
-            author_id = committer.id
+        if item.author is not None:
+            author_id = item.author.id
+        elif item.committer is not None:
+            author_id = item.committer.id
 
         if author_id is not None:
-            author_deltas.append(
-                AuthorRepoDayDelta(
-                    day=day,
-                    project_id=project_id,
-                    repo_id=repo_id,
-                    author_id=author_id,
-                    commits=1,
-                    lines_added=added,
-                    lines_deleted=deleted,
-                    files_changed=files_changed,
-                    msg_total_len=message_length,
-                    msg_short_count=short_flag,
-                )
-            )
-        else:
-            logger.debug("Skipping author aggregate for commit %s: missing author", commit.sha)
-
-        hour_deltas.append(
-            HourRepoDayDelta(
-                day=day,
-                project_id=project_id,
-                repo_id=repo_id,
-                hour=hour,
-                commits=1,
+            aggregates.add_author(
+                day,
+                project_id,
+                repo_id,
+                author_id,
                 lines_added=added,
                 lines_deleted=deleted,
+                files_changed=len(files),
+                msg_total_len=message_length,
+                msg_short_count=short_flag,
             )
-        )
-
-        size_deltas.append(
-            SizeBucketDelta(
-                day=day,
-                project_id=project_id,
-                repo_id=repo_id,
-                bucket=self._map_size_bucket(churn),
-                cnt=1,
-            )
-        )
+        else:
+            logger.debug("Skipping author aggregate for commit %s: missing author", commit_model.sha)
 
+        aggregates.add_hour(day, project_id, repo_id, hour, lines_added=added, lines_deleted=deleted)
+        aggregates.add_size(day, project_id, repo_id, self._map_size_bucket(added + deleted))
         for file_payload in files:
-            file_deltas.append(
-                FileRepoDayDelta(
-                    day=day,
-                    project_id=project_id,
-                    repo_id=repo_id,
-                    path=file_payload.path,
-                    commits_touch=1,
-                    lines_added=file_payload.added_lines,
-                    lines_deleted=file_payload.deleted_lines,
-                    churn=file_payload.added_lines + file_payload.deleted_lines,
-                )
+            aggregates.add_file(
+                day,
+                project_id,
+                repo_id,
+                file_payload.path,
+                lines_added=file_payload.added_lines,
+                lines_deleted=file_payload.deleted_lines,
             )
 
-    async def _flush_aggregate_deltas(
-        self,
-        author_deltas: list[AuthorRepoDayDelta],
-        hour_deltas: list[HourRepoDayDelta],
-        size_deltas: list[SizeBucketDelta],
-        file_deltas: list[FileRepoDayDelta],
-    ) -> None:
-        if author_deltas:
-            await self._aggregates.upsert_author_repo_day(author_deltas)
-        if hour_deltas:
-            await self._aggregates.upsert_hour_repo_day(hour_deltas)
-        if size_deltas:
-            await self._aggregates.upsert_size_buckets(size_deltas)
-        if file_deltas:
-            await self._aggregates.upsert_hot_files(file_deltas)
+    def _lookup_author(self, user: GitUser | None) -> Author | None:
+        if user is None or not user.email:
+            return None
+        return self._author_map.get(normalize_email(user.email))
 
     @staticmethod
     def _extract_day_and_hour(timestamp: datetime) -> tuple[date, int]:
@@ -319,26 +578,38 @@ class SourceCodeSyncService:
             return SizeBucket.FIFTY_ONE_HUNDRED
         return SizeBucket.HUNDRED_PLUS
 
-    async def _fetch_projects(self) -> list[ProjectModel]:
-        payload = await self._client.get_json("/projects")
-        response = APIListResponse[ProjectModel].model_validate(payload)
-        return response.data
+    async def _fetch_listing(self, path: str) -> ConditionalJSON:
+        listing = await self._client.get_json_bytes_if_modified(path)
+        if listing.modified:
+            self._fresh_listings.append(path)
+        return listing
 
-    async def _fetch_repositories(self, project_key: str) -> list[RepositoryModel]:
-        payload = await self._client.get_json(f"/projects/{project_key}/repos")
-        response = APIListResponse[RepositoryModel].model_validate(payload)
-        return response.data
+    async def _fetch_projects(
+        self,
+        project_keys: Collection[str] | None = None,
+    ) -> tuple[list[ProjectModel], bool]:
+        """Listed projects, and whether the listing changed since it was last fetched."""
+        listing = await self._fetch_listing("/projects")
+        response = _validate_json(_PROJECT_LIST, listing.content, "/projects")
+        if project_keys is None:
+            return response.data, listing.modified
+        return [project for project in response.data if project.name in project_keys], listing.modified
+
+    async def _fetch_repositories(self, project_key: str) -> tuple[list[RepositoryModel], bool]:
+        path = f"/projects/{project_key}/repos"
+        listing = await self._fetch_listing(path)
+        response = _validate_json(_REPOSITORY_LIST, listing.content, path)
+        return response.data, listing.modified
 
     async def _fetch_branches(
         self,
         project_key: str,
         repo_name: str,
-    ) -> list[BranchModel]:
-        payload = await self._client.get_json(
-            f"/projects/{project_key}/repos/{repo_name}/branches"
-        )
-        response = APIListResponse[BranchModel].model_validate(payload)
-        return response.data
+    ) -> tuple[list[BranchModel], bool]:
+        path = f"/projects/{project_key}/repos/{repo_name}/branches"
+        listing = await self._fetch_listing(path)
+        response = _validate_json(_BRANCH_LIST, listing.content, path)
+        return response.data, listing.modified
 
     async def _fetch_commits(
         self,
@@ -354,25 +625,63 @@ class SourceCodeSyncService:
         if after:
             params["after"] = after
 
-        payload = await self._client.get_json(
-            f"/projects/{project_key}/repos/{repo_name}/commits",
-            params=params,
-        )
-        response = APIListResponse[CommitModel].model_validate(payload)
+        path = f"/projects/{project_key}/repos/{repo_name}/commits"
+        content = await self._client.get_json_bytes(path, params=params)
+        response = _validate_json(_COMMIT_PAGE, content, path)
         next_cursor = response.page.next_cursor if response.page else None
         return response.data, next_cursor
 
+    async def _fetch_diffs(
+        self,
+        project_key: str,
+        repo_name: str,
+        commits: list[CommitModel],
+    ) -> list[DiffModel | None]:
+        """
+        Fetch page diffs concurrently; results keep commit order.
+
+        A diff still failing after the client's retries fails the whole page.
+        Storing the commit without it would leave it out of the aggregates for
+        good, since later runs start past it, so the run stops before the page
+        is checkpointed and the next one fetches it again. A diff the API
+        refuses for good (403, 404, 410, ...) would stop every run at the same
+        page, so its commit is stored without file stats instead.
+        """
+        semaphore = asyncio.Semaphore(self._diff_concurrency)
+
+        async def fetch(sha: str) -> DiffModel | ExternalAPIError | None:
+            async with semaphore:
+                try:
+                    return await self._fetch_diff(project_key, repo_name, sha)
+                except ExternalAPIError as exc:
+                    return exc
+
+        results = await asyncio.gather(*(fetch(commit.sha) for commit in commits))
+        diffs: list[DiffModel | None] = []
+        for commit, result in zip(commits, results):
+            if isinstance(result, ExternalAPIError):
+                if not result.is_permanent:
+                    raise ExternalAPIError(
+                        f"Diff of {project_key}/{repo_name}@{commit.sha} is unavailable: {result}"
+                    ) from result
+                logger.warning(
+                    "Diff of %s/%s@%s is not available (%s); storing the commit without file stats",
+                    project_key, repo_name, commit.sha, result,
+                )
+                result = None
+            diffs.append(result)
+        return diffs
+
     async def _fetch_diff(
         self,
         project_key: str,
         repo_name: str,
         sha: str,
     ) -> DiffModel | None:
-        payload = await self._client.get_json(
-            f"/projects/{project_key}/repos/{repo_name}/commits/{sha}/diff",
-            params={"binary": False},
-        )
-        if not payload.get("data"):
+        path = f"/projects/{project_key}/repos/{repo_name}/commits/{sha}/diff"
+        content = await self._client.get_json_bytes(path, params={"binary": False})
+        response = _validate_json(_DIFF, content, path)
+        # An empty `data` object means there is no diff, as does a null one
+        if response.data is None or not response.data.model_fields_set:
             return None
-        response = APIResponse[DiffModel].model_validate(payload)
         return response.data
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+
+@dataclass(frozen=True, slots=True)
+class SyncCadence:
+    """
+    Polling interval of a repository derived from its recent commit activity.
+
+    A repository is polled about once per commit it received on average over
+    the last `activity_window_days`, clamped to `[min_interval, max_interval]`:
+    hundreds of commits a day poll every few minutes, no recent commits poll
+    once a day. Each next run is shifted by up to `jitter` of the interval so
+    repositories synced together do not stay in lockstep. A push event makes
+    the repository due after `push_debounce`, which is how long a burst of
+    pushes has to coalesce into a single run.
+    """
+
+    min_interval: timedelta = timedelta(minutes=5)
+    max_interval: timedelta = timedelta(days=1)
+    activity_window_days: int = 14
+    jitter: float = 0.1
+    push_debounce: timedelta = timedelta(seconds=15)
+
+    def activity_since(self, now: datetime | None = None) -> date:
+        now = now or datetime.now(UTC)
+        return (now - timedelta(days=self.activity_window_days)).date()
+
+    def interval_for(self, recent_commits: int) -> timedelta:
+        if recent_commits <= 0:
+            return self.max_interval
+        interval = timedelta(days=self.activity_window_days) / recent_commits
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def next_run_at(self, interval: timedelta, now: datetime | None = None) -> datetime:
+        now = now or datetime.now(UTC)
+        spread = interval.total_seconds() * self.jitter
+        return now + interval + timedelta(seconds=random.uniform(-spread, spread))
+
+    def retry_at(self, now: datetime | None = None) -> datetime:
+        """Next attempt after a failed run, so a broken repository does not hot-loop."""
+        return self.next_run_at(self.min_interval, now)
+
+    def push_due_at(self, now: datetime | None = None) -> datetime:
+        return (now or datetime.now(UTC)) + self.push_debounce
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID
+
+from domain.sync import RepositorySyncReport
+
+from .external_api import TransferStats
+
+
+@dataclass(slots=True)
+class SyncMeter:
+    """
+    Counters of one repository sync, turned into a `RepositorySyncReport` at the end.
+
+    Steps are timed where they run, including the parse worker thread; only
+    one stage touches a given step, so the thread never races the event loop.
+    """
+
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    pages: int = 0
+    commits: int = 0
+    step_seconds: dict[str, float] = field(default_factory=dict)
+
+    @contextmanager
+    def time(self, step: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(step, time.perf_counter() - started)
+
+    def add(self, step: str, seconds: float) -> None:
+        self.step_seconds[step] = self.step_seconds.get(step, 0.0) + seconds
+
+    def report(
+        self,
+        repo_id: UUID,
+        project_key: str,
+        repository_name: str,
+        transfers: TransferStats,
+        error: Exception | None = None,
+    ) -> RepositorySyncReport:
+        finished_at = datetime.now(UTC)
+        message = None
+        if error is not None:
+            message = str(error) or type(error).__name__
+        elapsed = (finished_at - self.started_at).total_seconds()
+        return RepositorySyncReport(
+            repo_id=repo_id,
+            project_key=project_key,
+            repository_name=repository_name,
+            status="failed" if error is not None else "completed",
+            error=message,
+            started_at=self.started_at,
+            finished_at=finished_at,
+            pages=self.pages,
+            commits=self.commits,
+            commits_per_second=self.commits / elapsed if elapsed > 0 else 0.0,
+            requests=transfers.requests,
+            retries=transfers.retries,
+            bytes_downloaded=transfers.bytes_downloaded,
+            step_seconds={step: round(seconds, 3) for step, seconds in self.step_seconds.items()},
+        )
@@ -139,8 +139,6 @@ class EntityService:
             commit.committer_email,
         )
 
-        files_changed = len(commit.files)
-
         return CommitOut(
             sha=commit.sha,
             repo=repo_ref,
@@ -151,7 +149,7 @@ class EntityService:
             is_merge=commit.is_merge_commit,
             added_lines=commit.added_lines,
             deleted_lines=commit.deleted_lines,
-            files_changed=files_changed,
+            files_changed=commit.files_changed,
         )
 
     @staticmethod
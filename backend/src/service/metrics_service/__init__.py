@@ -8,12 +8,10 @@ from database.relational_db import (
     UoW,
     get_uow,
 )
-from core.config import config
 from fastapi import Depends
 
-from ..api_service.external_api import ExternalAPIClient
+from ..api_service.external_api import get_external_api_client
 from .service import MetricsService
-from ..api_service.external_api import ExternalAPIClient
 
 
 async def get_metrics_service(
@@ -21,6 +19,6 @@ async def get_metrics_service(
     # redis = Depends(get_redis),
 ) -> MetricsService:
     session = uow.session
-    api_client=ExternalAPIClient(config.API_URL)
+    api_client = get_external_api_client()
     
     return MetricsService(api_client=api_client)
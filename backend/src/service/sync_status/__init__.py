@@ -0,0 +1,20 @@
+from fastapi import Depends
+
+from database.redis import SyncReportRepo, get_redis
+from database.relational_db import (
+    SyncStateInterface,
+    UoW,
+    get_uow,
+)
+
+from .service import SyncStatusService
+
+
+async def get_sync_status_service(
+    uow: UoW = Depends(get_uow),
+    redis = Depends(get_redis),
+) -> SyncStatusService:
+    return SyncStatusService(uow, SyncStateInterface(uow.session), SyncReportRepo(redis))
+
+
+__all__ = ["SyncStatusService", "get_sync_status_service"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from database.redis import SyncReportRepo
+from database.relational_db import SyncStateInterface, UoW
+from domain.sync import RepositorySyncReport, RepositorySyncSchedule, SyncRunReport
+
+
+class SyncStatusService:
+    def __init__(self, uow: UoW, sync_state: SyncStateInterface, reports: SyncReportRepo):
+        self._uow = uow
+        self._sync_state = sync_state
+        self._reports = reports
+
+    async def list_schedule(
+        self,
+        *,
+        due_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[RepositorySyncSchedule]:
+        rows = await self._sync_state.list_schedule(due_before=due_before, limit=limit)
+        return [
+            RepositorySyncSchedule(
+                repo_id=row.repo_id,
+                project_id=row.project_id,
+                project_key=row.project_key,
+                repository_name=row.repository_name,
+                next_run_at=row.next_run_at,
+                poll_interval_seconds=row.poll_interval_seconds,
+                last_completed_at=row.last_completed_at,
+                in_progress=row.in_progress,
+            )
+            for row in rows
+        ]
+
+    async def latest_run_report(self) -> SyncRunReport | None:
+        payload = await self._reports.latest_run()
+        if payload is None:
+            return None
+        return SyncRunReport.model_validate_json(payload)
+
+    async def repository_report(self, repo_id: UUID) -> RepositorySyncReport | None:
+        payload = await self._reports.repository(repo_id)
+        if payload is None:
+            return None
+        return RepositorySyncReport.model_validate_json(payload)
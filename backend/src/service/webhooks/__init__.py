@@ -0,0 +1,18 @@
+from fastapi import Depends
+
+from database.relational_db import (
+    SyncStateInterface,
+    UoW,
+    get_uow,
+)
+
+from .service import WebhookService
+
+
+async def get_webhook_service(
+    uow: UoW = Depends(get_uow),
+) -> WebhookService:
+    return WebhookService(uow, SyncStateInterface(uow.session))
+
+
+__all__ = ["WebhookService", "get_webhook_service"]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+from datetime import UTC, datetime, timedelta
+
+from core.config import config
+from database.relational_db import SyncStateInterface, UoW
+from domain.webhooks import PushEvent, PushEventAccepted
+
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookService:
+    SIGNATURE_PREFIX = "sha256="
+
+    def __init__(self, uow: UoW, sync_state: SyncStateInterface):
+        self._uow = uow
+        self._sync_state = sync_state
+
+    @classmethod
+    def verify_signature(cls, body: bytes, signature: str | None) -> bool:
+        """Check a `sha256=<hex>` HMAC of the raw body against the shared secret."""
+        if not config.WEBHOOK_SECRET or not signature:
+            return False
+        if not signature.startswith(cls.SIGNATURE_PREFIX):
+            return False
+
+        expected = hmac.new(
+            config.WEBHOOK_SECRET.encode(),
+            body,
+            hashlib.sha256,
+        ).hexdigest()
+        return hmac.compare_digest(expected, signature[len(cls.SIGNATURE_PREFIX):])
+
+    async def queue_push(self, event: PushEvent) -> PushEventAccepted:
+        """
+        Make the pushed repository due for an incremental sync.
+
+        The run is picked up by the scheduler after the push debounce window,
+        so every push of a burst lands in the same run.
+        """
+        due_at = datetime.now(UTC) + timedelta(seconds=config.SYNC_PUSH_DEBOUNCE_SECONDS)
+        request = await self._sync_state.request_push_sync(
+            event.project, event.repository, due_at=due_at,
+        )
+        if request is None:
+            logger.info(
+                "Ignoring push for unknown repository %s/%s",
+                event.project, event.repository,
+            )
+            return PushEventAccepted(queued=False, branch=event.branch)
+
+        await self._uow.commit()
+        logger.info(
+            "Queued sync of %s/%s (branch %s) at %s%s",
+            event.project, event.repository, event.branch,
+            request.next_run_at.isoformat(),
+            ", coalesced" if request.coalesced else "",
+        )
+        return PushEventAccepted(
+            queued=True,
+            coalesced=request.coalesced,
+            repo_id=request.repo_id,
+            branch=event.branch,
+            next_run_at=request.next_run_at,
+        )
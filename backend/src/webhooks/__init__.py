@@ -2,7 +2,10 @@ from fastapi import APIRouter
 
 
 def get_webhooks() -> APIRouter:
+    from .push import router as push_router
     
     webhooks = APIRouter(prefix='/webhooks', tags=['Webhooks'])
+
+    webhooks.include_router(push_router)
     
     return webhooks
@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from pydantic import ValidationError
+
+from domain.webhooks import PushEvent, PushEventAccepted
+from service.webhooks import WebhookService, get_webhook_service
+
+router = APIRouter()
+
+
+@router.post(
+    path='/push',
+    response_model=PushEventAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary='Queue an incremental sync of a pushed repository',
+)
+async def push_event(
+    request: Request,
+    svc: Annotated[WebhookService, Depends(get_webhook_service)],
+    signature: Annotated[str | None, Header(alias='X-Hub-Signature-256')] = None,
+):
+    # Signature covers the exact bytes sent, so read them before parsing
+    body = await request.body()
+    if not svc.verify_signature(body, signature):
+        raise HTTPException(status_code=401, detail='Invalid webhook signature')
+
+    try:
+        event = PushEvent.model_validate_json(body)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors(include_url=False))
+
+    return await svc.queue_push(event)